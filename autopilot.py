@@ -0,0 +1,278 @@
+"""
+autopilot.py
+Pilote automatique : un bot qui joue à la place du joueur.
+
+Le bot se dirige vers l'arrivée du plateau et fait un détour par un
+monstre ou un équipement quand le gain attendu dépasse le coût du détour.
+
+Les distances viennent de "champs de distance" calculés une fois par plateau
+(un par cible, plus un pour l'arrivée) : coût minimal de chaque case jusqu'à
+la cible, la traversée d'un monstre non visé coûtant ses PV perdus en moyenne.
+Un champ est l'heuristique exacte d'A* : le chemin optimal s'obtient sans
+recherche, en allant à chaque pas vers le voisin qui fait baisser le champ.
+Un monstre vaincu ou une arme ramassée ne peut que faire baisser les coûts :
+les champs sont alors corrigés localement (propagation à la Dijkstra).
+
+Utilisation :
+    autopilot = Autopilot.for_board(engine.board)
+    action = autopilot(engine.observe())
+"""
+from __future__ import annotations
+import heapq
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from engine import Observation
+from models import WeaponType
+from settings import (
+    GRID_SIZE, HERO_DAMAGE, MONSTER_HP, MONSTER_DAMAGE, MONSTER_DEFENSE,
+    POINTS_PER_MONSTER, POINTS_PER_HP, POTION_HEAL, PlayerAction
+)
+
+_DIRECTIONS = (
+    (PlayerAction.MOVE_UP, 0, -1), (PlayerAction.MOVE_DOWN, 0, 1),
+    (PlayerAction.MOVE_LEFT, -1, 0), (PlayerAction.MOVE_RIGHT, 1, 0)
+)
+_HITS_NEEDED = -(-MONSTER_HP // HERO_DAMAGE)  # Coups réussis pour vaincre un monstre
+# Un équipement est une potion ou une arme avec la même probabilité (Board.generate_equipments)
+_AVERAGE_WEAPON_BONUS = sum(weapon_type.force_bonus for weapon_type in WeaponType) / len(WeaponType)
+
+
+@lru_cache(maxsize=None)
+def _neighbour_table(size: int) -> Tuple[Tuple[Tuple[PlayerAction, int], ...], ...]:
+    """Pour chaque case (index y * size + x) : les déplacements possibles et la case d'arrivée"""
+    table = []
+    for cell in range(size * size):
+        y, x = divmod(cell, size)
+        table.append(tuple(
+            (action, (y + dy) * size + (x + dx))
+            for action, dx, dy in _DIRECTIONS
+            if 0 <= x + dx < size and 0 <= y + dy < size
+        ))
+    return tuple(table)
+
+
+def hit_probability(force: int) -> float:
+    """Probabilité exacte qu'un coup touche (même règle que Hero.attack)"""
+    hit_chance = min(95, max(5, force / MONSTER_DEFENSE * 100))
+    return (101 - max(math.ceil(100 - hit_chance), 1)) / 100
+
+
+def fight_cost(force: int) -> float:
+    """Points perdus en moyenne (PV perdus) pour vaincre un monstre"""
+    probability = hit_probability(force)
+    return POINTS_PER_HP * MONSTER_DAMAGE * _HITS_NEEDED * (1 - probability) / probability
+
+
+def survival_probability(force: int, hp: int) -> float:
+    """Probabilité de vaincre un monstre avant de mourir (loi binomiale négative)"""
+    probability = hit_probability(force)
+    misses_allowed = -(-hp // MONSTER_DAMAGE)  # Ce nombre de coups ratés est mortel
+    return sum(
+        math.comb(_HITS_NEEDED - 1 + misses, misses) * probability ** _HITS_NEEDED * (1 - probability) ** misses
+        for misses in range(misses_allowed)
+    )
+
+
+class Autopilot:
+    """Bot qui choisit une action à partir d'une Observation (se recale seul sur chaque nouveau plateau)"""
+
+    def __init__(self, size: int = GRID_SIZE, end_position: Optional[Tuple[int, int]] = None):
+        self.size = size
+        self._neighbours = _neighbour_table(size)
+        # Arrivée dans le coin opposé au départ par défaut (comme Board et ChunkedBoard)
+        end_x, end_y = end_position if end_position is not None else (size - 1, size - 1)
+        self._goal = end_y * size + end_x
+        self._monsters = frozenset()    # Cases des monstres restants
+        self._equipments = frozenset()  # Cases des équipements restants
+        self._force: Optional[int] = None
+        self._costs: List[float] = []          # Coût pour entrer sur chaque case
+        self._fields: Dict[int, List[float]] = {}  # Case cible -> champ de distance (arrivée comprise)
+
+    @classmethod
+    def for_board(cls, board) -> 'Autopilot':
+        """Bot réglé sur la taille et l'arrivée d'un plateau (board.size, board.end_position)"""
+        return cls(board.size, board.end_position)
+
+    def __call__(self, observation: Observation) -> PlayerAction:
+        """Retourne l'action à jouer"""
+        self._sync(observation)
+        here = self._cell(observation.position)
+        monster_value = self._monster_value(observation)
+
+        if observation.in_combat:
+            # Continuer le combat tant qu'il rapporte plus qu'une fuite
+            if monster_value >= -1:
+                return PlayerAction.ATTACK
+            return self._step_towards(self._goal, here, monster_value, avoid=here)
+
+        # Meilleur détour : gain de la cible - déplacements supplémentaires, en regardant
+        # aussi le meilleur détour suivant (sinon le bot néglige les cibles en chaîne)
+        goal_field = self._fields[self._goal]
+        equipment_value = self._equipment_value(observation)
+        # (cible, champ, valeur de la cible - distance de la cible à l'arrivée)
+        targets = [
+            (target, field, (monster_value if target in self._monsters else equipment_value) - goal_field[target])
+            for target, field in self._fields.items() if target != self._goal
+        ]
+        best_target, best_gain = self._goal, 0.0
+        for target, field, net_value in targets:
+            # Meilleur second détour depuis la cible (0 = aller directement à l'arrivée)
+            follow_up = -goal_field[target]
+            for next_target, next_field, next_net_value in targets:
+                if next_target != target and next_net_value - next_field[target] > follow_up:
+                    follow_up = next_net_value - next_field[target]
+            # Détour ici -> target (-> next_target) -> arrivée, comparé au trajet direct
+            gain = net_value - field[here] + goal_field[here] + follow_up + goal_field[target]
+            if gain > best_gain:
+                best_target, best_gain = target, gain
+        return self._step_towards(best_target, here, monster_value)
+
+    # --- Évaluation ---
+
+    def _monster_value(self, observation: Observation) -> float:
+        """Gain espéré d'un combat (une mort fait perdre tout le score actuel)"""
+        survival = survival_probability(observation.force, observation.hp)
+        gain = POINTS_PER_MONSTER - fight_cost(observation.force)
+        return survival * gain - (1 - survival) * max(observation.score, 0)
+
+    def _equipment_value(self, observation: Observation) -> float:
+        """Gain espéré d'un équipement (potion ou arme, indiscernables sur la carte)"""
+        potion = POINTS_PER_HP * min(POTION_HEAL, observation.max_hp - observation.hp)
+        weapon = len(self._monsters) * max(
+            0.0, fight_cost(observation.force) - fight_cost(observation.force + _AVERAGE_WEAPON_BONUS))
+        return (potion + weapon) / 2
+
+    def _step_towards(self, target: int, here: int, monster_value: float,
+                      avoid: Optional[int] = None) -> PlayerAction:
+        """Premier pas du chemin optimal vers la cible (descente du champ de distance)"""
+        field = self._fields[target]
+        costs = self._costs
+        best_action, best_cost = None, math.inf
+        for action, cell in self._neighbours[here]:
+            if cell == avoid:
+                continue
+            cost = (1.0 if cell == target else costs[cell]) + field[cell]
+            if monster_value < 0 and cell in self._monsters and cell != target:
+                cost -= monster_value  # Combat trop risqué avec les PV actuels : évité si possible
+            if cost < best_cost:
+                best_action, best_cost = action, cost
+        return best_action or PlayerAction.ATTACK
+
+    # --- Champs de distance ---
+
+    def _cell(self, position: Tuple[int, int]) -> int:
+        """Index d'une position (x, y)"""
+        return position[1] * self.size + position[0]
+
+    def _sync(self, observation: Observation) -> None:
+        """Met à jour les champs d'après l'observation (reconstruits si le plateau a changé)"""
+        monsters = frozenset(self._cell(position) for position in observation.monsters)
+        equipments = frozenset(self._cell(position) for position in observation.equipments)
+        if (not monsters <= self._monsters or not equipments <= self._equipments
+                or self._force is None or observation.force < self._force):
+            self._rebuild(monsters, equipments, observation.force)
+            return
+
+        lowered = set()
+        for cell in self._monsters - monsters:  # Monstres vaincus
+            self._fields.pop(cell, None)  # Un monstre mobile peut occuper la case d'un équipement
+            self._costs[cell] = 1.0
+            lowered.add(cell)
+        for cell in self._equipments - equipments:  # Équipements ramassés
+            self._fields.pop(cell, None)
+        if observation.force != self._force:  # Nouvelle arme : combats moins coûteux
+            monster_cost = 1.0 + fight_cost(observation.force)
+            for cell in monsters:
+                self._costs[cell] = monster_cost
+            lowered |= monsters
+        self._monsters, self._equipments, self._force = monsters, equipments, observation.force
+        if lowered:
+            for target, field in self._fields.items():
+                self._lower(target, field, lowered)
+
+    def _rebuild(self, monsters: frozenset, equipments: frozenset, force: int) -> None:
+        """Calcule tous les champs d'un nouveau plateau"""
+        self._monsters, self._equipments, self._force = monsters, equipments, force
+        self._costs = [1.0] * (self.size * self.size)
+        monster_cost = 1.0 + fight_cost(force)
+        for cell in monsters:
+            self._costs[cell] = monster_cost
+        self._fields = {}
+        for target in (self._goal, *monsters, *equipments):
+            field = [math.inf] * (self.size * self.size)
+            field[target] = 0.0
+            self._fields[target] = field
+            self._propagate(target, field, [(0.0, target)])
+
+    def _lower(self, target: int, field: List[float], cells) -> None:
+        """Corrige un champ après la baisse du coût d'entrée de certaines cases"""
+        heap = []
+        for cell in cells:
+            step = (1.0 if cell == target else self._costs[cell]) + field[cell]
+            for _, neighbour in self._neighbours[cell]:
+                if step < field[neighbour]:
+                    field[neighbour] = step
+                    heap.append((step, neighbour))
+        heapq.heapify(heap)
+        self._propagate(target, field, heap)
+
+    def _propagate(self, target: int, field: List[float], heap: list) -> None:
+        """Dijkstra inversé : distance de chaque case jusqu'à la cible"""
+        costs = self._costs
+        neighbours = self._neighbours
+        while heap:
+            distance, cell = heapq.heappop(heap)
+            if distance > field[cell]:
+                continue
+            step = distance + (1.0 if cell == target else costs[cell])
+            for _, neighbour in neighbours[cell]:
+                if step < field[neighbour]:
+                    field[neighbour] = step
+                    heapq.heappush(heap, (step, neighbour))
+
+
+_autopilot: Optional[Autopilot] = None
+
+
+def autopilot_policy(observation: Observation) -> PlayerAction:
+    """Politique utilisable par simulator.py (un Autopilot par processus)"""
+    global _autopilot
+    if _autopilot is None:
+        _autopilot = Autopilot()
+    return _autopilot(observation)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from engine import GameEngine
+    from simulator import SimulationStats, direct_policy, play_game
+
+    nb_games = 5000
+    for name, policy in (("direct", direct_policy), ("autopilot", autopilot_policy)):
+        random.seed(0)
+        engine = GameEngine()
+        stats = SimulationStats()
+        start_time = time.perf_counter()
+        for game in range(nb_games):
+            if game:
+                engine.reset()
+            play_game(engine, policy)
+            hero = engine.hero
+            stats.record(hero.score, engine.won, hero.is_dead(), hero.monsters_defeated, hero.move_count)
+        elapsed = time.perf_counter() - start_time
+        print(f"{name:>9} : score moyen {stats.avg_score:.2f} | victoires {stats.win_rate:.1%}"
+              f" | {nb_games / elapsed:.0f} parties/s")
+
+    # Coût d'une décision sur un plateau déjà analysé
+    engine = GameEngine()
+    autopilot = Autopilot()
+    observation = engine.observe()
+    autopilot(observation)
+    nb_decisions = 100_000
+    start_time = time.perf_counter()
+    for _ in range(nb_decisions):
+        autopilot(observation)
+    elapsed = time.perf_counter() - start_time
+    print(f"Décision : {elapsed / nb_decisions * 1e6:.1f} µs")
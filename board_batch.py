@@ -0,0 +1,110 @@
+"""
+FICHIER OPTIONNEL - PAS INDISPENSABLE (nécessite numpy : pip install numpy)
+
+board_batch.py
+Génération vectorisée (NumPy) de milliers de plateaux en une seule fois.
+
+Les positions sont tirées directement dans l'espace des indices
+(index = x * size + y, cases départ/arrivée exclues) sans construire
+la liste de toutes les cases, comme Board._unique_valid_positions_generator.
+"""
+from __future__ import annotations
+from typing import NamedTuple
+import numpy as np
+from models import Board, Monster, Potion, Weapon, WeaponType
+from settings import (
+    GRID_SIZE, START_POSITION, END_POSITION,
+    NB_MONSTERS, NB_EQUIPMENTS_MIN, NB_EQUIPMENTS_MAX
+)
+
+# Ordre fixe des types d'armes (les tableaux stockent un indice dans ce tuple)
+WEAPON_TYPES = tuple(WeaponType)
+
+
+class BoardLayouts(NamedTuple):
+    """Dispositions d'un lot de plateaux (première dimension = numéro du plateau)"""
+    monsters: np.ndarray       # (B, NB_MONSTERS, 2) positions (x, y)
+    equipments: np.ndarray     # (B, NB_EQUIPMENTS_MAX, 2) positions, -1 si emplacement inutilisé
+    nb_equipments: np.ndarray  # (B,) nombre d'équipements réellement placés
+    is_potion: np.ndarray      # (B, NB_EQUIPMENTS_MAX) True = potion, False = arme
+    weapon_types: np.ndarray   # (B, NB_EQUIPMENTS_MAX) indice dans WEAPON_TYPES
+
+
+def sample_unique_indexes(nb_boards: int, k: int, nb_valid: int, rng) -> np.ndarray:
+    """Tire k indices distincts dans [0, nb_valid) pour chaque plateau (ordre aléatoire)"""
+    if k > nb_valid:
+        raise ValueError(f"Impossible de placer {k} entités sur {nb_valid} cases")
+    if k == 0:
+        return np.zeros((nb_boards, 0), dtype=np.int64)
+
+    if k * k <= nb_valid:
+        # Grande grille : tirage avec remise, on ne retire que les lignes avec collision
+        indexes = rng.integers(0, nb_valid, size=(nb_boards, k))
+        redraw = np.arange(nb_boards)
+        while redraw.size:
+            sorted_rows = np.sort(indexes[redraw], axis=1)
+            has_duplicate = (sorted_rows[:, 1:] == sorted_rows[:, :-1]).any(axis=1)
+            redraw = redraw[has_duplicate]
+            indexes[redraw] = rng.integers(0, nb_valid, size=(redraw.size, k))
+        return indexes
+
+    # Petite grille (collisions fréquentes) : k plus petites clés aléatoires par ligne
+    keys = rng.random((nb_boards, nb_valid))
+    indexes = np.argpartition(keys, k - 1, axis=1)[:, :k]
+    return rng.permuted(indexes, axis=1)
+
+
+def generate_layouts(nb_boards: int, size: int = GRID_SIZE, rng=None) -> BoardLayouts:
+    """Génère nb_boards dispositions de plateau selon les règles de Board"""
+    rng = np.random.default_rng(rng)
+    forbidden_indexes = sorted({
+        x * size + y for x, y in (START_POSITION, END_POSITION)
+        if 0 <= x < size and 0 <= y < size
+    })
+    nb_valid = size * size - len(forbidden_indexes)
+
+    indexes = sample_unique_indexes(nb_boards, NB_MONSTERS + NB_EQUIPMENTS_MAX, nb_valid, rng)
+    # Décaler les indices pour sauter les cases interdites
+    for forbidden_index in forbidden_indexes:
+        indexes += indexes >= forbidden_index
+    positions = np.stack(np.divmod(indexes, size), axis=-1)  # (x, y)
+
+    nb_equipments = rng.integers(NB_EQUIPMENTS_MIN, NB_EQUIPMENTS_MAX + 1, size=nb_boards)
+    equipments = positions[:, NB_MONSTERS:].copy()
+    equipments[np.arange(NB_EQUIPMENTS_MAX) >= nb_equipments[:, None]] = -1
+
+    return BoardLayouts(
+        monsters=positions[:, :NB_MONSTERS],
+        equipments=equipments,
+        nb_equipments=nb_equipments,
+        is_potion=rng.random((nb_boards, NB_EQUIPMENTS_MAX)) < 0.5,  # 50% potion, 50% arme
+        weapon_types=rng.integers(0, len(WEAPON_TYPES), size=(nb_boards, NB_EQUIPMENTS_MAX))
+    )
+
+
+def to_board(layouts: BoardLayouts, index: int) -> Board:
+    """Construit le Board correspondant à une disposition du lot"""
+    board = Board(generate=False)
+    for x, y in layouts.monsters[index].tolist():
+        board.add_monster(Monster((x, y)))
+    for slot in range(int(layouts.nb_equipments[index])):
+        position = tuple(layouts.equipments[index, slot].tolist())
+        if layouts.is_potion[index, slot]:
+            board.add_equipment(Potion(position))
+        else:
+            board.add_equipment(Weapon(position, WEAPON_TYPES[layouts.weapon_types[index, slot]]))
+    return board
+
+
+if __name__ == "__main__":
+    import time
+
+    start_time = time.perf_counter()
+    layouts = generate_layouts(100_000, rng=0)
+    elapsed = time.perf_counter() - start_time
+    print(f"100000 plateaux {GRID_SIZE}x{GRID_SIZE} générés en {elapsed:.3f}s")
+
+    start_time = time.perf_counter()
+    layouts = generate_layouts(100_000, size=10_000, rng=0)
+    elapsed = time.perf_counter() - start_time
+    print(f"100000 plateaux 10000x10000 générés en {elapsed:.3f}s")
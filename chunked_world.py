@@ -0,0 +1,353 @@
+"""
+chunked_world.py
+Monde immense généré à la demande, morceau par morceau.
+
+Le monde (WORLD_SIZE x WORLD_SIZE cases) est découpé en morceaux (chunks) de
+WORLD_CHUNK_SIZE x WORLD_CHUNK_SIZE cases. Un morceau n'est généré que
+lorsqu'on regarde une case à WORLD_LOAD_RADIUS morceaux ou moins (le moteur
+regarde la case du héros à chaque déplacement). Son contenu ne dépend que de
+(graine du monde, coordonnées du morceau) : un morceau oublié puis régénéré
+est identique.
+Au plus WORLD_MAX_CHUNKS morceaux restent en mémoire (cache LRU). D'un morceau
+oublié, on ne garde que ses écarts à la génération (positions des monstres
+vaincus et des équipements ramassés, PV des monstres blessés, entités ajoutées) :
+il est régénéré puis corrigé pour revenir dans le même état.
+Ces écarts ne comptent pas dans WORLD_MAX_CHUNKS : ils ne peuvent pas être
+oubliés sans changer le monde, et leur taille dépend du nombre d'entités que le
+héros a réellement modifiées (quelques-unes par action au plus), pas du nombre
+de morceaux traversés.
+
+Les snapshots du moteur (GameEngine.snapshot/restore) capturent le monde par
+world_state() : graine, paramètres et écarts de tous les morceaux modifiés
+(en mémoire ou oubliés). restore() recrée le plateau avec from_world_state().
+
+Utilisation :
+    engine = GameEngine(board_class=ChunkedBoard)
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from itertools import chain
+from typing import Dict, Optional, Tuple
+from models import Board, Monster, Potion, Weapon, WeaponType
+from rng import GameRNG, SEED_BITS, derive_seed
+from settings import (
+    GRID_SIZE, START_POSITION, NB_MONSTERS, NB_EQUIPMENTS_MIN, NB_EQUIPMENTS_MAX,
+    WORLD_SIZE, WORLD_CHUNK_SIZE, WORLD_LOAD_RADIUS, WORLD_MAX_CHUNKS
+)
+
+# Même densité d'entités que le plateau classique
+_CELLS_PER_BOARD = GRID_SIZE * GRID_SIZE
+
+
+class Chunk:
+    """Entités d'un morceau du monde, indexées par position, et ses écarts à la génération"""
+    __slots__ = ("monsters", "equipments", "removed_monsters", "removed_equipments",
+                 "added_monsters", "added_equipments")
+
+    def __init__(self):
+        self.monsters = {}
+        self.equipments = {}
+        # Positions des entités supprimées ou ajoutées depuis la génération
+        # (les PV des monstres blessés se lisent directement sur les monstres)
+        self.removed_monsters = set()
+        self.removed_equipments = set()
+        self.added_monsters = set()
+        self.added_equipments = set()
+
+    def diff(self) -> Optional[tuple]:
+        """Écarts à la génération en tuples triés (None : morceau identique à sa génération)"""
+        monsters = tuple(sorted(
+            ((position, monster.hp) for position, monster in self.monsters.items()
+             if position in self.added_monsters or monster.hp != monster.max_hp),
+            key=lambda item: item[0]
+        ))
+        equipments = tuple(sorted(
+            ((position, equipment.weapon_type if isinstance(equipment, Weapon) else None)
+             for position, equipment in self.equipments.items() if position in self.added_equipments),
+            key=lambda item: item[0]
+        ))
+        if not (self.removed_monsters or self.removed_equipments or monsters or equipments):
+            return None
+        return tuple(sorted(self.removed_monsters)), tuple(sorted(self.removed_equipments)), monsters, equipments
+
+    def apply(self, diff: tuple) -> None:
+        """Applique à un morceau fraîchement généré les écarts retournés par diff()"""
+        removed_monsters, removed_equipments, monsters, equipments = diff
+        for position in removed_monsters:
+            self.monsters.pop(position, None)
+        for position in removed_equipments:
+            self.equipments.pop(position, None)
+        self.removed_monsters.update(removed_monsters)
+        self.removed_equipments.update(removed_equipments)
+        for position, hp in monsters:
+            monster = self.monsters.get(position)
+            if monster is None:  # Pas généré ici : monstre ajouté
+                monster = self.monsters[position] = Monster(position)
+                self.added_monsters.add(position)
+            monster.hp = hp
+        for position, weapon_type in equipments:
+            self.equipments[position] = Potion(position) if weapon_type is None else Weapon(position, weapon_type)
+            self.added_equipments.add(position)
+
+
+class ChunkedBoard(Board):
+    """Board d'un monde immense dont seuls les morceaux proches du héros existent en mémoire"""
+
+    def __init__(self, generate: bool = True, rng=None, size: int = WORLD_SIZE,
+                 chunk_size: int = WORLD_CHUNK_SIZE, load_radius: int = WORLD_LOAD_RADIUS,
+                 max_chunks: int = WORLD_MAX_CHUNKS, world_seed: Optional[int] = None):
+        if max_chunks < (2 * load_radius + 1) ** 2:
+            raise ValueError(f"max_chunks doit permettre de garder les {(2 * load_radius + 1) ** 2} "
+                             "morceaux autour du héros")
+        super().__init__(generate=False, rng=rng)
+        self.size = size
+        self.end_position = (size - 1, size - 1)
+        self.chunk_size = chunk_size
+        self.load_radius = load_radius
+        self.max_chunks = max_chunks
+        # generate=False : monde vide, rempli ensuite avec add_monster/add_equipment
+        self.generate = generate
+        self.world_seed = world_seed if world_seed is not None else self.rng.getrandbits(SEED_BITS)
+        self._chunks: OrderedDict[Tuple[int, int], Chunk] = OrderedDict()  # Du moins au plus récent
+        self._saved: Dict[Tuple[int, int], tuple] = {}  # Écarts (Chunk.diff) des morceaux modifiés puis oubliés
+        self.chunks_generated = 0  # Générations (régénérations comprises)
+        self._last_focus = None    # Dernier morceau autour duquel le voisinage a été chargé
+
+    # --- Cache des morceaux ---
+
+    def chunk_of(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        """Coordonnées du morceau qui contient une case"""
+        return position[0] // self.chunk_size, position[1] // self.chunk_size
+
+    def _chunk(self, key: Tuple[int, int]) -> Chunk:
+        """Morceau chargé (généré ou recréé au besoin), marqué comme le plus récent"""
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._load(key)
+            self._chunks[key] = chunk
+            self._record_chunk(chunk, True)
+            while len(self._chunks) > self.max_chunks:
+                self._evict(*self._chunks.popitem(last=False))
+        else:
+            self._chunks.move_to_end(key)
+        return chunk
+
+    def _focus(self, position: Tuple[int, int]) -> Chunk:
+        """Charge le voisinage d'une case et retourne son morceau"""
+        key = self.chunk_of(position)
+        if key != self._last_focus:
+            # Le héros entre dans un nouveau morceau : préparer les morceaux voisins
+            chunk_x, chunk_y = key
+            radius = self.load_radius
+            nb_chunks = -(-self.size // self.chunk_size)
+            for neighbour_x in range(max(0, chunk_x - radius), min(nb_chunks, chunk_x + radius + 1)):
+                for neighbour_y in range(max(0, chunk_y - radius), min(nb_chunks, chunk_y + radius + 1)):
+                    self._chunk((neighbour_x, neighbour_y))
+            self._last_focus = key
+        return self._chunk(key)
+
+    def _evict(self, key: Tuple[int, int], chunk: Chunk) -> None:
+        """Oublie un morceau (seuls les écarts d'un morceau modifié sont gardés)"""
+        self._record_chunk(chunk, False)
+        diff = chunk.diff()
+        if diff is not None:
+            self._saved[key] = diff
+        if self._last_focus == key:
+            self._last_focus = None
+
+    def _record_chunk(self, chunk: Chunk, present: bool) -> None:
+        """
+        Note dans le journal des changements (track_changes) les entités d'un morceau
+        chargé ou oublié : une view redessine ainsi les morceaux régénérés.
+        Le journal garde une entrée par entité vue : il grandit avec le nombre de
+        morceaux parcourus (à n'activer que pour un affichage, pas pour une simulation).
+        """
+        if self._changes is None:
+            return
+        for monster in chunk.monsters.values():
+            self._record_change(monster, 'monster', present)
+        for equipment in chunk.equipments.values():
+            self._record_change(equipment, 'equipment', present)
+
+    def _load(self, key: Tuple[int, int]) -> Chunk:
+        """Génère un morceau à partir de la graine du monde, puis lui applique ses écarts éventuels"""
+        chunk = Chunk()
+        if self.generate:
+            self._generate(key, chunk)
+        saved = self._saved.pop(key, None)
+        if saved is not None:
+            chunk.apply(saved)
+        return chunk
+
+    def _generate(self, key: Tuple[int, int], chunk: Chunk) -> None:
+        """Place monstres et équipements d'un morceau (ne dépend que de la graine et de key)"""
+        rng = GameRNG(derive_seed(self.world_seed, "chunk", *key))
+        chunk_x, chunk_y = key
+        left, top = chunk_x * self.chunk_size, chunk_y * self.chunk_size
+        width = min(self.chunk_size, self.size - left)
+        height = min(self.chunk_size, self.size - top)
+        area = width * height
+        nb_monsters = round(NB_MONSTERS * area / _CELLS_PER_BOARD)
+        nb_equipments = round(rng.randint(NB_EQUIPMENTS_MIN, NB_EQUIPMENTS_MAX) * area / _CELLS_PER_BOARD)
+
+        # Cases distinctes du morceau, hors départ et arrivée
+        forbidden = (START_POSITION, self.end_position)
+        nb_cells = min(area, nb_monsters + nb_equipments + len(forbidden))
+        positions = [
+            position for position in (
+                (left + index % width, top + index // width) for index in rng.sample(range(area), nb_cells)
+            ) if position not in forbidden
+        ]
+        for position in positions[:nb_monsters]:
+            chunk.monsters[position] = Monster(position)
+        weapon_types = list(WeaponType)
+        for position in positions[nb_monsters:nb_monsters + nb_equipments]:
+            # 50% de chance d'être une potion, 50% une arme (comme Board.generate_equipments)
+            if rng.choice([True, False]):
+                chunk.equipments[position] = Potion(position)
+            else:
+                chunk.equipments[position] = Weapon(position, rng.choice(weapon_types))
+        self.chunks_generated += 1
+
+    def world_state(self) -> tuple:
+        """Graine, paramètres et écarts de tous les morceaux modifiés (pour GameEngine.snapshot)"""
+        diffs = dict(self._saved)
+        for key, chunk in self._chunks.items():
+            diff = chunk.diff()
+            if diff is not None:
+                diffs[key] = diff
+        return (self.world_seed, self.generate, self.size, self.chunk_size, self.load_radius,
+                self.max_chunks, tuple(sorted(diffs.items())))
+
+    @classmethod
+    def from_world_state(cls, world_state: tuple, rng=None) -> 'ChunkedBoard':
+        """Recrée un monde dans l'état capturé par world_state() (morceaux rechargés à la demande)"""
+        world_seed, generate, size, chunk_size, load_radius, max_chunks, diffs = world_state
+        board = cls(generate=generate, rng=rng, size=size, chunk_size=chunk_size,
+                    load_radius=load_radius, max_chunks=max_chunks, world_seed=world_seed)
+        board._saved = dict(diffs)
+        return board
+
+    @property
+    def nb_loaded_chunks(self) -> int:
+        """Morceaux actuellement en mémoire"""
+        return len(self._chunks)
+
+    # --- Interface de Board ---
+
+    def generate_monsters(self):
+        """Rien à faire : les morceaux sont générés à la demande"""
+
+    def generate_equipments(self):
+        """Rien à faire : les morceaux sont générés à la demande"""
+
+    @property
+    def monsters(self):
+        """Monstres des morceaux en mémoire (vue en lecture, sans copie)"""
+        return chain.from_iterable(chunk.monsters.values() for chunk in self._chunks.values())
+
+    @property
+    def equipments(self):
+        """Équipements des morceaux en mémoire (vue en lecture, sans copie)"""
+        return chain.from_iterable(chunk.equipments.values() for chunk in self._chunks.values())
+
+    @property
+    def monster_positions(self):
+        """Positions des monstres des morceaux en mémoire"""
+        return tuple(chain.from_iterable(chunk.monsters for chunk in self._chunks.values()))
+
+    @property
+    def equipment_positions(self):
+        """Positions des équipements des morceaux en mémoire"""
+        return tuple(chain.from_iterable(chunk.equipments for chunk in self._chunks.values()))
+
+    def add_monster(self, monster):
+        """Place un monstre sur la carte (remplace celui qui s'y trouvait)"""
+        chunk = self._chunk(self.chunk_of(monster.position))
+        replaced = chunk.monsters.get(monster.position)
+        if replaced is not None:
+            self._record_change(replaced, 'monster', False)
+            if monster.position not in chunk.added_monsters:
+                # Monstre généré remplacé : noté retiré puis ajouté, pour que apply()
+                # recrée le nouveau monstre au lieu de garder celui de la génération
+                chunk.removed_monsters.add(monster.position)
+        chunk.monsters[monster.position] = monster
+        chunk.added_monsters.add(monster.position)
+        self._record_change(monster, 'monster', True)
+
+    def add_equipment(self, equipment):
+        """Place un équipement sur la carte (remplace celui qui s'y trouvait)"""
+        chunk = self._chunk(self.chunk_of(equipment.position))
+        replaced = chunk.equipments.get(equipment.position)
+        if replaced is not None:
+            self._record_change(replaced, 'equipment', False)
+            if equipment.position not in chunk.added_equipments:
+                chunk.removed_equipments.add(equipment.position)
+        chunk.equipments[equipment.position] = equipment
+        chunk.added_equipments.add(equipment.position)
+        self._record_change(equipment, 'equipment', True)
+
+    def get_equipment_at(self, position):
+        """Retourne l'équipement à la position donnée, s'il y en a un"""
+        return self._focus(position).equipments.get(position)
+
+    def remove_equipment(self, equipment):
+        """Supprime un équipement de la carte (à appeler avant use_equipment, qui peut effacer sa position)"""
+        chunk = self._chunk(self.chunk_of(equipment.position))
+        if chunk.equipments.get(equipment.position) is equipment:
+            del chunk.equipments[equipment.position]
+            chunk.added_equipments.discard(equipment.position)
+            chunk.removed_equipments.add(equipment.position)
+            self._record_change(equipment, 'equipment', False)
+
+    def get_monster_at(self, position):
+        """Retourne le monstre à la position donnée, s'il y en a un"""
+        # Les PV changés par un combat sont relus sur le monstre quand le morceau est oublié
+        return self._focus(position).monsters.get(position)
+
+    def remove_monster(self, monster):
+        """Supprime un monstre de la carte"""
+        chunk = self._chunk(self.chunk_of(monster.position))
+        if chunk.monsters.get(monster.position) is monster:
+            del chunk.monsters[monster.position]
+            chunk.added_monsters.discard(monster.position)
+            chunk.removed_monsters.add(monster.position)
+            self._record_change(monster, 'monster', False)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    import tracemalloc
+
+    # Promenade aléatoire sur un monde de 10000x10000 cases
+    tracemalloc.start()
+    board = ChunkedBoard(rng=GameRNG(0))
+    walker = random.Random(1)
+    x = y = board.size // 2
+    nb_steps = 200_000
+    start_time = time.perf_counter()
+    for step in range(nb_steps):
+        dx, dy = walker.choice(((1, 0), (-1, 0), (0, 1), (0, 1), (1, 0)))  # Dérive vers le bas à droite
+        x = min(board.size - 1, max(0, x + dx))
+        y = min(board.size - 1, max(0, y + dy))
+        board.get_equipment_at((x, y))
+        monster = board.get_monster_at((x, y))
+        if monster is not None:
+            board.remove_monster(monster)
+    elapsed = time.perf_counter() - start_time
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nb_steps} pas en {elapsed:.2f}s ({nb_steps / elapsed:.0f} pas/s), arrivée en {(x, y)}")
+    print(f"Morceaux générés : {board.chunks_generated} | en mémoire : {board.nb_loaded_chunks}"
+          f" (max {board.max_chunks}) | modifiés et oubliés : {len(board._saved)}")
+    print(f"Mémoire : {current / 1024:.0f} Ko (pic {peak / 1024:.0f} Ko)")
+
+    # Un morceau oublié puis régénéré est identique
+    fresh = ChunkedBoard(rng=GameRNG(0))
+    chunk_key = (0, 0)
+    original = sorted(monster.position for monster in fresh._chunk(chunk_key).monsters.values())
+    for key in range(1, fresh.max_chunks + 1):
+        fresh._chunk((key, key))  # Remplit le cache jusqu'à oublier (0, 0)
+    regenerated = sorted(monster.position for monster in fresh._chunk(chunk_key).monsters.values())
+    print(f"Morceau régénéré identique : {original == regenerated} ({len(original)} monstres)")
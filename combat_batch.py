@@ -0,0 +1,107 @@
+"""
+FICHIER OPTIONNEL - PAS INDISPENSABLE (nécessite numpy : pip install numpy)
+
+combat_batch.py
+Résolution vectorisée (NumPy) de millions de combats en une seule fois,
+pour les études d'équilibrage (Monte Carlo).
+
+Chaque coup suit exactement la règle de Hero.attack :
+    hit_chance = min(95, max(5, force / MONSTER_DEFENSE * 100))
+    jet de dé entier entre 1 et 100, touché si jet >= 100 - hit_chance
+    touché -> le monstre perd HERO_DAMAGE, raté -> le héros perd MONSTER_DAMAGE
+Le combat continue jusqu'à la mort du héros ou du monstre.
+"""
+from __future__ import annotations
+from typing import NamedTuple
+import numpy as np
+from settings import MONSTER_DEFENSE, HERO_DAMAGE, MONSTER_DAMAGE
+
+
+class FightOutcomes(NamedTuple):
+    """Résultats (tableaux de même forme) d'un lot de combats"""
+    hero_won: np.ndarray    # bool : True si le monstre est mort
+    swings: np.ndarray      # Nombre de coups portés dans chaque combat
+    hero_hp: np.ndarray     # PV restants du héros
+    monster_hp: np.ndarray  # PV restants du monstre
+
+
+def failure_thresholds(hero_force) -> np.ndarray:
+    """Seuil à atteindre au dé pour chaque force (identique à CombatResult.failure_threshold)"""
+    force = np.asarray(hero_force, dtype=np.float64)
+    hit_chance = np.clip(force / MONSTER_DEFENSE * 100, 5, 95)  # Entre 5% et 95%
+    return 100 - hit_chance
+
+
+def hit_probabilities(hero_force) -> np.ndarray:
+    """Probabilité exacte de toucher par coup : proportion des jets 1..100 >= seuil"""
+    first_success = np.maximum(np.ceil(failure_thresholds(hero_force)), 1)
+    return (101 - first_success) / 100
+
+
+def resolve_fights(hero_force, hero_hp, monster_hp, rng=None) -> FightOutcomes:
+    """
+    Résout un lot de combats jusqu'au bout.
+
+    Args:
+        hero_force: force du héros (scalaire ou tableau)
+        hero_hp: PV du héros au début du combat (scalaire ou tableau)
+        monster_hp: PV du monstre au début du combat (scalaire ou tableau)
+        rng: np.random.Generator, graine entière ou None
+    """
+    rng = np.random.default_rng(rng)
+    thresholds, hero_hp, monster_hp = np.broadcast_arrays(
+        failure_thresholds(hero_force),
+        np.asarray(hero_hp, dtype=np.int64),
+        np.asarray(monster_hp, dtype=np.int64)
+    )
+    # Copies à plat (broadcast_arrays retourne des vues en lecture seule)
+    shape = thresholds.shape
+    thresholds = thresholds.ravel()
+    hero_hp = hero_hp.ravel().copy()
+    monster_hp = monster_hp.ravel().copy()
+    swings = np.zeros(hero_hp.size, dtype=np.int64)
+
+    # Indices des combats encore en cours : on ne tire des dés que pour eux
+    active = np.flatnonzero((hero_hp > 0) & (monster_hp > 0))
+    while active.size:
+        dice_rolls = rng.integers(1, 101, size=active.size)
+        hit = dice_rolls >= thresholds[active]
+        monster_hp[active[hit]] -= HERO_DAMAGE
+        hero_hp[active[~hit]] -= MONSTER_DAMAGE
+        swings[active] += 1
+        active = active[(hero_hp[active] > 0) & (monster_hp[active] > 0)]
+
+    return FightOutcomes(
+        hero_won=(monster_hp <= 0).reshape(shape),
+        swings=swings.reshape(shape),
+        hero_hp=hero_hp.reshape(shape),
+        monster_hp=monster_hp.reshape(shape)
+    )
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from models import Hero, Monster
+    from settings import START_HP, START_FORCE, MONSTER_HP
+
+    # Comparaison avec la version scalaire (Hero.attack) sur la configuration par défaut
+    nb_fights = 1_000_000
+    start_time = time.perf_counter()
+    outcomes = resolve_fights(np.full(nb_fights, START_FORCE), START_HP, MONSTER_HP, rng=0)
+    elapsed = time.perf_counter() - start_time
+    print(f"{nb_fights} combats vectorisés en {elapsed:.3f}s")
+
+    nb_scalar = 100_000
+    random.seed(0)
+    wins = swings = 0
+    for _ in range(nb_scalar):
+        hero = Hero(hp=START_HP, base_force=START_FORCE)
+        monster = Monster((1, 1))
+        while hero.hp > 0 and monster.hp > 0:
+            hero.attack(monster)
+            swings += 1
+        wins += monster.hp <= 0
+    print(f"Victoire héros : vectorisé {outcomes.hero_won.mean():.4f} | scalaire {wins / nb_scalar:.4f}")
+    print(f"Coups moyens   : vectorisé {outcomes.swings.mean():.4f} | scalaire {swings / nb_scalar:.4f}")
+    print(f"Probabilité exacte de toucher : {float(hit_probabilities(START_FORCE)):.2f}")
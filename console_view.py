@@ -9,10 +9,13 @@ Il ne prend aucune décision, il se contente d'afficher l'état du modèle.
 """
 import os
 import re
-from typing import TYPE_CHECKING
+import sys
+from typing import Optional, TYPE_CHECKING
 from settings import (
     GRID_SIZE, NB_MONSTERS, POINTS_PER_MONSTER, POINTS_PER_HP, 
     ELEMENT_COLORS, SHOW_SCORE_DURING_GAME,
+    START_POSITION, END_POSITION,
+    HERO_SYMBOL, MONSTER_SYMBOL, EQUIPMENT_SYMBOL,
     DEPARTURE_SYMBOL, ARRIVAL_SYMBOL, PlayerAction
 )
 
@@ -22,49 +25,115 @@ from settings import (
 if TYPE_CHECKING:
     from models import Hero, Board, CombatResult
 
+# Séquences ANSI : curseur en haut à gauche + effacement de l'écran
+CLEAR_SCREEN = "\033[H\033[2J"
+
+# Table des glyphes pré-calculée : une case = 3 caractères visibles (couleurs comprises)
+EMPTY_CELL = "   "
+CELL_GLYPHS = {
+    element: f" {ELEMENT_COLORS[element]}{symbol}{ELEMENT_COLORS['RESET']} "
+    for element, symbol in (
+        ('HERO', HERO_SYMBOL),
+        ('MONSTER', MONSTER_SYMBOL),
+        ('EQUIPMENT', EQUIPMENT_SYMBOL),
+        ('DEPARTURE', DEPARTURE_SYMBOL),
+        ('ARRIVAL', ARRIVAL_SYMBOL),
+    )
+}
+
+# Patterns regex pour chaque action (plus élégant que les elif)
+ACTION_PATTERNS = {
+    PlayerAction.MOVE_UP: re.compile(r'^(up|u|z|↑)$', re.IGNORECASE),
+    PlayerAction.MOVE_DOWN: re.compile(r'^(down|d|s|↓)$', re.IGNORECASE),
+    PlayerAction.MOVE_LEFT: re.compile(r'^(left|l|q|←)$', re.IGNORECASE),
+    PlayerAction.MOVE_RIGHT: re.compile(r'^(right|r|→)$', re.IGNORECASE),
+    PlayerAction.ATTACK: re.compile(r'^(espace|space| )$', re.IGNORECASE),
+    PlayerAction.QUIT: re.compile(r'^(x|quit|exit)$', re.IGNORECASE)
+}
+
+def parse_action(text: str) -> PlayerAction:
+    """Convertit une commande texte (↑/↓/←/→/espace/x...) en PlayerAction (partagé avec server.py)"""
+    command = text.strip() or text[:1]  # Une ligne d'espaces vaut la barre d'espace
+    
+    # Parser avec regex : teste chaque pattern jusqu'à trouver un match
+    for player_action, pattern in ACTION_PATTERNS.items():
+        if pattern.match(command):
+            return player_action
+    
+    # VERSION AVEC GENERATOR EXPRESSION (équivalent plus fonctionnel) :
+    # matched_actions = (
+    #     player_action for player_action, pattern in ACTION_PATTERNS.items()
+    #     if pattern.match(command)
+    # )
+    # return next(matched_actions, PlayerAction.UNKNOWN)
+    
+    # Aucun pattern ne correspond
+    return PlayerAction.UNKNOWN
+
 class ConsoleView:
+    def __init__(self):
+        # Dernière image affichée : position -> glyphe des entités (None = écran à redessiner)
+        self._frame_cells = None
+        self._frame_size = None
+
     def clear_screen(self) -> None:
-        """Nettoie la console pour un affichage fluide"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Nettoie la console (séquence ANSI, sans lancer de processus 'clear')"""
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
+        self._frame_cells = None  # Le prochain plateau sera redessiné entièrement
+
+    @staticmethod
+    def _background_cell(position) -> str:
+        """Glyphe d'une case sans entité (départ, arrivée ou vide)"""
+        if position == START_POSITION:
+            return CELL_GLYPHS['DEPARTURE']
+        if position == END_POSITION:
+            return CELL_GLYPHS['ARRIVAL']
+        return EMPTY_CELL
 
     def display_board(self, hero: 'Hero', board: 'Board') -> None:
-        """Affiche la grille, le héros, les monstres et les équipements"""
-        self.clear_screen()
-        print("-" * (board.size * 4 + 1))
+        """
+        Affiche la grille, le héros, les monstres et les équipements.
         
-        for y in range(board.size):
-            row_str = "|"
-            for x in range(board.size):
-                cell_content = "   " # Case vide
-                
-                # Vérifier si le héros est là
-                if hero.x == x and hero.y == y:
-                    cell_content = f" {ELEMENT_COLORS['HERO']}{hero.symbol}{ELEMENT_COLORS['RESET']} "
-                
-                # Vérifier si un monstre est là
-                else:
-                    for m in board.monsters:
-                        if m.x == x and m.y == y:
-                            cell_content = f" {ELEMENT_COLORS['MONSTER']}{m.symbol}{ELEMENT_COLORS['RESET']} "
-                            break
-                    
-                    # Si pas de monstre, vérifier s'il y a un équipement
-                    if cell_content == "   ":
-                        for equipment in board.equipments:
-                            if equipment.x == x and equipment.y == y:
-                                cell_content = f" {ELEMENT_COLORS['EQUIPMENT']}{equipment.symbol}{ELEMENT_COLORS['RESET']} "
-                                break
-                    
-                    # Si pas d'équipement, afficher départ/arrivée
-                    if cell_content == "   ":
-                        if x == 0 and y == 0:  # Case départ
-                            cell_content = f" {ELEMENT_COLORS['DEPARTURE']}{DEPARTURE_SYMBOL}{ELEMENT_COLORS['RESET']} "
-                        elif x == board.size - 1 and y == board.size - 1:  # Case arrivée
-                            cell_content = f" {ELEMENT_COLORS['ARRIVAL']}{ARRIVAL_SYMBOL}{ELEMENT_COLORS['RESET']} "
-                
-                row_str += cell_content + "|"
-            print(row_str)
-            print("-" * (board.size * 4 + 1))
+        La première image est dessinée entièrement ; ensuite seules les cases
+        qui ont changé sont réécrites (positionnement du curseur), et toute
+        l'image part en un seul sys.stdout.write.
+        """
+        # Glyphes des entités par position (priorité : héros > monstre > équipement)
+        cells = {equipment.position: CELL_GLYPHS['EQUIPMENT'] for equipment in board.equipments}
+        for monster in board.monsters:
+            cells[monster.position] = CELL_GLYPHS['MONSTER']
+        cells[hero.position] = CELL_GLYPHS['HERO']
+        
+        size = board.size
+        previous = self._frame_cells
+        if previous is None or self._frame_size != size:
+            separator = "-" * (size * 4 + 1) + "\n"
+            parts = [CLEAR_SCREEN, separator]
+            for y in range(size):
+                parts.append("|")
+                for x in range(size):
+                    parts.append(cells.get((x, y)) or self._background_cell((x, y)))
+                    parts.append("|")
+                parts.append("\n")
+                parts.append(separator)
+        else:
+            parts = []
+            # Seules les cases occupées avant ou maintenant peuvent avoir changé
+            for position in previous.keys() | cells.keys():
+                glyph = cells.get(position)
+                if glyph != previous.get(position):
+                    x, y = position
+                    # Ligne 2 + 2y (séparateurs), colonne 2 + 4x (bordures "|")
+                    parts.append(f"\033[{2 * y + 2};{4 * x + 2}H")
+                    parts.append(glyph or self._background_cell(position))
+            # Curseur sous la grille et effacement de l'ancien texte (stats, messages)
+            parts.append(f"\033[{2 * size + 2};1H\033[J")
+        
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+        self._frame_cells = cells
+        self._frame_size = size
 
     def show_stats(self, hero: 'Hero') -> None:
         """Affiche les stats du joueur"""
@@ -75,26 +144,23 @@ class ConsoleView:
             print(f"Score: {hero.score} | Monstres vaincus: {hero.monsters_defeated}/{NB_MONSTERS} | Mouvements: {hero.move_count}")
         if hero.inventory:
             print(f"{ELEMENT_COLORS['INVENTORY']}Inventaire:{ELEMENT_COLORS['RESET']}")
-            # Tri des armes par puissance décroissante (du plus fort au plus faible)
-            sorted_weapons = sorted(hero.inventory, reverse=True)  # Utilise __gt__ de Weapon
-            
+            # L'inventaire est déjà trié par puissance décroissante (tenu à jour par Hero)
             # Utilisation de map() + lambda pour formater chaque arme
             weapon_descriptions = map(
                 lambda w: f"  - {w.weapon_name} ({ELEMENT_COLORS['FORCE']}+{w.force_bonus} Force{ELEMENT_COLORS['RESET']})",
-                sorted_weapons
+                hero.inventory
             )
             print("\n".join(weapon_descriptions))
             
             # Affichage  de l'arme la plus puissante
-            strongest_weapon = max(hero.inventory)  # Utilise __gt__ de Weapon
-            print(f"    ⚡ Arme la plus puissante: {strongest_weapon.weapon_name}")
+            print(f"    ⚡ Arme la plus puissante: {hero.strongest_weapon.weapon_name}")
         else:
             print(f"{ELEMENT_COLORS['INVENTORY']}Inventaire:{ELEMENT_COLORS['RESET']} aucune arme")
         print(f"Légende: {ELEMENT_COLORS['HERO']}H{ELEMENT_COLORS['RESET']}=Héros, {ELEMENT_COLORS['MONSTER']}M{ELEMENT_COLORS['RESET']}=Monstre, {ELEMENT_COLORS['EQUIPMENT']}O{ELEMENT_COLORS['RESET']}=Équipement, {ELEMENT_COLORS['DEPARTURE']}D{ELEMENT_COLORS['RESET']}=Départ, {ELEMENT_COLORS['ARRIVAL']}A{ELEMENT_COLORS['RESET']}=Arrivée")
         print("Commandes: ↑ (Haut), ← (Gauche), ↓ (Bas), → (Droite), ESPACE (Attaquer), X (Quitter)")
     
-    def show_victory(self, hero: 'Hero') -> None:
-        """Affiche le message de victoire avec le score"""
+    def show_victory(self, hero: 'Hero', perfect_score: Optional[int] = None) -> None:
+        """Affiche le message de victoire avec le score (perfect_score : meilleur score possible sur ce plateau)"""
         print("\n" + "="*50)
         print(f"{ELEMENT_COLORS['VICTORY']}🎉 VICTOIRE ! Vous avez atteint la sortie ! 🎉{ELEMENT_COLORS['RESET']}")
         print(f"\n🏆 VOTRE SCORE FINAL: {ELEMENT_COLORS['ACTION_MESSAGE']}{hero.score} POINTS{ELEMENT_COLORS['RESET']}")
@@ -104,7 +170,9 @@ class ConsoleView:
         
         # Évaluation du score
         # Calcul des seuils de score basés sur la configuration (incluant PV max)
-        perfect_score = (NB_MONSTERS * POINTS_PER_MONSTER) + (hero.max_hp * POINTS_PER_HP) - (2 * GRID_SIZE - 2)  # Score parfait
+        if perfect_score is None:
+            # Estimation sans tenir compte de la disposition du plateau
+            perfect_score = (NB_MONSTERS * POINTS_PER_MONSTER) + (hero.max_hp * POINTS_PER_HP) - (2 * GRID_SIZE - 2)  # Score parfait
         very_good_threshold = perfect_score - (NB_MONSTERS + hero.max_hp)  # Très bien
         good_threshold = very_good_threshold - (NB_MONSTERS + hero.max_hp)  # OK
         
@@ -120,7 +188,7 @@ class ConsoleView:
         else:
             print(f"🌟 Gardez espoir ! La prochaine fois sera meilleure ! ({hero.score}pts)")
         
-        print(f"\n🎯 Astuce: Score parfait = {perfect_score}pts (tous les monstres + chemin optimal + PV max)")
+        print(f"\n🎯 Astuce: Score parfait = {perfect_score}pts (meilleur itinéraire sur ce plateau, sans rater un coup)")
         print("="*50)
     
     def show_game_over(self, hero: 'Hero') -> None:
@@ -218,32 +286,8 @@ class ConsoleView:
                 print(key.decode('utf-8', errors='ignore'))
                 return PlayerAction.UNKNOWN
         else:  # Linux/Mac (fallback avec input classique)
-            action = input("Votre action (↑/↓/←/→/espace/x) > ").strip()
-            
-            # Patterns regex pour chaque action (plus élégant que les elif)
-            action_patterns = {
-                PlayerAction.MOVE_UP: r'^(up|u|z|↑)$',
-                PlayerAction.MOVE_DOWN: r'^(down|d|s|↓)$',
-                PlayerAction.MOVE_LEFT: r'^(left|l|q|←)$',
-                PlayerAction.MOVE_RIGHT: r'^(right|r|→)$',
-                PlayerAction.ATTACK: r'^(espace|space| )$',
-                PlayerAction.QUIT: r'^(x|quit|exit)$'
-            }
-            
-            # Parser avec regex : teste chaque pattern jusqu'à trouver un match
-            for player_action, pattern in action_patterns.items():
-                if re.match(pattern, action, re.IGNORECASE):
-                    return player_action
-            
-            # VERSION AVEC GENERATOR EXPRESSION (équivalent plus fonctionnel) :
-            # matched_actions = (
-            #     player_action for player_action, pattern in action_patterns.items()
-            #     if re.match(pattern, action, re.IGNORECASE)
-            # )
-            # return next(matched_actions, PlayerAction.UNKNOWN)
-            
-            # Aucun pattern ne correspond
-            return PlayerAction.UNKNOWN
+            action = input("Votre action (↑/↓/←/→/espace/x) > ")
+            return parse_action(action)
 
 if __name__ == "__main__":
     print("ATTENTION: Ce fichier contient les vues et l'affichage du jeu.")
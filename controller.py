@@ -3,166 +3,195 @@ controller.py
 Le Chef d'Orchestre. Il initialise le jeu et gère la boucle principale.
 Peut fonctionner avec une ou plusieurs views simultanément.
 """
+import time
 from typing import Type
-from models import Hero, Board
+from engine import GameEngine
+from solver import solve
+from autopilot import Autopilot
+from replay import encode, record
 from console_view import ConsoleView
-from settings import START_HP, START_FORCE, ENABLE_HIGHSCORE, PlayerAction
+from settings import ENABLE_HIGHSCORE, AUTOPILOT_DELAY, PlayerAction
 
 # Import optionnel du système de highscore
 try:
-    from highscore import HighScoreManager
+    from highscore import create_highscore_manager
     HIGHSCORE_AVAILABLE = True
 except ImportError:
     HIGHSCORE_AVAILABLE = False
 
-def main(view_class: Type[ConsoleView] = ConsoleView) -> None:
+class GameController:
     """
-    Fonction principale du jeu.
-    
-    Args:
-        view_class: Classe de la view à utiliser (ConsoleView, TkinterView, etc.)
+    Relie une view au GameEngine : affiche l'état du moteur et réagit aux actions.
+    La view ne fait qu'afficher et transmettre les actions du joueur.
     """
-    # 1. Initialisation (Setup)
-    view = view_class()
-    
-    # Initialisation optionnelle du highscore
-    if ENABLE_HIGHSCORE and HIGHSCORE_AVAILABLE:
-        highscore_manager = HighScoreManager()
-    else:
-        highscore_manager = None
     
-    hero = Hero(hp=START_HP, base_force=START_FORCE)
-    board = Board()
-    
-    running = True
-    last_action_message = None  # Message de la dernière action
-    in_combat = False  # État de combat
-    current_monster = None  # Monstre actuellement en combat
-
-    # 2. Boucle de jeu
-    while running:
-        # Vérifier si le héros est mort, si oui fin
-        if hero.is_dead():
-            view.display_board(hero, board)
-            view.show_game_over(hero)
-            running = False
-            continue
+    def __init__(self, view) -> None:
+        self.view = view
+        
+        # Initialisation optionnelle du highscore
+        if ENABLE_HIGHSCORE and HIGHSCORE_AVAILABLE:
+            self.highscore_manager = create_highscore_manager()
+        else:
+            self.highscore_manager = None
         
-        # A. Affichage
-        view.display_board(hero, board)
+        self.engine = GameEngine()
+        # Meilleur score possible sur ce plateau (calculé une fois, avant le premier coup)
+        self.perfect_score = solve(self.engine.board, self.engine.hero).score
+        self.running = True
+        self.last_action_message = None  # Message de la dernière action
+    
+    def render(self) -> None:
+        """Affiche l'état courant du jeu (plateau, stats, dernier message, combat)"""
+        view = self.view
+        hero = self.engine.hero
+        view.display_board(hero, self.engine.board)
         view.show_stats(hero)
         
         # Afficher le message de la dernière action s'il y en a un
-        if last_action_message:
-            view.show_action_message(last_action_message)
-            last_action_message = None  # Réinitialiser après affichage
+        if self.last_action_message:
+            view.show_action_message(self.last_action_message)
+            self.last_action_message = None  # Réinitialiser après affichage
         
         # Affichage spécial en combat
-        if in_combat and current_monster:
+        if self.engine.in_combat:
             view.show_combat_prompt()
-
-        # B. Input Joueur
-        action = view.get_player_input()
-
-        # C. Logique
+    
+    def handle_action(self, action: PlayerAction) -> bool:
+        """
+        Réagit à une action du joueur puis affiche l'état suivant.
+        Retourne False quand la partie est terminée.
+        """
+        if not self.running:
+            return False
+        view = self.view
+        hero = self.engine.hero
+        
+        # Logique (déléguée au moteur)
+        result = self.engine.step(action)
         if action == PlayerAction.QUIT:
-            running = False
+            self.running = False
             view.show_goodbye()
-        elif action == PlayerAction.ATTACK and in_combat and current_monster:
-            # Attaque en combat
-            combat_result = hero.attack(current_monster)
-            last_action_message = view.format_combat_message(combat_result, hero.score)
-            
-            if combat_result.monster_died:
-                board.remove_monster(current_monster)
-                in_combat = False
-                current_monster = None
-            
-        elif action in [PlayerAction.MOVE_UP, PlayerAction.MOVE_DOWN, PlayerAction.MOVE_LEFT, PlayerAction.MOVE_RIGHT]:
-            # Sortir du combat si on se déplace
-            in_combat = False
-            current_monster = None
-            
-            # Appel direct avec l'enum PlayerAction
-            hero.move(action)
-            
-            # Vérification de collecte d'équipement
-            equipment = board.get_equipment_at(hero.position)
-            if equipment:
-                last_action_message = hero.use_equipment(equipment)
-                board.remove_equipment(equipment)
-            
-            # Vérification de combat avec monstre
-            monster = board.get_monster_at(hero.position)
-            if monster:
-                # Entrer en combat
-                in_combat = True
-                current_monster = monster
-                combat_result = hero.attack(monster)
-                last_action_message = view.format_combat_message(combat_result, hero.score)
-                
-                if combat_result.monster_died:
-                    board.remove_monster(monster)
-                    in_combat = False
-                    current_monster = None
-            
+            return False
+        elif result.combat_result:
+            self.last_action_message = view.format_combat_message(result.combat_result, hero.score)
+        elif result.equipment_message:
+            self.last_action_message = result.equipment_message
+        
         # Condition de victoire
-        if hero.has_won():
-            view.display_board(hero, board)
-            
-            # Affichage de victoire (message simple, sans popup)
-            view.show_victory(hero)
-            
-            # Highscores EN PREMIER (immédiatement visibles)
-            if ENABLE_HIGHSCORE and HIGHSCORE_AVAILABLE and highscore_manager:
-                is_new_record, old_record = highscore_manager.update_stats(
-                    hero.score, hero.monsters_defeated, hero.move_count
-                )
-                
-                if is_new_record:
-                    view.show_new_record(old_record)
-                else:
-                    best_score = highscore_manager.get_best_score()
-                    if best_score > 0:
-                        view.show_current_best(best_score)
+        if result.won:
+            self._finish_victory()
+            return False
+        
+        # Vérifier si le héros est mort, si oui fin
+        if hero.is_dead():
+            view.display_board(hero, self.engine.board)
+            view.show_game_over(hero)
+            self.running = False
+            return False
+        
+        self.render()
+        return True
+    
+    def _finish_victory(self) -> None:
+        """Affiche la victoire, enregistre le score et termine la partie"""
+        view = self.view
+        hero = self.engine.hero
+        view.display_board(hero, self.engine.board)
+        
+        # Affichage de victoire (message simple, sans popup)
+        view.show_victory(hero, self.perfect_score)
+        
+        # Highscores EN PREMIER (immédiatement visibles)
+        if self.highscore_manager:
+            is_new_record, old_record = self.highscore_manager.update_stats(
+                hero.score, hero.monsters_defeated, hero.move_count, hp=hero.hp, seed=self.engine.seed,
+                replay=encode(record(self.engine))
+            )
             
-            # Popup d'adieu EN DERNIER (après lecture des highscores)
-            view.show_farewell()
-            running = False
+            if is_new_record:
+                view.show_new_record(old_record)
+            else:
+                best_score = self.highscore_manager.get_best_score()
+                if best_score > 0:
+                    view.show_current_best(best_score)
+        
+        # Popup d'adieu EN DERNIER (après lecture des highscores)
+        view.show_farewell()
+        self.running = False
+
+def main(view_class: Type[ConsoleView] = ConsoleView, autopilot: bool = False) -> None:
+    """
+    Fonction principale du jeu.
+    
+    Args:
+        view_class: Classe de la view à utiliser (ConsoleView, TkinterView, etc.)
+        autopilot: True pour laisser le pilote automatique jouer à la place du joueur
+    """
+    # 1. Initialisation (Setup)
+    view = view_class()
+    controller = GameController(view)
+    controller.render()
+    
+    # Le pilote automatique remplace la saisie du joueur
+    next_action = None
+    if autopilot:
+        pilot = Autopilot.for_board(controller.engine.board)
+        next_action = lambda: pilot(controller.engine.observe())
+    
+    # 2. Boucle de jeu
+    if hasattr(view, "run"):
+        # View événementielle (TkinterView) : la boucle d'événements de la view
+        # appelle le controller à chaque action, sans attente active
+        view.run(controller.handle_action, autoplay=next_action)
+    else:
+        # View bloquante (ConsoleView) : on attend chaque action du joueur
+        while controller.running:
+            if next_action:
+                time.sleep(AUTOPILOT_DELAY)  # Laisser le temps de suivre la partie
+                controller.handle_action(next_action())
+            else:
+                controller.handle_action(view.get_player_input())
 
 if __name__ == "__main__":
     print("AVENTURIER - Choisissez votre interface")
     print("=" * 45)
     print("1. Mode Console (classique)")
     print("2. Mode GUI (interface graphique)")
+    print("3. Pilote automatique (console)")
+    print("4. Pilote automatique (GUI)")
     print("x. Quitter")
     print("=" * 45)
     
     while True:
         try:
-            choice = input("Votre choix (1-2, x) : ").strip().lower()
+            choice = input("Votre choix (1-4, x) : ").strip().lower()
             
             if choice == "1":
                 print("\nLancement en mode Console...")
                 main()
                 break
                 
-            elif choice == "2":
+            elif choice in ("2", "4"):
                 print("\nLancement en mode GUI...")
                 try:
                     from tkinter_view import TkinterView
-                    main(TkinterView)
+                    main(TkinterView, autopilot=choice == "4")
                     break  # Ajouté pour éviter la relance du menu après fermeture GUI
                 except ImportError:
                     print("Erreur: tkinter non disponible sur ce système")
                     print("Merci de choisir le mode console.") 
+            
+            elif choice == "3":
+                print("\nLancement du pilote automatique...")
+                main(autopilot=True)
+                break
                 
             elif choice == "x":
                 print("\nAu revoir !")
                 break
                 
             else:
-                print("Choix invalide. Veuillez entrer 1, 2 ou x.")
+                print("Choix invalide. Veuillez entrer 1, 2, 3, 4 ou x.")
                 
         except KeyboardInterrupt:
             print("\n\nAu revoir !")
@@ -0,0 +1,297 @@
+"""
+engine.py
+Le moteur de jeu "headless" (sans affichage).
+Il applique les règles du jeu (déplacement, ramassage, combat, victoire)
+sans aucun affichage ni saisie : idéal pour les bots et les simulations.
+
+Chaque partie dépend d'une seule graine (engine.seed) : rejouer les mêmes
+actions avec la même graine redonne exactement la même partie.
+
+Utilisation :
+    engine = GameEngine(seed=42)
+    observation = engine.reset()
+    while not engine.done:
+        result = engine.step(PlayerAction.MOVE_RIGHT)
+"""
+from __future__ import annotations
+import hashlib
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, Tuple, Type
+import settings
+from models import Hero, Board, Monster, Potion, Weapon, WeaponType, CombatResult
+from rng import GameRNG, SEED_BITS, derive_seed
+from settings import START_HP, START_FORCE, PlayerAction
+
+# Ensemble des actions de déplacement (test d'appartenance en O(1))
+MOVE_ACTIONS = frozenset({
+    PlayerAction.MOVE_UP, PlayerAction.MOVE_DOWN,
+    PlayerAction.MOVE_LEFT, PlayerAction.MOVE_RIGHT
+})
+# Même ensemble en tuple pour step() : "in" compare d'abord par identité, sans hacher l'action
+_MOVE_ACTIONS = tuple(MOVE_ACTIONS)
+
+# Constantes qui changent les règles (et donc rendent les scores incomparables)
+RULES_SETTINGS = (
+    "GRID_SIZE", "START_POSITION", "END_POSITION", "NB_MONSTERS",
+    "START_HP", "START_FORCE", "HERO_DAMAGE",
+    "MONSTER_HP", "MONSTER_DAMAGE", "MONSTER_DEFENSE",
+    "POINTS_PER_MONSTER", "POINTS_PER_HP",
+    "POTION_HEAL", "NB_EQUIPMENTS_MIN", "NB_EQUIPMENTS_MAX",
+)
+
+
+# Historique des actions : liste chaînée persistante (historique précédent, dernière action)
+# ou None. Ajouter une action ne copie rien, et un snapshot partage l'historique en O(1).
+ActionHistory = Optional[Tuple[Optional[tuple], PlayerAction]]
+
+
+def unroll(history: ActionHistory) -> Tuple[PlayerAction, ...]:
+    """Actions d'un historique, de la première à la dernière"""
+    actions = []
+    while history is not None:
+        history, action = history
+        actions.append(action)
+    actions.reverse()
+    return tuple(actions)
+
+
+def settings_hash() -> str:
+    """Empreinte courte des règles en vigueur (identifie un "profil" de configuration)"""
+    description = ";".join(f"{name}={getattr(settings, name)!r}" for name in RULES_SETTINGS)
+    return hashlib.sha1(description.encode("utf-8")).hexdigest()[:16]
+
+
+class Observation(NamedTuple):
+    """Vue immuable et compacte de l'état du jeu (pour les bots ; NamedTuple : construite à chaque pas)"""
+    position: Tuple[int, int]
+    hp: int
+    max_hp: int
+    force: int
+    score: int
+    in_combat: bool
+    monsters: Tuple[Tuple[int, int], ...]
+    equipments: Tuple[Tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Copie immuable et complète de l'état d'une partie (GameEngine.snapshot/restore).
+    Deux snapshots sont égaux si l'état du jeu est le même, quels que soient la graine
+    et le chemin suivi : ils peuvent servir de clé (table de transpositions).
+    """
+    position: Tuple[int, int]
+    hp: int
+    max_hp: int
+    base_force: int
+    move_count: int
+    monsters_defeated: int
+    weapons: Tuple[Tuple[WeaponType, Tuple[int, int]], ...]        # (type, case où l'arme a été trouvée)
+    monsters: Tuple[Tuple[Tuple[int, int], int], ...]              # (position, PV)
+    equipments: Tuple[Tuple[Tuple[int, int], Optional[WeaponType]], ...]  # (position, type d'arme ou None = potion)
+    combat_position: Optional[Tuple[int, int]]  # Position du monstre en combat (None hors combat)
+    done: bool
+    won: bool
+    world: Optional[tuple] = None  # Board.world_state() d'un plateau généré à la demande (monsters/equipments vides)
+    seed: Optional[int] = field(default=None, compare=False)
+    history: ActionHistory = field(default=None, compare=False)  # Partagé avec le moteur (aucune copie)
+    rng_state: Optional[tuple] = field(default=None, compare=False)  # État des dés de combat (optionnel)
+
+    @property
+    def actions(self) -> Tuple[PlayerAction, ...]:
+        """Actions appliquées depuis le début de la partie"""
+        return unroll(self.history)
+
+
+@dataclass
+class StepResult:
+    """Résultat d'une action appliquée par le moteur"""
+    action: PlayerAction
+    equipment_message: Optional[str] = None      # Message de l'équipement ramassé
+    combat_result: Optional[CombatResult] = None  # Résultat de l'attaque éventuelle
+    done: bool = False   # Partie terminée (victoire, mort ou abandon)
+    won: bool = False    # Le héros a atteint l'arrivée
+
+
+class GameEngine:
+    """Applique les règles du jeu sur un Hero et un Board, sans aucune I/O"""
+
+    def __init__(self, seed: Optional[int] = None, board_class: Type[Board] = Board):
+        self.board_class = board_class  # Board, ou un plateau compatible (entity_store.ArrayBoard)
+        self.hero: Hero = None
+        self.board: Board = None
+        self.in_combat = False  # État de combat
+        self.current_monster: Optional[Monster] = None  # Monstre actuellement en combat
+        self.done = False
+        self.won = False
+        self.seed: Optional[int] = None  # Graine de la partie en cours
+        self.history: ActionHistory = None  # Actions appliquées depuis reset (replay, voir actions)
+        self._seeds = GameRNG(seed)  # Flux des graines des parties successives
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> Observation:
+        """Démarre une nouvelle partie (graine donnée, ou la suivante du flux) et retourne la première observation"""
+        self.seed = seed if seed is not None else self._seeds.getrandbits(SEED_BITS)
+        # Sous-flux séparés : le plateau ne dépend pas des combats, et inversement
+        # (mêmes flux que GameRNG(seed).split(...), sans créer le flux racine)
+        self.hero = Hero(hp=START_HP, base_force=START_FORCE, rng=GameRNG(derive_seed(self.seed, "combat")))
+        self.board = self.board_class(rng=GameRNG(derive_seed(self.seed, "board")))
+        self.history = None
+        self.in_combat = False
+        self.current_monster = None
+        self.done = False
+        self.won = False
+        return self.observe()
+
+    def observe(self) -> Observation:
+        """Retourne l'état courant du jeu (aucun affichage)"""
+        hero = self.hero
+        board = self.board
+        # Positions des entités : tuples mis en cache par le plateau jusqu'au prochain changement
+        return Observation(
+            hero.position, hero.hp, hero.max_hp, hero.force, hero.score, self.in_combat,
+            board.monster_positions, board.equipment_positions
+        )
+
+    def snapshot(self, with_rng: bool = False) -> Snapshot:
+        """
+        Capture l'état de la partie (bien plus rapide que copy.deepcopy).
+        with_rng=True capture aussi les dés de combat : restore() rejoue alors exactement
+        la même suite de combats (sinon les combats suivants restent aléatoires).
+        """
+        hero = self.hero
+        board = self.board
+        world = board.world_state()
+        if world is None:
+            monsters = tuple((monster.position, monster.hp) for monster in board.monsters)
+            equipments = tuple(
+                (equipment.position, equipment.weapon_type if isinstance(equipment, Weapon) else None)
+                for equipment in board.equipments
+            )
+        else:
+            monsters = equipments = ()  # Décrits par world
+        return Snapshot(
+            position=hero.position,
+            hp=hero.hp,
+            max_hp=hero.max_hp,
+            base_force=hero.base_force,
+            move_count=hero.move_count,
+            monsters_defeated=hero.monsters_defeated,
+            weapons=tuple((weapon.weapon_type, weapon.found_position) for weapon in hero.weapons),
+            monsters=monsters,
+            equipments=equipments,
+            combat_position=self.current_monster.position if self.in_combat and self.current_monster else None,
+            done=self.done,
+            won=self.won,
+            world=world,
+            seed=self.seed,
+            history=self.history,
+            rng_state=hero.rng.getstate() if with_rng else None
+        )
+
+    def restore(self, snapshot: Snapshot) -> Observation:
+        """Remet la partie dans l'état d'un snapshot et retourne l'observation correspondante"""
+        hero = self.hero
+        hero.position = snapshot.position
+        hero.hp = snapshot.hp
+        hero.max_hp = snapshot.max_hp
+        hero.base_force = snapshot.base_force
+        hero.move_count = snapshot.move_count
+        hero.monsters_defeated = snapshot.monsters_defeated
+        hero.clear_weapons()
+        for weapon_type, found_position in snapshot.weapons:
+            weapon = Weapon(None, weapon_type)
+            weapon.found_position = found_position
+            hero.add_weapon(weapon)
+        if snapshot.rng_state is not None:
+            hero.rng.setstate(snapshot.rng_state)
+
+        # Nouveaux objets : le snapshot reste intact quoi qu'il arrive ensuite à la partie
+        if snapshot.world is not None:
+            board = self.board_class.from_world_state(snapshot.world, rng=self.board.rng)
+        else:
+            board = self.board_class(generate=False, rng=self.board.rng)
+            for position, hp in snapshot.monsters:
+                monster = Monster(position)
+                monster.hp = hp
+                board.add_monster(monster)
+            for position, weapon_type in snapshot.equipments:
+                board.add_equipment(Potion(position) if weapon_type is None else Weapon(position, weapon_type))
+        self.board = board
+
+        self.current_monster = board.get_monster_at(snapshot.combat_position) if snapshot.combat_position else None
+        self.in_combat = self.current_monster is not None
+        self.done = snapshot.done
+        self.won = snapshot.won
+        self.seed = snapshot.seed
+        self.history = snapshot.history
+        return self.observe()
+
+    @property
+    def actions(self) -> Tuple[PlayerAction, ...]:
+        """Actions appliquées depuis reset (reconstruites à partir de l'historique chaîné)"""
+        return unroll(self.history)
+
+    def step(self, action: PlayerAction) -> StepResult:
+        """Applique une action du joueur et retourne ce qui s'est passé"""
+        result = StepResult(action=action)
+        if self.done:
+            result.done = True
+            result.won = self.won
+            return result
+
+        hero = self.hero
+        board = self.board
+        self.history = (self.history, action)
+
+        # Comparaisons par identité (membres d'Enum uniques) : évite Enum.__hash__, écrit en Python
+        if action is PlayerAction.QUIT:
+            self.done = True
+        elif action is PlayerAction.ATTACK:
+            if self.in_combat and self.current_monster:
+                # Attaque en combat
+                result.combat_result = hero.attack(self.current_monster)
+                if result.combat_result.monster_died:
+                    board.remove_monster(self.current_monster)
+                    self.in_combat = False
+                    self.current_monster = None
+        elif action in _MOVE_ACTIONS:
+            # Sortir du combat si on se déplace
+            self.in_combat = False
+            self.current_monster = None
+
+            hero.move(action, board.size)
+
+            # Vérification de collecte d'équipement
+            equipment = board.get_equipment_at(hero.position)
+            if equipment:
+                board.remove_equipment(equipment)
+                result.equipment_message = hero.use_equipment(equipment)
+
+            # Vérification de combat avec monstre
+            monster = board.get_monster_at(hero.position)
+            if monster:
+                # Entrer en combat
+                self.in_combat = True
+                self.current_monster = monster
+                result.combat_result = hero.attack(monster)
+                if result.combat_result.monster_died:
+                    board.remove_monster(monster)
+                    self.in_combat = False
+                    self.current_monster = None
+
+        # Conditions de fin de partie (hero.is_dead() et hero.has_won(), sans les appels)
+        if hero.hp <= 0:
+            self.done = True
+        elif hero.position == board.end_position:
+            self.done = True
+            self.won = True
+
+        result.done = self.done
+        result.won = self.won
+        return result
+
+
+if __name__ == "__main__":
+    print("ATTENTION: Ce fichier contient le moteur de jeu sans affichage.")
+    print("Pour lancer le jeu, exécutez : python controller.py")
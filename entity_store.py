@@ -0,0 +1,421 @@
+"""
+FICHIER OPTIONNEL - PAS INDISPENSABLE (nécessite numpy : pip install numpy)
+
+entity_store.py
+Stockage des entités du plateau en colonnes NumPy ("structure of arrays").
+
+Au lieu d'un objet Python par monstre ou équipement, chaque entité est une
+ligne de quelques colonnes (type, x, y, PV, type d'arme, présence), et deux
+grilles d'entiers donnent la ligne présente sur chaque case (recherche en O(1)).
+ArrayBoard expose ces lignes avec la même interface que Board : les monstres et
+équipements retournés sont des "vues" (StoredMonster, StoredPotion,
+StoredWeapon) sans __dict__, qui lisent et écrivent directement dans les
+colonnes. StoredPotion et StoredWeapon sont des Potion/Weapon, StoredMonster a
+les attributs d'un Monster : le moteur et les views du jeu n'ont rien à changer.
+
+ArrayBoard économise la mémoire des grands plateaux, pas le temps : sur le
+plateau 5x5 du jeu, chaque accès passe par NumPy et une partie reste plus lente
+qu'avec Board (voir la mesure en bas du fichier).
+
+Utilisation :
+    engine = GameEngine(board_class=ArrayBoard)
+"""
+from __future__ import annotations
+from typing import Dict, Iterator, Optional, Tuple
+import numpy as np
+from models import Board, Monster, Potion, Weapon, WeaponType
+from settings import GRID_SIZE, MONSTER_HP, MONSTER_SYMBOL, EQUIPMENT_SYMBOL
+
+# Valeurs de la colonne "kind"
+MONSTER, POTION, WEAPON = 0, 1, 2
+# Ordre fixe des types d'armes (la colonne weapon_type stocke un indice dans ce tuple)
+WEAPON_TYPES = tuple(WeaponType)
+_WEAPON_INDEX = {weapon_type: index for index, weapon_type in enumerate(WEAPON_TYPES)}
+
+
+class EntityStore:
+    """Colonnes NumPy des entités d'un plateau (une ligne par entité, jamais réutilisée)"""
+
+    def __init__(self, size: int = GRID_SIZE, capacity: int = 16):
+        self.size = size
+        self.count = 0  # Lignes utilisées
+        self.version = 0  # Incrémenté à chaque ajout, déplacement ou retrait (invalide les caches de positions)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.x = np.zeros(capacity, dtype=np.int32)          # -1 : entité sans position (arme équipée)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.hp = np.zeros(capacity, dtype=np.int16)
+        self.weapon_type = np.zeros(capacity, dtype=np.int8)  # Indice dans WEAPON_TYPES (-1 si pas une arme)
+        self.alive = np.zeros(capacity, dtype=bool)          # Encore sur le plateau
+        # Ligne présente sur chaque case (index x * size + y), -1 si aucune
+        self.monster_grid = np.full(size * size, -1, dtype=np.int32)
+        self.equipment_grid = np.full(size * size, -1, dtype=np.int32)
+
+    def _grid(self, kind: int) -> np.ndarray:
+        """Grille des monstres ou des équipements selon le type"""
+        return self.monster_grid if kind == MONSTER else self.equipment_grid
+
+    def _reserve(self, extra: int) -> None:
+        """Agrandit les colonnes (capacité doublée) pour extra lignes de plus"""
+        needed = self.count + extra
+        capacity = len(self.kind)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("kind", "x", "y", "hp", "weapon_type", "alive"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            setattr(self, name, grown)
+
+    def add(self, kind: int, position: Tuple[int, int], hp: int = 0, weapon_type: int = -1) -> int:
+        """Ajoute une entité sur le plateau et retourne sa ligne"""
+        self._reserve(1)
+        row = self.count
+        self.count += 1
+        x, y = position
+        self.kind[row] = kind
+        self.x[row] = x
+        self.y[row] = y
+        self.hp[row] = hp
+        self.weapon_type[row] = weapon_type
+        self.alive[row] = True
+        self._grid(kind)[x * self.size + y] = row
+        self.version += 1
+        return row
+
+    def add_many(self, kind: int, xs: np.ndarray, ys: np.ndarray, hp=0, weapon_types=-1) -> np.ndarray:
+        """Ajoute un lot d'entités d'un même type (vectorisé) et retourne leurs lignes"""
+        nb = len(xs)
+        self._reserve(nb)
+        rows = np.arange(self.count, self.count + nb)
+        self.count += nb
+        self.kind[rows] = kind
+        self.x[rows] = xs
+        self.y[rows] = ys
+        self.hp[rows] = hp
+        self.weapon_type[rows] = weapon_types
+        self.alive[rows] = True
+        self._grid(kind)[np.asarray(xs) * self.size + np.asarray(ys)] = rows
+        self.version += 1
+        return rows
+
+    def row_at(self, kind: int, position: Tuple[int, int]) -> int:
+        """Ligne du monstre (kind=MONSTER) ou de l'équipement présent sur la case, -1 si aucun"""
+        x, y = position
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            return -1
+        return int(self._grid(kind)[x * self.size + y])
+
+    def position(self, row: int) -> Optional[Tuple[int, int]]:
+        """Position (x, y) d'une ligne, None si elle n'en a plus"""
+        x = int(self.x[row])
+        return None if x < 0 else (x, int(self.y[row]))
+
+    def move(self, row: int, position: Optional[Tuple[int, int]]) -> None:
+        """Change la position d'une ligne (None : l'entité quitte le plateau)"""
+        self.version += 1
+        if self.alive[row]:
+            self._grid(self.kind[row])[self.x[row] * self.size + self.y[row]] = -1
+        if position is None:
+            self.alive[row] = False
+            self.x[row] = self.y[row] = -1
+            return
+        x, y = position
+        self.x[row] = x
+        self.y[row] = y
+        if self.alive[row]:
+            self._grid(self.kind[row])[x * self.size + y] = row
+
+    def remove(self, row: int) -> None:
+        """Retire une entité du plateau (sa ligne et sa position restent lisibles)"""
+        if self.alive[row]:
+            self._grid(self.kind[row])[self.x[row] * self.size + self.y[row]] = -1
+            self.alive[row] = False
+            self.version += 1
+
+    def rows(self, monsters: bool) -> np.ndarray:
+        """Lignes des monstres (ou des équipements) encore sur le plateau, dans l'ordre d'ajout"""
+        count = self.count
+        is_monster = self.kind[:count] == MONSTER
+        return np.flatnonzero(self.alive[:count] & (is_monster if monsters else ~is_monster))
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les colonnes et les grilles"""
+        return sum(getattr(self, name).nbytes for name in (
+            "kind", "x", "y", "hp", "weapon_type", "alive", "monster_grid", "equipment_grid"))
+
+
+class _StoredEntity:
+    """Position lue et écrite dans les colonnes (partagé par les vues)"""
+    __slots__ = ()
+
+    def __init__(self, store: EntityStore, row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def row(self) -> int:
+        """Ligne de l'entité dans l'EntityStore (pour les traitements vectorisés sur les colonnes)"""
+        return self._row
+
+    @property
+    def position(self):
+        """Position (x, y), None si l'entité n'en a plus"""
+        return self._store.position(self._row)
+
+    @position.setter
+    def position(self, value):
+        self._store.move(self._row, value)
+
+    @property
+    def x(self):
+        """Position X"""
+        x = int(self._store.x[self._row])
+        return None if x < 0 else x
+
+    @x.setter
+    def x(self, value):
+        self.position = (value, self.y)
+
+    @property
+    def y(self):
+        """Position Y"""
+        return None if self._store.x[self._row] < 0 else int(self._store.y[self._row])
+
+    @y.setter
+    def y(self, value):
+        self.position = (self.x, value)
+
+
+class StoredMonster(_StoredEntity):
+    """
+    Vue d'un monstre de l'EntityStore : mêmes attributs qu'un Monster, sans en hériter
+    (les slots position, symbol, hp et max_hp de Monster seraient inutilisés dans chaque vue)
+    """
+    __slots__ = ("_store", "_row")
+    symbol = MONSTER_SYMBOL
+    max_hp = MONSTER_HP
+
+    @property
+    def hp(self):
+        """PV restants du monstre"""
+        return int(self._store.hp[self._row])
+
+    @hp.setter
+    def hp(self, value):
+        self._store.hp[self._row] = value
+
+
+class StoredPotion(_StoredEntity, Potion):
+    """Vue d'une potion de l'EntityStore"""
+    __slots__ = ("_store", "_row")
+    symbol = EQUIPMENT_SYMBOL
+
+
+class StoredWeapon(_StoredEntity, Weapon):
+    """Vue d'une arme de l'EntityStore (found_position est gardée par la vue)"""
+    __slots__ = ("_store", "_row")
+    symbol = EQUIPMENT_SYMBOL
+
+    def __init__(self, store: EntityStore, row: int):
+        super().__init__(store, row)
+        self.found_position = None
+
+    @property
+    def weapon_type(self):
+        """Type de l'arme"""
+        return WEAPON_TYPES[self._store.weapon_type[self._row]]
+
+
+_VIEW_CLASSES = {MONSTER: StoredMonster, POTION: StoredPotion, WEAPON: StoredWeapon}
+
+
+class _StoredEntities:
+    """Monstres ou équipements d'un ArrayBoard, relus à chaque parcours (comme dict.values() pour Board)"""
+    __slots__ = ("_board", "_monsters")
+
+    def __init__(self, board: 'ArrayBoard', monsters: bool):
+        self._board = board
+        self._monsters = monsters
+
+    def __iter__(self) -> Iterator[_StoredEntity]:
+        return map(self._board._view, self._board.store.rows(self._monsters).tolist())
+
+    def __len__(self) -> int:
+        return len(self._board.store.rows(self._monsters))
+
+
+class ArrayBoard(Board):
+    """Board dont les entités sont stockées dans un EntityStore (même interface que Board)"""
+
+    def __init__(self, generate: bool = True, rng=None, size: int = GRID_SIZE):
+        self.store = EntityStore(size)
+        # Vues déjà créées, par ligne : une entité garde la même vue (identité stable
+        # pour le moteur et pour TkinterView, qui indexe les entités par id)
+        self._views: Dict[int, _StoredEntity] = {}
+        # Positions des monstres / des équipements : (store.version, tuple), recalculées après un changement
+        self._positions_cache: Dict[bool, Tuple[int, tuple]] = {}
+        super().__init__(generate=False, rng=rng)
+        self.size = size  # Lu par le générateur de positions à son premier tirage
+        if generate:
+            self.generate_monsters()
+            self.generate_equipments()
+
+    def _view(self, row: int):
+        """Vue (créée une seule fois) d'une ligne du store"""
+        view = self._views.get(row)
+        if view is None:
+            view = self._views[row] = _VIEW_CLASSES[int(self.store.kind[row])](self.store, row)
+        return view
+
+    @property
+    def monsters(self) -> _StoredEntities:
+        """Monstres encore sur la carte (vue en lecture, réutilisable)"""
+        return _StoredEntities(self, True)
+
+    @property
+    def equipments(self) -> _StoredEntities:
+        """Équipements encore sur la carte (vue en lecture, réutilisable)"""
+        return _StoredEntities(self, False)
+
+    def _positions(self, monsters: bool) -> Tuple[Tuple[int, int], ...]:
+        """Positions lues dans les colonnes, gardées tant que store.version ne change pas"""
+        store = self.store
+        cached = self._positions_cache.get(monsters)
+        if cached is not None and cached[0] == store.version:
+            return cached[1]
+        rows = store.rows(monsters)
+        positions = tuple(zip(store.x[rows].tolist(), store.y[rows].tolist()))
+        self._positions_cache[monsters] = (store.version, positions)
+        return positions
+
+    @property
+    def monster_positions(self) -> Tuple[Tuple[int, int], ...]:
+        """Positions des monstres (recalculées seulement après un ajout, un déplacement ou un retrait)"""
+        return self._positions(True)
+
+    @property
+    def equipment_positions(self) -> Tuple[Tuple[int, int], ...]:
+        """Positions des équipements (recalculées seulement après un ajout, un déplacement ou un retrait)"""
+        return self._positions(False)
+
+    def add_monster(self, monster):
+        """Place un monstre sur la carte (copié dans le store)"""
+        row = self.store.add(MONSTER, monster.position, hp=monster.hp)
+        self._record_change(row, 'monster', True, key=row)
+
+    def add_equipment(self, equipment):
+        """Place un équipement sur la carte (copié dans le store)"""
+        if isinstance(equipment, Weapon):
+            row = self.store.add(WEAPON, equipment.position, weapon_type=_WEAPON_INDEX[equipment.weapon_type])
+        else:
+            row = self.store.add(POTION, equipment.position)
+        self._record_change(row, 'equipment', True, key=row)
+
+    def monsters_moved(self, rows) -> None:
+        """Note les monstres déplacés directement dans le store (monster_ai.tick) pour l'affichage"""
+        if self._changes is None:
+            return
+        for row in rows.tolist():
+            self._record_change(row, 'monster', True, key=row)
+
+    def changes_since(self, version: int):
+        """Comme Board.changes_since (le journal est indexé par ligne, les vues créées à la lecture)"""
+        for entity, kind, present in super().changes_since(version):
+            yield (self._view(entity) if isinstance(entity, int) else entity), kind, present
+
+    def get_equipment_at(self, position):
+        """Retourne l'équipement à la position donnée, s'il y en a un"""
+        row = self.store.row_at(POTION, position)
+        return None if row < 0 else self._view(row)
+
+    def remove_equipment(self, equipment):
+        """Supprime un équipement de la carte (à appeler avant use_equipment, qui peut effacer sa position)"""
+        self._remove(POTION, equipment)
+
+    def get_monster_at(self, position):
+        """Retourne le monstre à la position donnée, s'il y en a un"""
+        row = self.store.row_at(MONSTER, position)
+        return None if row < 0 else self._view(row)
+
+    def remove_monster(self, monster):
+        """Supprime un monstre de la carte"""
+        self._remove(MONSTER, monster)
+
+    def _remove(self, kind: int, entity) -> None:
+        """Retire l'entité si c'est bien elle qui occupe sa case"""
+        if entity.position is None:
+            return
+        row = self.store.row_at(kind, entity.position)
+        if row >= 0 and self._views.get(row) is entity:
+            self.store.remove(row)
+            del self._views[row]  # La vue reste utilisable par ceux qui la détiennent
+            self._record_change(entity, 'monster' if kind == MONSTER else 'equipment', False, key=row)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import tracemalloc
+    from engine import GameEngine
+    from simulator import direct_policy
+
+    def deep_size(entity) -> int:
+        """Taille d'une entité objet et de ses attributs propres (tuple de position, compteurs)"""
+        size = sys.getsizeof(entity)
+        if isinstance(entity.position, tuple):
+            size += sys.getsizeof(entity.position)
+        return size
+
+    # Mémoire par entité sur un grand plateau (1000x1000, une entité sur 4 cases)
+    size = 1000
+    rng = np.random.default_rng(0)
+    cells = rng.choice(size * size, size * size // 4, replace=False)
+    xs, ys = np.divmod(cells, size)
+    nb_entities = len(cells)
+    kinds = rng.integers(0, 3, nb_entities)
+
+    tracemalloc.start()
+    board = Board(generate=False)
+    board.size = size
+    for x, y, kind in zip(xs.tolist(), ys.tolist(), kinds.tolist()):
+        if kind == MONSTER:
+            board.add_monster(Monster((x, y)))
+        elif kind == POTION:
+            board.add_equipment(Potion((x, y)))
+        else:
+            board.add_equipment(Weapon((x, y), WEAPON_TYPES[x % len(WEAPON_TYPES)]))
+    objects_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    store = EntityStore(size, capacity=nb_entities)
+    for kind in (MONSTER, POTION, WEAPON):
+        selected = kinds == kind
+        store.add_many(kind, xs[selected], ys[selected], hp=MONSTER_HP if kind == MONSTER else 0,
+                       weapon_types=xs[selected] % len(WEAPON_TYPES) if kind == WEAPON else -1)
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{nb_entities} entités sur {size}x{size} cases :")
+    print(f"  objets Python (__slots__) + index dict : {objects_bytes / nb_entities:.1f} octets/entité")
+    print(f"  EntityStore (colonnes + grilles)       : {store_bytes / nb_entities:.1f} octets/entité"
+          f" (dont colonnes seules : {sum(c.nbytes for c in (store.kind, store.x, store.y, store.hp, store.weapon_type, store.alive)) / nb_entities:.1f})")
+    print(f"  Monster seul : {deep_size(Monster((1, 1)))} octets | vue StoredMonster : "
+          f"{sys.getsizeof(StoredMonster(store, 0))} octets (créée à la demande)")
+
+    # Les deux plateaux donnent exactement les mêmes parties
+    for board_class in (Board, ArrayBoard):
+        engine = GameEngine(seed=0, board_class=board_class)
+        total = 0
+        start_time = time.perf_counter()
+        for game in range(2000):
+            if game:
+                engine.reset()
+            while not engine.done:
+                engine.step(direct_policy(engine.observe()))
+            total += engine.hero.score
+        elapsed = time.perf_counter() - start_time
+        print(f"{board_class.__name__:>10} : score total {total} | {2000 / elapsed:.0f} parties/s")
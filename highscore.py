@@ -14,12 +14,43 @@ POUR LANCER LE JEU DE BASE :
 """
 from pathlib import Path
 import json
+import os
+import sqlite3
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from engine import settings_hash
+from replay import verify_many
+from settings import HIGHSCORE_BACKEND, HIGHSCORE_COMPACT_EVERY
+
+# Verrous consultatifs entre processus : fcntl (Linux/Mac) ou msvcrt (Windows)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
 
 class HighScoreManager:
-    """Gestionnaire moderne des scores avec sauvegarde persistante"""
+    """
+    Gestionnaire moderne des scores avec sauvegarde persistante.
+    
+    Chaque partie est AJOUTÉE en une ligne compacte à un journal
+    (highscores.journal.<génération>) sous verrou : écriture en O(1) et
+    aucune mise à jour perdue quand plusieurs processus enregistrent en même temps.
+    Le résumé highscores.json est reconstruit périodiquement (compactage) à partir
+    du journal ; il indique la génération du journal qui le complète.
+    
+    Les données restent en mémoire : le résumé n'est relu que si sa date de
+    modification ou sa taille a changé, et seule la fin du journal est lue.
+    Utiliser `with manager.batch():` pour enregistrer plusieurs parties en une seule écriture.
+    """
     
     def __init__(self):
         # Dossier de données utilisateur (standard moderne)
@@ -27,19 +58,143 @@ class HighScoreManager:
         # self.data_dir = Path.home() / ".aventurier_game"
         self.data_dir = Path(__file__).parent
         self.score_file = self.data_dir / "highscores.json"
+        self.lock_file = self.data_dir / "highscores.lock"
         self.data_dir.mkdir(exist_ok=True)
+        
+        # Cache en mémoire : résumé (valide tant que son (mtime, taille) ne change pas)
+        # + lignes du journal déjà lues jusqu'à _journal_offset
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_signature: Optional[Tuple[int, int]] = None
+        self._journal_offset = 0
+        self._journal_entries = 0   # Lignes du journal courant (déclenche le compactage)
+        
+        self._pending_lines: List[str] = []  # Parties en attente d'écriture (batch)
+        self._pending_best = None            # Meilleur score parmi les parties en attente
+        self._batch_depth = 0                # > 0 : écritures différées jusqu'à la fin du batch
+        
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
     
-    def load_data(self) -> Dict[str, Any]:
-        """Charge les données de score depuis le fichier JSON"""
+    # --- Verrou entre processus ---
+    
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Verrou consultatif sur highscores.lock (partagé en lecture, exclusif en écriture), réentrant"""
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        
         try:
-            if self.score_file.exists():
-                # read_text() utilise automatiquement un context manager (with open)
-                return json.loads(self.score_file.read_text(encoding='utf-8'))
-            return self._get_default_data()
+            if self._lock_fd is None:
+                self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            elif msvcrt:
+                # msvcrt ne connaît que les verrous exclusifs (sur le premier octet)
+                os.lseek(self._lock_fd, 0, os.SEEK_SET)
+                while True:
+                    try:
+                        msvcrt.locking(self._lock_fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+        except OSError:
+            # Verrou impossible (dossier en lecture seule...) : continuer sans
+            yield
+            return
+        
+        self._lock_depth = 1
+        try:
+            yield
+        finally:
+            self._lock_depth = 0
+            if fcntl:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            elif msvcrt:
+                os.lseek(self._lock_fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._lock_fd, msvcrt.LK_UNLCK, 1)
+    
+    # --- Lecture : résumé + journal ---
+    
+    def _journal_file(self, generation: int) -> Path:
+        """Journal qui complète le résumé de la génération donnée"""
+        return self.data_dir / f"highscores.journal.{generation}"
+    
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """(date de modification en ns, taille) du résumé, ou None s'il n'existe pas"""
+        try:
+            stat = self.score_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _sync(self) -> Dict[str, Any]:
+        """Met le cache à jour (à appeler sous verrou) : résumé si modifié, puis fin du journal"""
+        signature = self._file_signature()
+        if self._cache is None or signature != self._cache_signature:
+            self._cache = self._read_file() if signature else self._get_default_data()
+            self._cache_signature = signature
+            self._journal_offset = 0
+            self._journal_entries = 0
+        
+        journal = self._journal_file(self._cache.get("journal_generation", 0))
+        try:
+            with open(journal, "rb") as journal_file:
+                journal_file.seek(self._journal_offset)
+                chunk = journal_file.read()
+        except OSError:
+            return self._cache
+        
+        # Ignorer une éventuelle dernière ligne incomplète (écriture interrompue)
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            self._apply_entry(line)
+        self._journal_offset += end
+        return self._cache
+    
+    def _apply_entry(self, line: bytes) -> None:
+        """Ajoute au cache une ligne du journal : 'score monstres déplacements timestamp'"""
+        try:
+            score, monsters_defeated, moves, timestamp = line.split()
+            score, monsters_defeated, moves = int(score), int(monsters_defeated), int(moves)
+            timestamp = float(timestamp)
+        except ValueError:
+            return  # Ligne corrompue : ignorée
+        
+        data = self._cache
+        # Vérifier si c'est un nouveau record
+        if score > data["best_score"]:
+            data["best_score"] = score
+            data["best_score_date"] = datetime.fromtimestamp(timestamp).isoformat()
+        
+        # Mettre à jour les statistiques globales
+        data["games_played"] += 1
+        data["total_monsters_defeated"] += monsters_defeated
+        data["total_moves"] += moves
+        self._journal_entries += 1
+    
+    def _data(self) -> Dict[str, Any]:
+        """Données à jour (résumé + journal), lues sous verrou partagé"""
+        with self._locked(exclusive=False):
+            return self._sync()
+    
+    def _read_file(self) -> Dict[str, Any]:
+        """Lit et parse le fichier JSON"""
+        try:
+            # read_text() utilise automatiquement un context manager (with open)
+            return json.loads(self.score_file.read_text(encoding='utf-8'))
         except (json.JSONDecodeError, OSError):
             # En cas d'erreur, retourner les données par défaut
             return self._get_default_data()
     
+    def load_data(self) -> Dict[str, Any]:
+        """Charge les données de score (copie du cache, relu seulement si les fichiers ont changé)"""
+        return dict(self._data())
+    
     def _get_default_data(self) -> Dict[str, Any]:
         """Retourne la structure de données par défaut"""
         return {
@@ -47,54 +202,131 @@ class HighScoreManager:
             "best_score_date": None,
             "games_played": 0,
             "total_monsters_defeated": 0,
-            "total_moves": 0
+            "total_moves": 0,
+            "journal_generation": 0
         }
     
+    # --- Écriture ---
+    
     def save_data(self, data: Dict[str, Any]) -> None:
-        """Sauvegarde les données dans le fichier JSON"""
+        """
+        Sauvegarde atomique du résumé (fichier temporaire puis renommage).
+        Le résumé sauvegardé remplace le journal courant, qui est ensuite supprimé.
+        """
+        with self._locked(exclusive=True):
+            old_generation = self._sync().get("journal_generation", 0)
+            data = dict(data, journal_generation=old_generation + 1)
+            temp_path = None
+            try:
+                fd, temp_path = tempfile.mkstemp(dir=self.data_dir, prefix=".highscores-", suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                    json.dump(data, temp_file, ensure_ascii=False, separators=(",", ":"))
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
+                # mkstemp crée le fichier en 0600 : reprendre les droits du résumé remplacé
+                os.chmod(temp_path, self._score_file_mode())
+                # os.replace est atomique : un crash laisse l'ancien ou le nouveau résumé, jamais un mélange.
+                # L'ancien journal n'est plus lu dès que le nouveau résumé (génération + 1) est en place.
+                os.replace(temp_path, self.score_file)
+                temp_path = None
+                self._cache = data
+                self._cache_signature = self._file_signature()
+                self._journal_offset = 0
+                self._journal_entries = 0
+                self._journal_file(old_generation).unlink(missing_ok=True)
+            except OSError:
+                # Si la sauvegarde échoue, continuer silencieusement
+                # TODO intéressant : logger l'erreur lorsque logging implémenté
+                if temp_path:
+                    try:
+                        os.unlink(temp_path)
+                    except OSError:
+                        pass
+    
+    def _score_file_mode(self) -> int:
+        """Droits du résumé actuel, ou ceux d'un nouveau fichier (0o666 moins le umask)"""
         try:
-            # write_text() utilise automatiquement un context manager (with open)
-            self.score_file.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False), 
-                encoding='utf-8'
-            )
+            return stat.S_IMODE(self.score_file.stat().st_mode)
         except OSError:
-            # Si la sauvegarde échoue, continuer silencieusement
-            # TODO intéressant : logger l'erreur lorsque logging implémenté
-            pass
+            umask = os.umask(0)  # Seul moyen de lire le umask : le remettre aussitôt
+            os.umask(umask)
+            return 0o666 & ~umask
+    
+    def compact(self) -> None:
+        """Intègre le journal au résumé highscores.json et repart d'un journal vide"""
+        with self._locked(exclusive=True):
+            self.save_data(self._sync())
+    
+    def flush(self) -> None:
+        """Ajoute au journal les parties en attente (une seule écriture pour tout le batch)"""
+        if not self._pending_lines:
+            return
+        lines = "".join(self._pending_lines).encode("utf-8")
+        self._pending_lines.clear()
+        self._pending_best = None
+        
+        with self._locked(exclusive=True):
+            data = self._sync()
+            try:
+                # Mode ajout : O(1), sans relire ni réécrire les parties précédentes
+                with open(self._journal_file(data.get("journal_generation", 0)), "ab") as journal_file:
+                    # Dernière ligne incomplète (écriture interrompue) : la retirer avant d'ajouter,
+                    # sinon notre première ligne y serait collée et perdue. _sync vient de lire
+                    # le journal jusqu'à sa dernière fin de ligne (_journal_offset).
+                    if journal_file.seek(0, os.SEEK_END) > self._journal_offset:
+                        journal_file.truncate(self._journal_offset)
+                    journal_file.write(lines)
+            except OSError:
+                # Si la sauvegarde échoue, continuer silencieusement
+                return
+            self._sync()  # Relit nos propres lignes : chaque partie n'est comptée qu'une fois
+            if self._journal_entries >= HIGHSCORE_COMPACT_EVERY:
+                self.compact()
+    
+    @contextmanager
+    def batch(self) -> Iterator['HighScoreManager']:
+        """Regroupe plusieurs update_stats en une seule écriture à la sortie du bloc"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
     
     def get_best_score(self) -> int:
         """Retourne le meilleur score actuel"""
-        return self.load_data()["best_score"]
+        return self._data()["best_score"]
     
-    def update_stats(self, score: int, monsters_defeated: int, moves: int) -> tuple[bool, int]:
+    def update_stats(self, score: int, monsters_defeated: int, moves: int,
+                     hp: Optional[int] = None, seed: Optional[int] = None,
+                     replay: Optional[bytes] = None) -> tuple[bool, int]:
         """
         Met à jour les statistiques avec une nouvelle partie.
         Retourne (is_new_record, ancien_record).
+        (hp, seed et replay ne sont conservés que par SQLiteHighScoreManager)
         """
-        data = self.load_data()
-        old_best_score = data["best_score"]
-        is_new_record = False
-        
-        # Vérifier si c'est un nouveau record
-        if score > data["best_score"]:
-            data["best_score"] = score
-            data["best_score_date"] = datetime.now().isoformat()
-            is_new_record = True
+        line = f"{score} {monsters_defeated} {moves} {time.time():.3f}\n"
         
-        # Mettre à jour les statistiques globales
-        data["games_played"] += 1
-        data["total_monsters_defeated"] += monsters_defeated
-        data["total_moves"] += moves
+        if self._batch_depth:
+            # Dans un batch : comparer à l'état connu + parties en attente, écrire à la fin
+            old_best_score = self._data()["best_score"]
+            if self._pending_best is not None:
+                old_best_score = max(old_best_score, self._pending_best)
+            self._pending_lines.append(line)
+            self._pending_best = max(score, old_best_score)
+            return score > old_best_score, old_best_score
         
-        # Sauvegarder
-        self.save_data(data)
-        
-        return is_new_record, old_best_score
+        # Lecture du record et ajout au journal sous le même verrou exclusif
+        with self._locked(exclusive=True):
+            old_best_score = self._sync()["best_score"]
+            self._pending_lines.append(line)
+            self.flush()
+        return score > old_best_score, old_best_score
     
     def get_stats_summary(self) -> Dict[str, Any]:
         """Retourne un résumé des statistiques pour affichage"""
-        data = self.load_data()
+        data = self._data()
         
         # Calculer les moyennes si on a joué des parties
         games_played = data["games_played"]
@@ -114,6 +346,237 @@ class HighScoreManager:
         }
 
 
+class SQLiteHighScoreManager:
+    """
+    Stockage SQLite des scores : une ligne par partie jouée.
+    
+    Même interface que HighScoreManager, plus des requêtes de classement
+    (top K, percentiles, distribution) par profil de configuration et un
+    audit des scores par rejeu des parties (replay.py).
+    Un histogramme des scores et les totaux par profil sont tenus à jour
+    dans la même transaction que les insertions : résumé et percentiles
+    restent rapides avec des dizaines de millions de lignes.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY,
+            score INTEGER NOT NULL,
+            monsters_defeated INTEGER NOT NULL,
+            moves INTEGER NOT NULL,
+            hp INTEGER,
+            seed INTEGER,
+            played_at REAL NOT NULL,
+            settings_hash TEXT NOT NULL,
+            replay BLOB
+        );
+        CREATE INDEX IF NOT EXISTS idx_games_score ON games (settings_hash, score DESC);
+        CREATE INDEX IF NOT EXISTS idx_games_played_at ON games (settings_hash, played_at);
+        
+        CREATE TABLE IF NOT EXISTS score_counts (
+            settings_hash TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            games INTEGER NOT NULL,
+            PRIMARY KEY (settings_hash, score)
+        ) WITHOUT ROWID;
+        
+        CREATE TABLE IF NOT EXISTS totals (
+            settings_hash TEXT PRIMARY KEY,
+            games INTEGER NOT NULL,
+            monsters_defeated INTEGER NOT NULL,
+            moves INTEGER NOT NULL
+        ) WITHOUT ROWID;
+
+    """
+    
+    # Au-delà de ce nombre de parties dans la fenêtre, top_scores parcourt l'index par score
+    SMALL_WINDOW_GAMES = 50_000
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        self.data_dir = Path(__file__).parent
+        self.db_file = Path(db_path) if db_path else self.data_dir / "highscores.sqlite3"
+        self.settings_hash = settings_hash()
+        
+        # isolation_level=None : transactions gérées explicitement (voir batch())
+        self.connection = sqlite3.connect(str(self.db_file), isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self.SCHEMA)
+        # Bases créées avant l'ajout des replays
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(games)")}
+        if "replay" not in columns:
+            self.connection.execute("ALTER TABLE games ADD COLUMN replay BLOB")
+        self._batch_depth = 0
+    
+    def close(self) -> None:
+        """Ferme la connexion à la base"""
+        self.connection.close()
+    
+    @contextmanager
+    def batch(self) -> Iterator['SQLiteHighScoreManager']:
+        """Regroupe plusieurs enregistrements dans une seule transaction"""
+        if self._batch_depth == 0:
+            self.connection.execute("BEGIN")
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.connection.execute("COMMIT")
+    
+    def flush(self) -> None:
+        """Compatibilité avec HighScoreManager (chaque transaction est déjà écrite)"""
+    
+    def record_games(self, games: Iterable[Tuple[int, int, int, Optional[int], Optional[int], Optional[bytes]]]) -> None:
+        """Insère en masse des parties (score, monstres, déplacements, PV, graine, replay) en une transaction"""
+        now = time.time()
+        profile = self.settings_hash
+        score_counts: Dict[int, int] = {}
+        totals = [0, 0, 0]  # parties, monstres, déplacements
+        
+        def rows():
+            # Agrège histogramme et totaux au passage (une seule lecture de `games`)
+            for score, monsters_defeated, moves, hp, seed, replay in games:
+                score_counts[score] = score_counts.get(score, 0) + 1
+                totals[0] += 1
+                totals[1] += monsters_defeated
+                totals[2] += moves
+                yield score, monsters_defeated, moves, hp, seed, replay, now, profile
+        
+        with self.batch():
+            self.connection.executemany(
+                "INSERT INTO games (score, monsters_defeated, moves, hp, seed, replay, played_at, settings_hash)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows()
+            )
+            self.connection.executemany(
+                "INSERT INTO score_counts (settings_hash, score, games) VALUES (?, ?, ?)"
+                " ON CONFLICT (settings_hash, score) DO UPDATE SET games = games + excluded.games",
+                ((profile, score, count) for score, count in score_counts.items())
+            )
+            if totals[0]:
+                self.connection.execute(
+                    "INSERT INTO totals (settings_hash, games, monsters_defeated, moves) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (settings_hash) DO UPDATE SET"
+                    " games = games + excluded.games,"
+                    " monsters_defeated = monsters_defeated + excluded.monsters_defeated,"
+                    " moves = moves + excluded.moves",
+                    (profile, *totals)
+                )
+    
+    def get_best_score(self, profile: Optional[str] = None) -> int:
+        """Retourne le meilleur score du profil (configuration actuelle par défaut)"""
+        row = self.connection.execute(
+            "SELECT MAX(score) FROM score_counts WHERE settings_hash = ?",
+            (profile or self.settings_hash,)
+        ).fetchone()
+        return row[0] if row[0] is not None else 0
+    
+    def update_stats(self, score: int, monsters_defeated: int, moves: int,
+                     hp: Optional[int] = None, seed: Optional[int] = None,
+                     replay: Optional[bytes] = None) -> tuple[bool, int]:
+        """
+        Enregistre une nouvelle partie (replay : voir replay.py, pour audit()).
+        Retourne (is_new_record, ancien_record).
+        """
+        old_best_score = self.get_best_score()
+        self.record_games([(score, monsters_defeated, moves, hp, seed, replay)])
+        return score > old_best_score, old_best_score
+    
+    def audit(self, min_score: Optional[int] = None, profile: Optional[str] = None) -> List[int]:
+        """
+        Rejoue les parties enregistrées avec un replay (éventuellement à partir d'un score)
+        et retourne les id de celles dont le score n'est pas reproduit.
+        """
+        query = "SELECT id, replay, score FROM games WHERE settings_hash = ? AND replay IS NOT NULL"
+        params: list = [profile or self.settings_hash]
+        if min_score is not None:
+            query += " AND score >= ?"
+            params.append(min_score)
+        rows = self.connection.execute(query, params).fetchall()
+        return [rows[index][0] for index in verify_many((replay, score) for _, replay, score in rows)]
+    
+    def get_stats_summary(self, profile: Optional[str] = None) -> Dict[str, Any]:
+        """Retourne un résumé des statistiques pour affichage"""
+        profile = profile or self.settings_hash
+        totals = self.connection.execute(
+            "SELECT games, monsters_defeated, moves FROM totals WHERE settings_hash = ?",
+            (profile,)
+        ).fetchone() or (0, 0, 0)
+        games_played, total_monsters, total_moves = totals
+        
+        # Date du meilleur score : première ligne de l'index (settings_hash, score DESC)
+        best = self.connection.execute(
+            "SELECT score, played_at FROM games WHERE settings_hash = ? ORDER BY score DESC LIMIT 1",
+            (profile,)
+        ).fetchone()
+        
+        return {
+            "best_score": best[0] if best else 0,
+            "best_score_date": datetime.fromtimestamp(best[1]).isoformat() if best else None,
+            "games_played": games_played,
+            "avg_monsters_per_game": round(total_monsters / games_played, 1) if games_played else 0,
+            "avg_moves_per_game": round(total_moves / games_played, 1) if games_played else 0
+        }
+    
+    def top_scores(self, limit: int = 100, since: Optional[float] = None,
+                   profile: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Les `limit` meilleures parties du profil, éventuellement depuis un timestamp (ex: 7 derniers jours)"""
+        profile = profile or self.settings_hash
+        columns = "score, monsters_defeated, moves, hp, seed, played_at"
+        if since is None:
+            query = f"SELECT {columns} FROM games WHERE settings_hash = ? ORDER BY score DESC, id LIMIT ?"
+            params: list = [profile, limit]
+        else:
+            # Fenêtre courte : trier ses parties (index par date). Fenêtre large : parcourir
+            # l'index par score jusqu'à trouver `limit` parties récentes. Le comptage est borné.
+            recent_games = self.connection.execute(
+                "SELECT COUNT(*) FROM (SELECT 1 FROM games INDEXED BY idx_games_played_at"
+                " WHERE settings_hash = ? AND played_at >= ? LIMIT ?)",
+                (profile, since, self.SMALL_WINDOW_GAMES)
+            ).fetchone()[0]
+            index = "idx_games_played_at" if recent_games < self.SMALL_WINDOW_GAMES else "idx_games_score"
+            query = (f"SELECT {columns} FROM games INDEXED BY {index}"
+                     " WHERE settings_hash = ? AND played_at >= ? ORDER BY score DESC, id LIMIT ?")
+            params = [profile, since, limit]
+        names = ("score", "monsters_defeated", "moves", "hp", "seed", "played_at")
+        return [dict(zip(names, row)) for row in self.connection.execute(query, params)]
+    
+    def score_distribution(self, profile: Optional[str] = None) -> Dict[int, int]:
+        """Nombre de parties par score (lu dans l'histogramme, sans parcourir les parties)"""
+        return dict(self.connection.execute(
+            "SELECT score, games FROM score_counts WHERE settings_hash = ? ORDER BY score",
+            (profile or self.settings_hash,)
+        ))
+    
+    def score_percentile(self, percentile: float, profile: Optional[str] = None) -> Optional[int]:
+        """Score au percentile donné (rang le plus proche), ou None s'il n'y a aucune partie"""
+        distribution = self.score_distribution(profile)
+        total = sum(distribution.values())
+        if total == 0:
+            return None
+        rank = max(1, -(-total * percentile // 100))  # Plafond de total * p / 100
+        cumulative = 0
+        for score, games in distribution.items():
+            cumulative += games
+            if cumulative >= rank:
+                return score
+        return score
+
+
+def create_highscore_manager(backend: str = HIGHSCORE_BACKEND):
+    """Crée le gestionnaire de scores correspondant à HIGHSCORE_BACKEND ("json" ou "sqlite")"""
+    if backend == "sqlite":
+        return SQLiteHighScoreManager()
+    return HighScoreManager()
+
+
 if __name__ == "__main__":
     print("ATTENTION: Ce fichier gère la sauvegarde des scores.")
     print("Pour lancer le jeu, exécutez : python controller.py")
\ No newline at end of file
@@ -0,0 +1,278 @@
+"""
+mcts.py
+Joueur par recherche arborescente Monte Carlo (MCTS).
+
+À chaque coup, le joueur simule des milliers de suites de partie à partir de
+l'état courant (GameEngine.snapshot) sur son propre moteur : les dés de la
+vraie partie ne sont jamais consommés, les replays restent donc valides.
+    - sélection : UCB1 sur les statistiques de chaque action
+    - expansion : un nouvel état par simulation
+    - simulation : fin de partie jouée "tout droit" (attaque en combat, sinon
+      vers l'arrivée)
+    - rétropropagation : le score final de la partie simulée
+Les combats sont aléatoires : les états sont rangés dans une table de
+transpositions indexée par Snapshot (un même état atteint par deux chemins
+partage ses statistiques). Chaque action change l'état (déplacement, PV du
+héros ou du monstre), le graphe des états est donc sans cycle.
+
+Parallélisme à la racine : avec workers > 1, chaque processus fait sa propre
+recherche et les nombres de visites des actions de la racine sont additionnés.
+
+Utilisation :
+    player = MCTSPlayer(iterations=1000)
+    while not engine.done:
+        engine.step(player.choose(engine))
+"""
+from __future__ import annotations
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from engine import GameEngine, Snapshot
+from rng import GameRNG, derive_seed
+from settings import (
+    SIM_MAX_STEPS,
+    MCTS_ITERATIONS, MCTS_EXPLORATION, MCTS_WORKERS, MCTS_MAX_TABLE_SIZE,
+    PlayerAction
+)
+
+# (action, dx, dy) des déplacements
+_MOVES = (
+    (PlayerAction.MOVE_UP, 0, -1), (PlayerAction.MOVE_DOWN, 0, 1),
+    (PlayerAction.MOVE_LEFT, -1, 0), (PlayerAction.MOVE_RIGHT, 1, 0)
+)
+
+
+@dataclass
+class SearchStats:
+    """Mesures de la dernière recherche (suivi du débit)"""
+    iterations: int = 0
+    nodes: int = 0          # Nouveaux états ajoutés à la table
+    elapsed: float = 0.0    # Secondes (temps mur, tous processus confondus)
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Débit de la recherche en états créés par seconde"""
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def iterations_per_second(self) -> float:
+        """Débit de la recherche en simulations par seconde"""
+        return self.iterations / self.elapsed if self.elapsed else 0.0
+
+
+class _Node:
+    """Statistiques d'un état : visites et score total de chaque action jouable"""
+    __slots__ = ("actions", "visits", "edge_visits", "edge_totals")
+
+    def __init__(self, actions: Tuple[PlayerAction, ...]):
+        self.actions = actions
+        self.visits = 0
+        self.edge_visits = [0] * len(actions)
+        self.edge_totals = [0.0] * len(actions)
+
+
+def _legal_actions(engine: GameEngine) -> Tuple[PlayerAction, ...]:
+    """Actions qui changent l'état : déplacements hors murs, et ATTACK en combat"""
+    x, y = engine.hero.position
+    size = engine.board.size
+    actions = tuple(action for action, dx, dy in _MOVES
+                    if 0 <= x + dx < size and 0 <= y + dy < size)
+    if engine.in_combat:
+        actions = (PlayerAction.ATTACK,) + actions
+    return actions
+
+
+def _rollout(engine: GameEngine) -> int:
+    """Termine la partie "tout droit" et retourne le score final"""
+    hero = engine.hero
+    step = engine.step
+    end_x, end_y = engine.board.end_position
+    for _ in range(SIM_MAX_STEPS):
+        if engine.done:
+            break
+        if engine.in_combat:
+            step(PlayerAction.ATTACK)
+        elif hero.position[0] < end_x:
+            step(PlayerAction.MOVE_RIGHT)
+        elif hero.position[0] > end_x:
+            step(PlayerAction.MOVE_LEFT)
+        elif hero.position[1] < end_y:
+            step(PlayerAction.MOVE_DOWN)
+        else:
+            step(PlayerAction.MOVE_UP)
+    return hero.score
+
+
+class MCTSPlayer:
+    """Choisit chaque action par MCTS (budget en simulations ou en secondes par coup)"""
+
+    def __init__(self, iterations: int = MCTS_ITERATIONS, time_budget: Optional[float] = None,
+                 workers: int = MCTS_WORKERS, exploration: float = MCTS_EXPLORATION,
+                 seed: Optional[int] = None):
+        self.iterations = iterations
+        self.time_budget = time_budget  # Secondes par coup (prioritaire sur iterations)
+        self.workers = workers
+        self.exploration = exploration
+        self.last_stats = SearchStats()
+        self._rng = GameRNG(seed)  # Graines des recherches (dés simulés, processus)
+        self._engine = GameEngine(seed=self._rng.getrandbits(32))  # Moteur privé de la recherche
+        self._table: Dict[Snapshot, _Node] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def choose(self, engine: GameEngine) -> PlayerAction:
+        """Retourne l'action à jouer dans l'état courant du moteur"""
+        root = engine.snapshot()
+        seed = self._rng.getrandbits(32)
+        if self.workers <= 1:
+            visits, stats = self.search(root, seed)
+        else:
+            visits, stats = self._parallel_search(root, seed)
+        self.last_stats = stats
+        if not visits:
+            return PlayerAction.QUIT  # Partie terminée : plus rien à jouer
+        return max(visits, key=visits.get)
+
+    def search(self, root: Snapshot, seed: Optional[int] = None) -> Tuple[Dict[PlayerAction, int], SearchStats]:
+        """Recherche depuis un état et retourne (visites de chaque action de la racine, mesures)"""
+        engine = self._engine
+        if seed is not None:
+            engine.hero.rng = GameRNG(seed)  # restore() garde le héros et donc ses dés
+        table = self._table
+        if root not in table or len(table) > MCTS_MAX_TABLE_SIZE:
+            table.clear()  # Nouvelle partie (ou table pleine) : les anciens états ne servent plus
+        engine.restore(root)
+        if engine.done:
+            return {}, SearchStats()
+        if root not in table:
+            table[root] = _Node(_legal_actions(engine))
+        root_node = table[root]
+
+        exploration = self.exploration
+        stats = SearchStats()
+        start_time = time.perf_counter()
+        deadline = start_time + self.time_budget if self.time_budget else None
+        while deadline is not None or stats.iterations < self.iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            engine.restore(root)
+            node = root_node
+            path: List[Tuple[_Node, int]] = []
+            # Sélection : descendre tant que l'état est déjà connu
+            while True:
+                log_visits = math.log(node.visits + 1)
+                best_index, best_value = 0, -math.inf
+                for index, count in enumerate(node.edge_visits):
+                    if count == 0:
+                        best_index = index
+                        break
+                    value = (node.edge_totals[index] / count
+                             + exploration * math.sqrt(log_visits / count))
+                    if value > best_value:
+                        best_index, best_value = index, value
+                path.append((node, best_index))
+                engine.step(node.actions[best_index])
+                if engine.done:
+                    reward = engine.hero.score
+                    break
+                state = engine.snapshot()
+                child = table.get(state)
+                if child is None:
+                    # Expansion puis simulation jusqu'à la fin de partie
+                    table[state] = _Node(_legal_actions(engine))
+                    stats.nodes += 1
+                    reward = _rollout(engine)
+                    break
+                node = child
+            # Rétropropagation
+            for node, index in path:
+                node.visits += 1
+                node.edge_visits[index] += 1
+                node.edge_totals[index] += reward
+            stats.iterations += 1
+        stats.elapsed = time.perf_counter() - start_time
+        return dict(zip(root_node.actions, root_node.edge_visits)), stats
+
+    def _parallel_search(self, root: Snapshot, seed: int) -> Tuple[Dict[PlayerAction, int], SearchStats]:
+        """Parallélisme à la racine : une recherche par processus, visites additionnées"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        start_time = time.perf_counter()
+        futures = [
+            self._executor.submit(_search_worker, root, self.iterations, self.time_budget,
+                                  self.exploration, derive_seed(seed, "worker", worker))
+            for worker in range(self.workers)
+        ]
+        visits: Dict[PlayerAction, int] = {}
+        stats = SearchStats()
+        for future in futures:
+            worker_visits, worker_stats = future.result()
+            for action, count in worker_visits.items():
+                visits[action] = visits.get(action, 0) + count
+            stats.iterations += worker_stats.iterations
+            stats.nodes += worker_stats.nodes
+        stats.elapsed = time.perf_counter() - start_time
+        return visits, stats
+
+    def close(self) -> None:
+        """Arrête les processus de recherche (workers > 1)"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+_worker_player: Optional[MCTSPlayer] = None
+
+
+def _search_worker(root: Snapshot, iterations: int, time_budget: Optional[float],
+                   exploration: float, seed: int) -> Tuple[Dict[PlayerAction, int], SearchStats]:
+    """Recherche dans un processus (un MCTSPlayer par processus, table gardée entre les coups)"""
+    global _worker_player
+    if _worker_player is None:
+        _worker_player = MCTSPlayer(workers=1)
+    _worker_player.iterations = iterations
+    _worker_player.time_budget = time_budget
+    _worker_player.exploration = exploration
+    return _worker_player.search(root, seed)
+
+
+if __name__ == "__main__":
+    import argparse
+    from simulator import SimulationStats, direct_policy
+
+    parser = argparse.ArgumentParser(description="Compare le joueur MCTS à la politique directe")
+    parser.add_argument("games", type=int, nargs="?", default=100, help="Nombre de parties")
+    parser.add_argument("--iterations", type=int, default=MCTS_ITERATIONS)
+    parser.add_argument("--time-budget", type=float, default=None, help="Secondes par coup")
+    parser.add_argument("--workers", type=int, default=MCTS_WORKERS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Mêmes plateaux et mêmes dés pour les deux joueurs
+    player = MCTSPlayer(args.iterations, args.time_budget, args.workers, seed=args.seed)
+    for name in ("direct", "mcts"):
+        engine = GameEngine(seed=args.seed)
+        stats = SimulationStats()
+        search = SearchStats()
+        start_time = time.perf_counter()
+        for game in range(args.games):
+            if game:
+                engine.reset()
+            while not engine.done:
+                if name == "mcts":
+                    action = player.choose(engine)
+                    search.iterations += player.last_stats.iterations
+                    search.nodes += player.last_stats.nodes
+                    search.elapsed += player.last_stats.elapsed
+                else:
+                    action = direct_policy(engine.observe())
+                engine.step(action)
+            hero = engine.hero
+            stats.record(hero.score, engine.won, hero.is_dead(), hero.monsters_defeated, hero.move_count)
+        elapsed = time.perf_counter() - start_time
+        print(f"{name:>6} : score moyen {stats.avg_score:.2f} | victoires {stats.win_rate:.1%}"
+              f" | {args.games / elapsed:.1f} parties/s")
+    player.close()
+    print(f"Recherche : {search.nodes_per_second:.0f} noeuds/s"
+          f" | {search.iterations_per_second:.0f} simulations/s")
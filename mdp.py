@@ -0,0 +1,312 @@
+"""
+FICHIER OPTIONNEL - PAS INDISPENSABLE (nécessite numpy : pip install numpy)
+
+mdp.py
+Politique qui maximise le score ESPÉRÉ sur un plateau donné.
+
+Le jeu est modélisé comme un processus de décision markovien (MDP) :
+    état = (PV restants à infliger à chaque monstre, équipements restants,
+            PV du héros, position du héros)
+La force n'est pas une dimension : elle se déduit des armes ramassées. Le
+héros est "en combat" quand il se trouve sur la case d'un monstre vivant.
+Actions : 4 déplacements (fuite comprise) et ATTACK, avec les règles du
+GameEngine et la probabilité de toucher exacte de Hero.attack.
+
+Résolution par itération de la valeur : les mises à jour de Bellman sont
+vectorisées (NumPy) sur tous les états d'un même niveau de progression, les
+niveaux étant traités du plus avancé au moins avancé. Les monstres sont encodés
+en base (coups restants + 1), soit un simple bitmask quand un coup suffit.
+Sur les grands plateaux, les entités les plus éloignées du héros sont ignorées
+pour rester sous MDP_MAX_STATES états (solution marquée approximate) :
+    - un équipement ignoré est considéré comme absent
+    - un monstre ignoré devient un obstacle : entrer sur sa case coûte un
+      jet d'attaque (raté = PV perdus), sans points ni combat suivi ensuite
+      (estimation pessimiste : la politique préfère le contourner)
+Seule une grille dont les positions et PV dépassent à eux seuls
+MDP_MAX_STATES est refusée (ValueError).
+
+Approximation : une mort ramène le score à 0 ; le modèle annule les points des
+monstres vaincus (connus dans l'état) mais pas les déplacements déjà faits
+depuis le calcul (absents de l'état), ce qui pénalise légèrement la mort.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Tuple, TYPE_CHECKING
+import numpy as np
+from combat_batch import hit_probabilities
+from models import Potion, Weapon
+from settings import (
+    HERO_DAMAGE, MONSTER_DAMAGE, POTION_HEAL,
+    POINTS_PER_MONSTER, POINTS_PER_HP, MDP_MAX_STATES, PlayerAction
+)
+
+if TYPE_CHECKING:
+    from models import Hero, Board
+
+# Ordre des actions dans la politique
+ACTIONS = (
+    PlayerAction.MOVE_UP, PlayerAction.MOVE_DOWN,
+    PlayerAction.MOVE_LEFT, PlayerAction.MOVE_RIGHT,
+    PlayerAction.ATTACK
+)
+_MOVES = ((0, -1), (0, 1), (-1, 0), (1, 0))  # (dx, dy) des 4 déplacements
+
+
+@dataclass
+class MDPSolution:
+    """Valeurs et politique optimales d'un plateau"""
+    expected_score: float        # Score espéré depuis l'état du calcul
+    values: np.ndarray           # (monstres, équipements, PV, position) -> gain espéré
+    policy: np.ndarray           # Même forme -> indice dans ACTIONS
+    monster_positions: Tuple     # Positions des monstres au moment du calcul
+    equipment_positions: Tuple   # Positions des équipements pris en compte
+    hits_base: int               # Base de l'encodage des monstres (coups restants + 1)
+    size: int
+    iterations: int
+    approximate: bool            # True si des monstres ou équipements ont été ignorés (plateau trop grand)
+
+    def state_of(self, hero: 'Hero', board: 'Board') -> Tuple[int, int, int, int]:
+        """Indices (monstres, équipements, PV, position) de l'état courant du jeu"""
+        monster_index = 0
+        for k, position in enumerate(self.monster_positions):
+            monster = board.get_monster_at(position)
+            if monster and monster.hp > 0:
+                monster_index += _hits_needed(monster.hp) * self.hits_base ** k
+        equipment_index = 0
+        for j, position in enumerate(self.equipment_positions):
+            if board.get_equipment_at(position):
+                equipment_index |= 1 << j
+        x, y = hero.position
+        return monster_index, equipment_index, hero.hp - 1, y * self.size + x
+
+    def best_action(self, hero: 'Hero', board: 'Board') -> PlayerAction:
+        """Action optimale dans l'état courant du jeu"""
+        return ACTIONS[self.policy[self.state_of(hero, board)]]
+
+
+def _hits_needed(monster_hp: int) -> int:
+    """Nombre de coups réussis pour vaincre un monstre"""
+    return -(-monster_hp // HERO_DAMAGE)
+
+
+def solve_mdp(board: 'Board', hero: 'Hero', max_iterations: int = 1000,
+              tolerance: float = 1e-9) -> MDPSolution:
+    """Calcule la politique qui maximise le score espéré à partir de l'état (hero, board)"""
+    size = board.size
+    nb_positions = size * size
+    nb_hp = hero.max_hp
+    if nb_hp * nb_positions > MDP_MAX_STATES:
+        raise ValueError(f"Grille trop grande pour le MDP : {nb_hp * nb_positions} états sans entité"
+                         f" (max {MDP_MAX_STATES})")
+
+    # Dégradation progressive : tant que l'espace d'états est trop grand, on ignore
+    # l'entité (monstre ou équipement) la plus éloignée du héros
+    def distance(entity) -> int:
+        return abs(entity.x - hero.x) + abs(entity.y - hero.y)
+
+    monsters = sorted(board.monsters, key=distance)
+    equipments = sorted(board.equipments, key=distance)
+    ignored_monsters = []
+    approximate = False
+    while True:
+        hits_base = max((_hits_needed(monster.hp) for monster in monsters), default=0) + 1
+        nb_monster_states = hits_base ** len(monsters)
+        if nb_monster_states * 2 ** len(equipments) * nb_hp * nb_positions <= MDP_MAX_STATES:
+            break
+        if equipments and (not monsters or distance(equipments[-1]) >= distance(monsters[-1])):
+            equipments.pop()
+        else:
+            ignored_monsters.append(monsters.pop())
+        approximate = True
+    nb_equipment_states = 2 ** len(equipments)
+    shape = (nb_monster_states, nb_equipment_states, nb_hp, nb_positions)
+    nb_states = int(np.prod(shape))
+    terminal = nb_states  # État absorbant de valeur 0 (victoire ou mort)
+
+    # --- Tables statiques ---
+    powers = hits_base ** np.arange(len(monsters), dtype=np.int32)
+    digits = (np.arange(nb_monster_states, dtype=np.int32)[:, None] // powers) % hits_base  # (M, nb monstres)
+    killed = hero.monsters_defeated + (digits == 0).sum(axis=1)                               # (M,)
+
+    monster_at = np.full(nb_positions, -1)
+    for k, monster in enumerate(monsters):
+        monster_at[monster.y * size + monster.x] = k
+    # Colonne de zéros en dernier : monster_at = -1 (case sans monstre) la sélectionne,
+    # y compris quand il ne reste aucun monstre
+    live_hits = np.hstack([digits, np.zeros((nb_monster_states, 1), dtype=digits.dtype)])[:, monster_at]  # (M, P)
+    monster_power = np.append(powers, 0)[monster_at]  # (P,)
+    obstacle = np.zeros(nb_positions, dtype=bool)  # Cases des monstres ignorés
+    for monster in ignored_monsters:
+        obstacle[monster.y * size + monster.x] = True
+
+    equipment_at = np.full(nb_positions, -1)
+    is_potion = np.zeros(nb_positions, dtype=bool)
+    for j, equipment in enumerate(equipments):
+        position = equipment.y * size + equipment.x
+        equipment_at[position] = j
+        is_potion[position] = isinstance(equipment, Potion)
+    equipment_bit = np.where(equipment_at >= 0, 1 << np.maximum(equipment_at, 0), 0)  # (P,)
+
+    # Force et probabilité de toucher selon les équipements restants (bit à 1 = encore sur la carte)
+    masks = np.arange(nb_equipment_states, dtype=np.int32)
+    forces = np.full(nb_equipment_states, hero.force)
+    for j, equipment in enumerate(equipments):
+        if isinstance(equipment, Weapon):
+            forces = forces + np.where((masks >> j) & 1, 0, equipment.force_bonus)
+    hit_chance = hit_probabilities(forces)  # (E,)
+
+    # --- Numérotation des états par niveau de progression ---
+    # Tuer, toucher, ramasser ou perdre un PV fait strictement baisser le niveau
+    # (coups restants + équipements restants) * (PV max + 1) + PV d'une "couche"
+    # (monstres, équipements, PV). Les couches sont numérotées par niveau croissant :
+    # chaque niveau est une tranche contiguë qui ne dépend que des niveaux inférieurs.
+    remaining = digits.sum(axis=1)[:, None] + np.array([bin(mask).count("1") for mask in range(nb_equipment_states)])
+    layer_levels = (remaining[:, :, None] * (nb_hp + 1) + np.arange(1, nb_hp + 1)).ravel()
+    layer_order = np.argsort(layer_levels, kind="stable")
+    layer_rank = np.empty_like(layer_order)
+    layer_rank[layer_order] = np.arange(layer_order.size)
+    level_ids, level_starts = np.unique(layer_levels[layer_order], return_index=True)
+    level_bounds = np.append(level_starts, layer_order.size) * nb_positions  # Bornes en indices d'état
+
+    # Composantes (monstres, équipements, PV) des couches rangées par niveau
+    layer_m = layer_order // (nb_equipment_states * nb_hp)
+    layer_e = (layer_order // nb_hp) % nb_equipment_states
+    layer_hp = layer_order % nb_hp + 1
+    positions = np.arange(nb_positions)
+    end_x, end_y = board.end_position
+    end_index = end_y * size + end_x
+
+    def index(m, e, hp, p):
+        """Indice d'un état (hp à partir de 1) dans la numérotation par niveaux"""
+        return layer_rank[(m * nb_equipment_states + e) * nb_hp + (hp - 1)] * nb_positions + p
+
+    def select(mask):
+        """États (numérotés par niveau) où mask est vrai, avec leurs composantes"""
+        rows = np.flatnonzero(mask)
+        layers, p = np.divmod(rows, nb_positions)
+        return rows, layer_m[layers], layer_e[layers], layer_hp[layers], p
+
+    def combat(m, e, hp, p, reward):
+        """Espérance de gain et successeurs d'une attaque sur le monstre de la case p"""
+        probability = hit_chance[e]
+        hit_state = index(m - monster_power[p], e, hp, p)
+        hit_reward = reward + np.where(live_hits[m, p] == 1, POINTS_PER_MONSTER, 0)
+        dead = hp <= MONSTER_DAMAGE
+        miss_state = np.where(dead, terminal, index(m, e, np.maximum(hp - MONSTER_DAMAGE, 1), p))
+        # Mort : le score retombe à 0 (on annule les points de monstres et de départ)
+        miss_reward = reward + np.where(dead, hero.move_count - POINTS_PER_MONSTER * killed[m], 0)
+        expected_reward = probability * hit_reward + (1.0 - probability) * miss_reward
+        return expected_reward, hit_state, probability, miss_state
+
+    def with_bounds(rows, *arrays):
+        """Transitions d'une action, avec les bornes de chaque niveau dans rows"""
+        return (rows,) + arrays + (np.searchsorted(rows, level_bounds),)
+
+    # États impossibles : le héros sur un équipement pas encore ramassé, ou sur l'arrivée (fin)
+    reachable = (((layer_e[:, None] & equipment_bit) == 0) & (positions != end_index)).ravel()
+    on_monster = (live_hits[layer_m] > 0).ravel()
+
+    # --- Transitions de chaque action ---
+    # Seules les actions valides sont gardées ; la branche "raté" n'existe qu'en combat.
+    deterministic, stochastic = [], []
+    xs, ys = positions % size, positions // size
+    for a, (dx, dy) in enumerate(_MOVES):
+        target = np.clip(ys + dy, 0, size - 1) * size + np.clip(xs + dx, 0, size - 1)
+        # Se cogner au mur ne fait rien (sur un monstre, c'est l'équivalent de ATTACK)
+        valid = reachable & np.tile(target != positions, len(layer_order))
+        # Monstre ignoré : un jet d'attaque pour passer (combat() sans monstre suivi : ni points ni état)
+        enters_combat = ((live_hits[layer_m][:, target] > 0) | obstacle[target]).ravel()
+
+        for fight in (False, True):
+            rows, m, e, hp, p = select(valid & (enters_combat == fight))
+            p2 = target[p]
+            # Ramassage d'équipement sur la case d'arrivée
+            picked = (e & equipment_bit[p2]) != 0
+            e2 = e & ~equipment_bit[p2]
+            hp2 = np.where(picked & is_potion[p2], np.minimum(hp + POTION_HEAL, nb_hp), hp)
+            if fight:
+                stochastic.append((a,) + with_bounds(rows, *combat(m, e2, hp2, p2, -1.0)))
+            else:
+                at_end = p2 == end_index
+                next_state = np.where(at_end, terminal, index(m, e2, hp2, p2))
+                reward = np.where(at_end, POINTS_PER_HP * hp2 - 1.0, -1.0)
+                deterministic.append((a,) + with_bounds(rows, reward, next_state))
+
+    rows, m, e, hp, p = select(reachable & on_monster)
+    stochastic.append((len(_MOVES),) + with_bounds(rows, *combat(m, e, hp, p, 0.0)))
+
+    # --- Itération de la valeur, niveau par niveau ---
+    # Dans un niveau, seuls les déplacements "à vide" restent à propager : quelques balayages.
+    values = np.full(nb_states + 1, -1e9)  # Très bas : "pas encore de chemin vers la fin"
+    values[terminal] = 0.0
+    q_values = np.full((len(ACTIONS), nb_states), -1e9)
+    iterations = 0
+    for level in range(len(level_ids)):
+        states = slice(level_bounds[level], level_bounds[level + 1])
+        for _ in range(max_iterations):
+            iterations += 1
+            for a, rows, reward, next_state, bounds in deterministic:
+                part = slice(bounds[level], bounds[level + 1])
+                q_values[a, rows[part]] = reward[part] + values[next_state[part]]
+            for a, rows, reward, hit_state, probability, miss_state, bounds in stochastic:
+                part = slice(bounds[level], bounds[level + 1])
+                hit_values = values[hit_state[part]]
+                q_values[a, rows[part]] = (reward[part] + hit_values
+                                           + (1.0 - probability[part]) * (values[miss_state[part]] - hit_values))
+            new_values = q_values[:, states].max(axis=0)
+            delta = np.abs(new_values - values[states]).max()
+            values[states] = new_values
+            if delta <= tolerance:
+                break
+
+    # Retour à la numérotation naturelle (monstres, équipements, PV, position)
+    values = values[:nb_states].reshape(-1, nb_positions)[layer_rank].reshape(shape)
+    policy = q_values.argmax(axis=0).reshape(-1, nb_positions)[layer_rank].reshape(shape)
+    solution = MDPSolution(
+        expected_score=0.0,
+        values=values,
+        policy=policy,
+        monster_positions=tuple(monster.position for monster in monsters),
+        equipment_positions=tuple(equipment.position for equipment in equipments),
+        hits_base=hits_base,
+        size=size,
+        iterations=iterations,
+        approximate=approximate
+    )
+    if hero.has_won(board.end_position):
+        solution.expected_score = float(hero.score)
+    elif not hero.is_dead():
+        base = POINTS_PER_MONSTER * hero.monsters_defeated - hero.move_count
+        solution.expected_score = float(base + solution.values[solution.state_of(hero, board)])
+    return solution
+
+
+if __name__ == "__main__":
+    import time
+    from engine import GameEngine
+    from models import Board, Hero, Monster
+    from settings import START_HP, START_FORCE
+
+    engine = GameEngine()
+    start_time = time.perf_counter()
+    solution = solve_mdp(engine.board, engine.hero)
+    elapsed = time.perf_counter() - start_time
+    print(f"MDP résolu en {elapsed:.3f}s ({solution.values.size} états, {solution.iterations} balayages)")
+    print(f"Score espéré avec la politique optimale : {solution.expected_score:.2f}")
+
+    # Vérification : on rejoue la politique sur des copies du même plateau
+    nb_games = 2000
+    total = 0
+    for _ in range(nb_games):
+        board = Board(generate=False)
+        for monster in engine.board.monsters:
+            board.add_monster(Monster(monster.position))
+        for equipment in engine.board.equipments:
+            board.add_equipment(Potion(equipment.position) if isinstance(equipment, Potion)
+                                else Weapon(equipment.position, equipment.weapon_type))
+        game = GameEngine()
+        game.hero, game.board = Hero(hp=START_HP, base_force=START_FORCE), board
+        while not game.done:
+            game.step(solution.best_action(game.hero, board))
+        total += game.hero.score
+    print(f"Score moyen simulé ({nb_games} parties) : {total / nb_games:.2f}")
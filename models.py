@@ -1,4 +1,5 @@
 from __future__ import annotations
+import bisect
 import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -28,9 +29,13 @@ Il contient les classes Hero, Monster et Board.
 # Cela rendrait le code plus modulaire, maintenable et réutilisable.
 # -------------------------------------------------------------
 """
-@dataclass
+@dataclass(frozen=True)
 class CombatResult:
-    """Résultat d'une attaque de combat"""
+    """Résultat d'une attaque de combat (immuable, sans __dict__)"""
+    __slots__ = (
+        "hit_chance", "dice_roll", "hit", "monster_died", "monster_hp", "monster_max_hp",
+        "hero_hp", "hero_max_hp", "damage_taken", "failure_threshold"
+    )
     hit_chance: float
     dice_roll: int
     hit: bool
@@ -61,6 +66,8 @@ class WeaponType(Enum):
 
 class Entity:
     """Classe de base pour toute entité sur la carte"""
+    __slots__ = ("position", "symbol")  # Pas de __dict__ : moins de mémoire par entité
+    
     def __init__(self, position, symbol):
         self.position = position  # (x, y) tuple
         self.symbol = symbol
@@ -93,6 +100,8 @@ class Entity:
 
 class Equipment(Entity, ABC):
     """Classe abstraite pour les équipements ramassables"""
+    __slots__ = ()
+    
     def __init__(self, position):
         super().__init__(position, EQUIPMENT_SYMBOL)
     
@@ -103,6 +112,8 @@ class Equipment(Entity, ABC):
 
 class Potion(Equipment):
     """Potion consommée immédiatement qui restaure les HP (ne peut pas dépasser les HP max)"""
+    __slots__ = ()
+    
     def apply_effect(self, hero: 'Hero') -> str:
         old_hp = hero.hp
         hero.hp = min(hero.hp + POTION_HEAL, hero.max_hp)
@@ -111,6 +122,8 @@ class Potion(Equipment):
 
 class Weapon(Equipment):
     """Arme ajoutée à l'inventaire qui augmente la force totale du héros"""
+    __slots__ = ("weapon_type", "found_position")
+    
     def __init__(self, position, weapon_type: WeaponType):
         super().__init__(position)
         self.weapon_type = weapon_type
@@ -131,8 +144,8 @@ class Weapon(Equipment):
         self.found_position = self.position
         # Marquer comme équipée (plus de position sur la carte)
         self.position = None
-        # Stocker l'objet Weapon 
-        hero.weapons.append(self)
+        # Stocker l'objet Weapon (met aussi à jour la force et l'inventaire trié)
+        hero.add_weapon(self)
         return f"Vous équipez {self.weapon_name} ! +{self.force_bonus} Force (Total: {hero.force})"
     
     # Méthodes dunder de comparaison des armes basées sur force_bonus
@@ -172,62 +185,150 @@ class Weapon(Equipment):
 
 class Monster(Entity):
     """Monstre ennemi avec HP"""
+    __slots__ = ("hp", "max_hp")
+    
     def __init__(self, position):
         super().__init__(position, MONSTER_SYMBOL)
         self.hp = MONSTER_HP
         self.max_hp = MONSTER_HP
 
+class WeaponList(list):
+    """
+    Armes du héros dans l'ordre de ramassage : une vraie liste (append, remove...),
+    qui tient à jour la somme des bonus et l'inventaire trié à chaque modification.
+    append (ramassage) coûte O(n) au pire, les autres modifications recalculent tout.
+    """
+    __slots__ = ("bonus", "by_strength", "_keys")
+    
+    def __init__(self, weapons=()):
+        super().__init__(weapons)
+        self._refresh()
+    
+    def __reduce__(self):
+        # Copie et pickle : reconstruire à partir des armes (les caches sont recalculés)
+        return self.__class__, (list(self),)
+    
+    def _refresh(self) -> None:
+        """Recalcule la somme des bonus et l'inventaire trié"""
+        self.bonus = 0               # Somme des bonus des armes
+        self.by_strength = ()        # Mêmes armes, de la plus forte à la plus faible
+        self._keys = []              # -force_bonus de chaque arme de by_strength (ordre croissant)
+        for weapon in self:
+            self._index(weapon)
+    
+    def _index(self, weapon: 'Weapon') -> None:
+        """Ajoute une arme aux caches"""
+        # Insertion après les armes de même bonus : à égalité, l'ordre de ramassage est conservé
+        index = bisect.bisect_right(self._keys, -weapon.force_bonus)
+        self._keys.insert(index, -weapon.force_bonus)
+        self.by_strength = self.by_strength[:index] + (weapon,) + self.by_strength[index:]
+        self.bonus += weapon.force_bonus
+    
+    def append(self, weapon: 'Weapon') -> None:
+        """Ajoute une arme (caches mis à jour sans tout recalculer)"""
+        super().append(weapon)
+        self._index(weapon)
+
+
+def _refreshing(name):
+    """Méthode de list qui recalcule les caches de WeaponList après la modification"""
+    method = getattr(list, name)
+    
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self._refresh()
+        return self if name in ("__iadd__", "__imul__") else result
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+for _name in ("extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(WeaponList, _name, _refreshing(_name))
+del _name
+
 class Hero(Entity):
     """Le héros contrôlé par le joueur"""
-    def __init__(self, hp, base_force):
+    __slots__ = (
+        "rng", "hp", "max_hp", "base_force", "move_count", "monsters_defeated", "_weapons"
+    )
+    
+    def __init__(self, hp, base_force, rng=None):
         super().__init__(START_POSITION, HERO_SYMBOL) # Départ selon START_POSITION
+        self.rng = rng if rng is not None else random  # Jets de dés des combats
         self.hp = hp
         self.max_hp = hp  # HP maximum pour les potions
         self.base_force = base_force
-        self.weapons = []  # Liste des armes équipées
         self.move_count = 0  # Compteur de mouvements
         self.monsters_defeated = 0  # Compteur de monstres vaincus
+        self.clear_weapons()
+    
+    def clear_weapons(self) -> None:
+        """Retire toutes les armes (et remet à zéro les statistiques qui en dépendent)"""
+        self._weapons = WeaponList()
+    
+    def add_weapon(self, weapon: 'Weapon') -> None:
+        """Équipe une arme : force et inventaire trié sont mis à jour ici, pas à chaque lecture"""
+        self._weapons.append(weapon)
+    
+    @property
+    def weapons(self) -> WeaponList:
+        """Armes équipées, dans l'ordre de ramassage (liste : hero.weapons.append(...) reste possible)"""
+        return self._weapons
+    
+    @weapons.setter
+    def weapons(self, weapons) -> None:
+        self._weapons = WeaponList(weapons)
+    
+    @property
+    def weapon_bonus(self) -> int:
+        """Somme des bonus de force des armes (O(1))"""
+        return self._weapons.bonus
     
     @property
     def force(self) -> int:
         """Force totale = force de base + somme des bonus des armes"""
-        # Generator expression : calcule efficacement la somme sans créer de liste
-        weapon_bonus = sum(weapon.force_bonus for weapon in self.weapons)
-        return self.base_force + weapon_bonus
+        return self.base_force + self._weapons.bonus
     
     @property
     def inventory(self):
-        """Inventaire visible (seulement les armes)"""
-        return self.weapons.copy()
+        """Inventaire visible (seulement les armes), trié de la plus forte à la plus faible (tuple)"""
+        return self._weapons.by_strength
+    
+    @property
+    def strongest_weapon(self):
+        """Arme la plus puissante (None sans arme, O(1))"""
+        by_strength = self._weapons.by_strength
+        return by_strength[0] if by_strength else None
     
     @property
     def score(self):
         """Calcul du score : POINTS_PER_MONSTER * monstres vaincus + POINTS_PER_HP * PV restants - nombre de déplacements
         Retourne 0 si le héros est mort (Game Over)"""
-        if self.is_dead():
-            return 0  # Game Over = 0 points
+        if self.hp <= 0:
+            return 0  # Game Over = 0 points (is_dead(), lu à chaque observation)
         
         return (POINTS_PER_MONSTER * self.monsters_defeated) + (POINTS_PER_HP * self.hp) - self.move_count
     
-    def has_won(self):
+    def has_won(self, end_position=END_POSITION):
         """Vérifie si le héros a atteint la condition de victoire"""
-        return self.position == END_POSITION
+        return self.position == end_position
     
     def is_dead(self):
         """Vérifie si le héros est mort"""
         return self.hp <= 0
 
-    def move(self, action: PlayerAction) -> None:
-        """Déplace le héros selon l'action PlayerAction fournie"""
+    def move(self, action: PlayerAction, size: int = GRID_SIZE) -> None:
+        """Déplace le héros selon l'action PlayerAction fournie (sans sortir d'une grille size x size)"""
         x, y = self.position
         new_x, new_y = x, y
         if action == PlayerAction.MOVE_UP and y > 0:
             new_y -= 1  # Haut
-        elif action == PlayerAction.MOVE_DOWN and y < GRID_SIZE - 1:
+        elif action == PlayerAction.MOVE_DOWN and y < size - 1:
             new_y += 1  # Bas
         elif action == PlayerAction.MOVE_LEFT and x > 0:
             new_x -= 1  # Gauche
-        elif action == PlayerAction.MOVE_RIGHT and x < GRID_SIZE - 1:
+        elif action == PlayerAction.MOVE_RIGHT and x < size - 1:
             new_x += 1  # Droite
         
         # Si le héros a effectivement bougé, incrémenter le compteur
@@ -239,7 +340,7 @@ class Hero(Entity):
     def attack(self, monster: 'Monster') -> CombatResult:
         """Attaque un monstre avec un système de probabilité. Retourne un CombatResult"""
         hit_chance = min(95, max(5, self.force / MONSTER_DEFENSE * 100))  # Entre 5% et 95%
-        dice_roll = random.randint(1, 100)
+        dice_roll = self.rng.randint(1, 100)
         
         # Nouveau système : réussir sur les GROS jets (au-dessus du seuil d'échec)
         failure_threshold = 100 - hit_chance
@@ -275,42 +376,65 @@ class Hero(Entity):
         """Utilise un équipement (potion ou arme)"""
         return equipment.apply_effect(self)
 
+# Tuples constants pour les tirages de generate_equipments (pas de liste recréée à chaque objet)
+_COIN = (True, False)
+_WEAPON_TYPES = tuple(WeaponType)
+
 class Board:
     """Gère la grille de jeu"""
-    def __init__(self):
+    def __init__(self, generate: bool = True, rng=None):
         self.size = GRID_SIZE
-        self.monsters = []
-        self.equipments = []
+        self.end_position = END_POSITION  # Case d'arrivée
+        # Générateur aléatoire du plateau (GameRNG pour une partie reproductible)
+        self.rng = rng if rng is not None else random
+        # Index par position : recherche, ajout et suppression en O(1)
+        # (un dict garde l'ordre d'insertion, comme les anciennes listes)
+        self._monsters_by_position = {}
+        self._equipments_by_position = {}
+        # Tuples des positions (observations du moteur), recalculés après un ajout ou un retrait
+        self._monster_positions = None
+        self._equipment_positions = None
+        # Journal des changements pour l'affichage incrémental (voir track_changes) :
+        # id(entité) -> (version, entité, type, présente), de la plus ancienne à la plus récente
+        self.version = 0
+        self._changes = None  # None : pas de journal (simulations, bots)
         # Créer UN SEUL générateur pour tout le board
         self.position_generator = self._unique_valid_positions_generator()
-        self.generate_monsters()
-        self.generate_equipments()
+        # generate=False : board vide, rempli ensuite avec add_monster/add_equipment
+        if generate:
+            self.generate_monsters()
+            self.generate_equipments()
 
     def _unique_valid_positions_generator(self):
         """
         Generator : Génère des positions valides uniques.
-        """
-        forbidden_positions = {START_POSITION, END_POSITION}
-        
-        # Générer toutes les positions possibles et les mélanger
-        all_positions = []
-        for x in range(self.size):
-            for y in range(self.size):
-                if (x, y) not in forbidden_positions:
-                    all_positions.append((x, y))
         
-        # VERSION AVEC LIST COMPREHENSION (équivalent plus concis) :
-        # all_positions = [
-        #     (x, y) for x in range(self.size)
-        #     for y in range(self.size)
-        #     if (x, y) not in forbidden_positions
-        # ]
-        
-        random.shuffle(all_positions)  # Mélange pour l'aléatoire
+        Tire les cases directement dans l'espace des indices (index = x * size + y)
+        avec un mélange de Fisher-Yates "creux" : seules les cases échangées sont
+        mémorisées dans un dict. Chaque tirage est en O(1) et placer k entités
+        coûte O(k), sans jamais construire la liste de toutes les cases.
+        """
+        # Indices interdits triés (départ et arrivée), pour pouvoir les "sauter"
+        forbidden_indexes = sorted({
+            x * self.size + y for x, y in (START_POSITION, END_POSITION)
+            if 0 <= x < self.size and 0 <= y < self.size
+        })
+        size = self.size
+        nb_valid = size * size - len(forbidden_indexes)
+        randrange = self.rng.randrange  # Résolu une fois (appelé pour chaque entité placée)
         
-        # Boucle infinie : re-parcourt la même séquence indéfiniment
+        # Boucle infinie : recommence un nouveau tirage si toutes les cases ont été données
         while True:
-            yield from all_positions  # Pattern "yield from" - Délègue au générateur de liste
+            swapped = {}  # indice -> valeur déplacée à cet indice par le mélange
+            for i in range(nb_valid):
+                j = randrange(i, nb_valid)
+                index = swapped.get(j, j)
+                swapped[j] = swapped.pop(i, i)
+                # Décaler l'indice pour sauter les cases interdites
+                for forbidden_index in forbidden_indexes:
+                    if index >= forbidden_index:
+                        index += 1
+                yield divmod(index, size)  # (x, y)
     
     def generate_monsters(self):
         """Place des monstres aléatoirement (hors cases départ et arrivée)"""
@@ -318,7 +442,7 @@ class Board:
         for _ in range(NB_MONSTERS):
             try:
                 position = next(self.position_generator)  # Récupère la prochaine position unique
-                self.monsters.append(Monster(position))
+                self.add_monster(Monster(position))
             except StopIteration:
                 # Plus de positions disponibles - ne devrait pas arriver avec une grille normale
                 break
@@ -326,47 +450,116 @@ class Board:
     def generate_equipments(self):
         """Place des équipements aléatoirement sur la carte (hors cases départ et arrivée)"""
         # Utilisation du générateur partagé pour éviter les collisions avec les monstres
-        nb_equipments = random.randint(NB_EQUIPMENTS_MIN, NB_EQUIPMENTS_MAX)
+        choice = self.rng.choice
+        nb_equipments = self.rng.randint(NB_EQUIPMENTS_MIN, NB_EQUIPMENTS_MAX)
         
         for _ in range(nb_equipments):
             try:
                 position = next(self.position_generator)  # Récupère la prochaine position unique
                 # Plus besoin de vérifier les collisions puisque le générateur garantit l'unicité
-                # 50% de chance d'être une potion, 50% une arme
-                if random.choice([True, False]):
+                # 50% de chance d'être une potion, 50% une arme (mêmes tirages que choice([True, False]))
+                if choice(_COIN):
                     # Créer une potion
-                    self.equipments.append(Potion(position))
+                    self.add_equipment(Potion(position))
                 else:
-                    # Créer une arme aléatoire
-                    weapon_type = random.choice(list(WeaponType))
-                    self.equipments.append(Weapon(position, weapon_type))
+                    # Créer une arme aléatoire (mêmes tirages que choice(list(WeaponType)))
+                    weapon_type = choice(_WEAPON_TYPES)
+                    self.add_equipment(Weapon(position, weapon_type))
             except StopIteration:
                 # Plus de positions disponibles
                 break
     
+    @property
+    def monsters(self):
+        """Monstres encore sur la carte (vue en lecture, sans copie)"""
+        return self._monsters_by_position.values()
+    
+    @property
+    def equipments(self):
+        """Équipements encore sur la carte (vue en lecture, sans copie)"""
+        return self._equipments_by_position.values()
+    
+    @property
+    def monster_positions(self):
+        """Positions des monstres (tuple mis en cache jusqu'au prochain ajout ou retrait)"""
+        if self._monster_positions is None:
+            self._monster_positions = tuple(self._monsters_by_position)
+        return self._monster_positions
+    
+    @property
+    def equipment_positions(self):
+        """Positions des équipements (tuple mis en cache jusqu'au prochain ajout ou retrait)"""
+        if self._equipment_positions is None:
+            self._equipment_positions = tuple(self._equipments_by_position)
+        return self._equipment_positions
+    
+    def add_monster(self, monster):
+        """Place un monstre sur la carte"""
+        self._monsters_by_position[monster.position] = monster
+        self._monster_positions = None
+        self._record_change(monster, 'monster', True)
+    
+    def add_equipment(self, equipment):
+        """Place un équipement sur la carte"""
+        self._equipments_by_position[equipment.position] = equipment
+        self._equipment_positions = None
+        self._record_change(equipment, 'equipment', True)
+    
+    def track_changes(self) -> None:
+        """Active le journal des changements (appelé par une view après avoir dessiné tout le plateau)"""
+        if self._changes is None:
+            self._changes = {}
+    
+    def _record_change(self, entity, kind: str, present: bool, key=None) -> None:
+        """Note qu'une entité ('monster' ou 'equipment') est apparue, a bougé (present=True) ou a disparu"""
+        if self._changes is None:
+            return
+        self.version += 1
+        if key is None:
+            key = id(entity)  # Weapon n'est pas hashable ; l'entité gardée ici empêche la réutilisation de son id
+        self._changes.pop(key, None)  # Réinsertion : l'entrée passe en fin de dict (la plus récente)
+        self._changes[key] = (self.version, entity, kind, present)
+    
+    def changes_since(self, version: int):
+        """
+        Generator : (entité, type, présente) de chaque entité modifiée après version,
+        de la plus récente à la plus ancienne. Coût proportionnel au nombre de changements.
+        (seuls les changements faits après track_changes() sont connus)
+        """
+        for change_version, entity, kind, present in reversed(self._changes.values()):
+            if change_version <= version:
+                break
+            yield entity, kind, present
+    
     def get_equipment_at(self, position):
         """Retourne l'équipement à la position donnée, s'il y en a un"""
-        for equipment in self.equipments:
-            if equipment.position == position:
-                return equipment
-        return None
+        return self._equipments_by_position.get(position)
     
     def remove_equipment(self, equipment):
-        """Supprime un équipement de la carte"""
-        if equipment in self.equipments:
-            self.equipments.remove(equipment)
+        """Supprime un équipement de la carte (à appeler avant use_equipment, qui peut effacer sa position)"""
+        if self._equipments_by_position.get(equipment.position) is equipment:
+            del self._equipments_by_position[equipment.position]
+            self._equipment_positions = None
+            self._record_change(equipment, 'equipment', False)
     
     def get_monster_at(self, position):
         """Retourne le monstre à la position donnée, s'il y en a un"""
-        for monster in self.monsters:
-            if monster.position == position:
-                return monster
-        return None
+        return self._monsters_by_position.get(position)
     
     def remove_monster(self, monster):
         """Supprime un monstre de la carte"""
-        if monster in self.monsters:
-            self.monsters.remove(monster)
+        if self._monsters_by_position.get(monster.position) is monster:
+            del self._monsters_by_position[monster.position]
+            self._monster_positions = None
+            self._record_change(monster, 'monster', False)
+    
+    def world_state(self):
+        """
+        État du monde pour GameEngine.snapshot, en plus des monstres et équipements.
+        None : plateau fixe, entièrement décrit par ses monstres et équipements.
+        (un plateau généré à la demande retourne un tuple et fournit from_world_state)
+        """
+        return None
 
 if __name__ == "__main__":
     print("ATTENTION: Ce fichier contient les modèles de données du jeu.")
@@ -0,0 +1,185 @@
+"""
+FICHIER OPTIONNEL - PAS INDISPENSABLE (nécessite numpy : pip install numpy)
+
+monster_ai.py
+Mode "monstres mobiles" : chaque monstre se déplace d'une case à chaque tour.
+
+Un monstre à MONSTER_CHASE_RADIUS cases ou moins du héros se rapproche de lui
+(sur l'axe où il est le plus loin), les autres errent au hasard. Toute la
+population est mise à jour en une seule étape NumPy sur les colonnes de
+l'EntityStore (entity_store.py) :
+    - la grille monster_grid de l'EntityStore sert de table de hachage
+      spatiale (case -> monstre) : une case déjà occupée refuse le monstre
+    - deux monstres visant la même case : seul le premier (ligne la plus
+      petite) y entre, les autres restent sur place
+Un monstre qui arrive sur la case du héros engage le combat (sans attaquer).
+La case d'arrivée reste toujours libre.
+
+Utilisation :
+    engine = MovingMonstersEngine(seed=42)
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field, fields
+from typing import Optional, Tuple
+import numpy as np
+from engine import GameEngine, Observation, Snapshot, StepResult
+from entity_store import ArrayBoard, EntityStore
+from rng import derive_seed
+from settings import MONSTER_CHASE_RADIUS, MONSTER_WANDER_PROBABILITY, PlayerAction
+
+# (dx, dy) de chaque code de direction : 4 déplacements puis "rester sur place"
+_STEP_X = np.array([0, 0, -1, 1, 0], dtype=np.int32)
+_STEP_Y = np.array([-1, 1, 0, 0, 0], dtype=np.int32)
+_UP, _DOWN, _LEFT, _RIGHT, _STAY = range(5)
+
+
+def tick(store: EntityStore, hero_position: Tuple[int, int], rng: np.random.Generator,
+         frozen_row: int = -1, end_position: Optional[Tuple[int, int]] = None,
+         chase_radius: int = MONSTER_CHASE_RADIUS,
+         wander_probability: float = MONSTER_WANDER_PROBABILITY) -> np.ndarray:
+    """
+    Déplace tous les monstres d'un pas et retourne les lignes déplacées.
+    frozen_row : monstre qui ne bouge pas (en combat) ; end_position : case interdite aux monstres.
+    """
+    rows = store.rows(monsters=True)
+    x = store.x[rows]
+    y = store.y[rows]
+    size = store.size
+
+    # Errance : un seul tirage u par monstre, u < p décide de l'errance et u / p de la direction
+    if wander_probability:
+        codes = np.minimum(rng.random(len(rows)) * (4 / wander_probability), _STAY).astype(np.intp)
+    else:
+        codes = np.full(len(rows), _STAY, dtype=np.intp)
+    # Poursuite (peu de monstres) : un pas vers le héros sur l'axe le plus éloigné
+    to_hero_x = hero_position[0] - x
+    to_hero_y = hero_position[1] - y
+    chasing = np.flatnonzero(np.abs(to_hero_x) + np.abs(to_hero_y) <= chase_radius)
+    to_hero_x = to_hero_x[chasing]
+    to_hero_y = to_hero_y[chasing]
+    codes[chasing] = np.where(np.abs(to_hero_x) >= np.abs(to_hero_y), (to_hero_x > 0) + _LEFT, to_hero_y > 0)
+    codes[chasing[(to_hero_x == 0) & (to_hero_y == 0)]] = _STAY
+    if frozen_row >= 0:
+        codes[rows == frozen_row] = _STAY
+
+    new_x = np.clip(x + _STEP_X[codes], 0, size - 1)
+    new_y = np.clip(y + _STEP_Y[codes], 0, size - 1)
+    cells = x * size + y
+    targets = new_x * size + new_y
+    # Collisions : case libre au début du tour, et un seul monstre par case visée
+    grid = store.monster_grid
+    free = grid[targets] < 0  # Un monstre qui reste sur place occupe sa propre case
+    if end_position is not None:
+        free &= targets != end_position[0] * size + end_position[1]
+    candidates = np.flatnonzero(free)
+    claimed = targets[candidates]
+    # Chaque candidat marque sa case dans la grille (en ordre inverse : à case égale,
+    # la dernière écriture, donc le plus petit indice, l'emporte) puis relit sa marque
+    markers = -2 - candidates
+    grid[claimed[::-1]] = markers[::-1]
+    movers = candidates[grid[claimed] == markers]
+    grid[claimed] = -1
+
+    moved_rows = rows[movers]
+    grid[cells[movers]] = -1
+    grid[targets[movers]] = moved_rows
+    store.x[moved_rows] = new_x[movers]
+    store.y[moved_rows] = new_y[movers]
+    store.version += 1  # Colonnes écrites directement : invalider les positions en cache
+    return moved_rows
+
+
+@dataclass(frozen=True)
+class MovingMonstersSnapshot(Snapshot):
+    """Snapshot d'un MovingMonstersEngine : with_rng=True capture aussi le générateur des déplacements"""
+    monster_rng_state: Optional[dict] = field(default=None, compare=False)
+
+
+class MovingMonstersEngine(GameEngine):
+    """GameEngine dont les monstres se déplacent après chaque action du joueur (plateau ArrayBoard)"""
+
+    def __init__(self, seed: Optional[int] = None, chase_radius: int = MONSTER_CHASE_RADIUS,
+                 wander_probability: float = MONSTER_WANDER_PROBABILITY):
+        self.chase_radius = chase_radius
+        self.wander_probability = wander_probability
+        self.monster_rng: Optional[np.random.Generator] = None
+        super().__init__(seed, board_class=ArrayBoard)
+
+    def reset(self, seed: Optional[int] = None):
+        observation = super().reset(seed)
+        # Déplacements tirés d'un flux propre à la partie : même graine, mêmes déplacements
+        self.monster_rng = np.random.default_rng(derive_seed(self.seed, "monsters"))
+        return observation
+
+    def snapshot(self, with_rng: bool = False) -> MovingMonstersSnapshot:
+        """Comme GameEngine.snapshot ; with_rng=True rejoue aussi exactement les mêmes déplacements"""
+        snapshot = super().snapshot(with_rng)
+        return MovingMonstersSnapshot(
+            **{snapshot_field.name: getattr(snapshot, snapshot_field.name) for snapshot_field in fields(Snapshot)},
+            monster_rng_state=self.monster_rng.bit_generator.state if with_rng else None
+        )
+
+    def restore(self, snapshot: Snapshot) -> Observation:
+        observation = super().restore(snapshot)
+        monster_rng_state = getattr(snapshot, "monster_rng_state", None)
+        if monster_rng_state is not None:
+            self.monster_rng.bit_generator.state = monster_rng_state
+        return observation
+
+    def step(self, action: PlayerAction) -> StepResult:
+        result = super().step(action)
+        if self.done:
+            return result
+        hero = self.hero
+        board = self.board
+        frozen_row = self.current_monster.row if self.in_combat else -1
+        moved_rows = tick(board.store, hero.position, self.monster_rng, frozen_row, board.end_position,
+                          self.chase_radius, self.wander_probability)
+        board.monsters_moved(moved_rows)
+        # Un monstre arrivé sur la case du héros engage le combat
+        if not self.in_combat:
+            monster = board.get_monster_at(hero.position)
+            if monster:
+                self.in_combat = True
+                self.current_monster = monster
+        return result
+
+
+if __name__ == "__main__":
+    import time
+    from autopilot import autopilot_policy
+    from simulator import SimulationStats, direct_policy, play_game
+
+    # Durée d'un tour avec 10 000 monstres sur un plateau de 1000x1000
+    size, nb_monsters = 1000, 10_000
+    rng = np.random.default_rng(0)
+    store = EntityStore(size, capacity=nb_monsters)
+    cells = rng.choice(size * size, nb_monsters, replace=False)
+    xs, ys = np.divmod(cells, size)
+    store.add_many(0, xs, ys, hp=1)
+    hero_position = (size // 2, size // 2)
+    nb_ticks = 1000
+    start_time = time.perf_counter()
+    moved = 0
+    for _ in range(nb_ticks):
+        moved += len(tick(store, hero_position, rng))
+    elapsed = time.perf_counter() - start_time
+    occupied = store.x[:store.count] * size + store.y[:store.count]
+    print(f"{nb_monsters} monstres : {elapsed / nb_ticks * 1000:.3f} ms par tour"
+          f" | {moved / nb_ticks:.0f} déplacements par tour"
+          f" | cases distinctes : {len(np.unique(occupied)) == nb_monsters}")
+
+    # Le jeu devient plus dur : comparaison des politiques avec et sans monstres mobiles
+    nb_games = 2000
+    for engine_class in (GameEngine, MovingMonstersEngine):
+        for name, policy in (("direct", direct_policy), ("autopilot", autopilot_policy)):
+            engine = engine_class(seed=0)
+            stats = SimulationStats()
+            for game in range(nb_games):
+                if game:
+                    engine.reset()
+                play_game(engine, policy)
+                hero = engine.hero
+                stats.record(hero.score, engine.won, hero.is_dead(), hero.monsters_defeated, hero.move_count)
+            print(f"{engine_class.__name__:>20} {name:>9} : score moyen {stats.avg_score:.2f}"
+                  f" | victoires {stats.win_rate:.1%}")
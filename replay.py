@@ -0,0 +1,176 @@
+"""
+replay.py
+Enregistrement compact d'une partie et vérification rapide de son score.
+
+Une partie est entièrement déterminée par (règles, graine, actions) : il
+suffit de rejouer les actions dans le GameEngine pour retrouver le score.
+Format binaire (quelques dizaines d'octets par partie) :
+    b"AV" + version (1 octet)
+    empreinte des règles (8 octets, settings_hash)
+    graine (varint)
+    nombre d'actions (varint)
+    actions (3 bits chacune, empaquetées, octets de poids faible en premier)
+
+Utilisation :
+    data = encode(record(engine))
+    verify(data, expected_score=engine.hero.score)
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+from engine import GameEngine, settings_hash
+from settings import PlayerAction
+
+MAGIC = b"AV"
+VERSION = 1
+HASH_SIZE = 8    # Octets de l'empreinte des règles
+ACTION_BITS = 3  # Bits par action
+
+# Code de chaque action dans le flux (ordre figé : fait partie du format)
+ACTION_CODES = (
+    PlayerAction.MOVE_UP, PlayerAction.MOVE_DOWN,
+    PlayerAction.MOVE_LEFT, PlayerAction.MOVE_RIGHT,
+    PlayerAction.ATTACK, PlayerAction.QUIT, PlayerAction.UNKNOWN
+)
+_CODE_OF = {action: code for code, action in enumerate(ACTION_CODES)}
+
+
+class ReplayError(ValueError):
+    """Données de replay illisibles (corrompues ou d'une autre version)"""
+
+
+@dataclass(frozen=True)
+class Replay:
+    """Tout ce qu'il faut pour rejouer une partie"""
+    rules_hash: str                      # settings_hash() des règles de la partie
+    seed: int                            # Graine de la partie (GameEngine.seed)
+    actions: Tuple[PlayerAction, ...]
+
+
+def record(engine: GameEngine) -> Replay:
+    """Replay de la partie en cours (ou terminée) du moteur"""
+    return Replay(settings_hash(), engine.seed, tuple(engine.actions))
+
+
+# --- Encodage ---
+
+def _write_varint(value: int, out: bytearray) -> None:
+    """Entier positif sur 7 bits par octet (bit de poids fort = "suite")"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Lit un varint et retourne (valeur, position suivante)"""
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayError("Replay tronqué")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode(replay: Replay) -> bytes:
+    """Sérialise un replay au format binaire"""
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    out += bytes.fromhex(replay.rules_hash)[:HASH_SIZE]
+    _write_varint(replay.seed, out)
+    _write_varint(len(replay.actions), out)
+    packed = 0
+    for index, action in enumerate(replay.actions):
+        packed |= _CODE_OF[action] << (ACTION_BITS * index)
+    out += packed.to_bytes((ACTION_BITS * len(replay.actions) + 7) // 8, "little")
+    return bytes(out)
+
+
+def decode(data: bytes) -> Replay:
+    """Lit un replay binaire (ReplayError si les données sont invalides)"""
+    if data[:len(MAGIC)] != MAGIC or len(data) < len(MAGIC) + 1 + HASH_SIZE:
+        raise ReplayError("Ce n'est pas un replay")
+    if data[len(MAGIC)] != VERSION:
+        raise ReplayError(f"Version de replay non supportée : {data[len(MAGIC)]}")
+    offset = len(MAGIC) + 1
+    rules_hash = data[offset:offset + HASH_SIZE].hex()
+    seed, offset = _read_varint(data, offset + HASH_SIZE)
+    nb_actions, offset = _read_varint(data, offset)
+    size = (ACTION_BITS * nb_actions + 7) // 8
+    if len(data) != offset + size:
+        raise ReplayError("Taille du flux d'actions incorrecte")
+    packed = int.from_bytes(data[offset:], "little")
+    mask = (1 << ACTION_BITS) - 1
+    actions = []
+    for _ in range(nb_actions):
+        code = packed & mask
+        if code >= len(ACTION_CODES):
+            raise ReplayError(f"Code d'action inconnu : {code}")
+        actions.append(ACTION_CODES[code])
+        packed >>= ACTION_BITS
+    return Replay(rules_hash, seed, tuple(actions))
+
+
+# --- Vérification ---
+
+def replay_score(replay: Replay, engine: Optional[GameEngine] = None,
+                 rules_hash: Optional[str] = None) -> Optional[int]:
+    """Rejoue la partie et retourne son score final (None si les règles diffèrent ou si elle n'est pas finie)"""
+    if replay.rules_hash != (rules_hash or settings_hash()):
+        return None
+    engine = engine or GameEngine()
+    engine.reset(seed=replay.seed)
+    step = engine.step
+    for action in replay.actions:
+        if engine.done:
+            return None  # Actions après la fin de partie : replay incohérent
+        step(action)
+    return engine.hero.score if engine.done else None
+
+
+def verify(data: bytes, expected_score: int, engine: Optional[GameEngine] = None,
+           rules_hash: Optional[str] = None) -> bool:
+    """True si le replay rejoue une partie terminée avec exactement ce score"""
+    try:
+        replay = decode(data)
+    except ReplayError:
+        return False
+    return replay_score(replay, engine, rules_hash) == expected_score
+
+
+def verify_many(entries: Iterable[Tuple[bytes, int]]) -> List[int]:
+    """Vérifie des couples (replay, score) et retourne les positions de ceux qui sont faux"""
+    # Un seul moteur et une seule empreinte des règles pour tout le lot
+    engine = GameEngine()
+    rules_hash = settings_hash()
+    return [index for index, (data, score) in enumerate(entries)
+            if not verify(data, score, engine, rules_hash)]
+
+
+if __name__ == "__main__":
+    import time
+    from autopilot import Autopilot
+
+    engine = GameEngine(seed=0)
+    pilot = Autopilot.for_board(engine.board)
+    entries = []
+    for game in range(5000):
+        if game:
+            engine.reset()
+        while not engine.done:
+            engine.step(pilot(engine.observe()))
+        entries.append((encode(record(engine)), engine.hero.score))
+    sizes = [len(data) for data, _ in entries]
+    print(f"Taille moyenne d'un replay : {sum(sizes) / len(sizes):.1f} octets (max {max(sizes)})")
+
+    start_time = time.perf_counter()
+    failures = verify_many(entries)
+    elapsed = time.perf_counter() - start_time
+    print(f"{len(entries)} replays vérifiés en {elapsed:.2f}s ({len(entries) / elapsed:.0f}/s),"
+          f" {len(failures)} faux")
+    data, score = entries[0]
+    print(f"Score falsifié détecté : {not verify(data, score + 1)}")
@@ -0,0 +1,50 @@
+"""
+rng.py
+Flux aléatoires reproductibles du jeu.
+
+Une partie entière (plateau, équipements, combats) dépend d'une seule graine :
+la même graine et les mêmes actions redonnent exactement la même partie.
+Les sous-flux (plateau, combat, processus du simulateur...) sont dérivés de la
+graine par hachage : ils sont indépendants et ne dépendent pas de l'ordre dans
+lequel ils sont utilisés.
+
+Utilisation :
+    rng = GameRNG(42)
+    board = Board(rng=rng.split("board"))
+"""
+from __future__ import annotations
+import hashlib
+import random
+
+SEED_BITS = 63  # Graines positives sur 64 bits signés (colonne INTEGER de SQLite)
+
+
+def derive_seed(seed: int, *keys) -> int:
+    """Graine d'un sous-flux indépendant, identifiée par (seed, keys)"""
+    description = ":".join(map(str, (seed, *keys)))  # map : pas de générateur (appelé à chaque partie)
+    digest = hashlib.sha256(description.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") >> (64 - SEED_BITS)
+
+
+class GameRNG(random.Random):
+    """random.Random qui retient sa graine et sait créer des sous-flux indépendants"""
+
+    def __init__(self, seed: int = None):
+        if seed is None:
+            # Tirée du module random : random.seed(...) suffit toujours à tout rejouer
+            seed = random.getrandbits(SEED_BITS)
+        self.game_seed = seed
+        super().__init__(seed)
+
+    def split(self, *keys) -> 'GameRNG':
+        """Sous-flux indépendant (par exemple split("combat") ou split("worker", 3))"""
+        return GameRNG(derive_seed(self.game_seed, *keys))
+
+    def __reduce__(self):
+        # Garder la graine d'origine en plus de l'état interne (envoi aux processus)
+        return self.__class__, (self.game_seed,), self.getstate()
+
+
+if __name__ == "__main__":
+    print("ATTENTION: Ce fichier contient uniquement les générateurs aléatoires du jeu.")
+    print("Pour lancer le jeu, exécutez : python controller.py")
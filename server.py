@@ -0,0 +1,289 @@
+"""
+server.py
+Serveur de jeu TCP (asyncio) : une partie indépendante par connexion.
+
+Protocole texte ligne par ligne (telnet/netcat suffisent) :
+    - le client envoie les mêmes commandes que dans la console
+      (up/u/z, down/d/s, left/l/q, right/r, espace/space, x/quit/exit)
+    - le serveur répond par le plateau, les stats et les messages de l'action
+Toutes les sessions tournent dans un seul processus et une seule boucle
+d'événements : une session inactive ne coûte qu'une coroutine en attente et
+son GameEngine, sans thread par joueur. Une session sans commande pendant
+SERVER_IDLE_TIMEOUT secondes est fermée.
+Les parties terminées (victoire ou mort) sont enregistrées avec leur replay
+par le gestionnaire de scores, dans un unique thread dédié : les écritures
+sur disque ne bloquent jamais la boucle d'événements.
+
+Utilisation :
+    python server.py                  # Lance le serveur sur SERVER_HOST:SERVER_PORT
+    python server.py --bench 5000     # Mesure le coût de 5000 sessions inactives
+    nc 127.0.0.1 4242                 # Jouer
+"""
+from __future__ import annotations
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from console_view import parse_action
+from engine import GameEngine, StepResult
+from replay import encode, record
+from rng import GameRNG, SEED_BITS
+from settings import (
+    ENABLE_HIGHSCORE, START_POSITION, PlayerAction,
+    HERO_SYMBOL, MONSTER_SYMBOL, EQUIPMENT_SYMBOL, DEPARTURE_SYMBOL, ARRIVAL_SYMBOL,
+    SERVER_HOST, SERVER_PORT, SERVER_IDLE_TIMEOUT, SERVER_MAX_SESSIONS, SERVER_MAX_LINE
+)
+
+# Import optionnel du système de highscore (comme controller.py)
+try:
+    from highscore import create_highscore_manager
+    HIGHSCORE_AVAILABLE = True
+except ImportError:
+    HIGHSCORE_AVAILABLE = False
+
+# Gestionnaire de scores par défaut (None : parties non enregistrées)
+DEFAULT_HIGHSCORE_FACTORY = create_highscore_manager if ENABLE_HIGHSCORE and HIGHSCORE_AVAILABLE else None
+
+logger = logging.getLogger(__name__)
+
+EMPTY_SYMBOL = "."
+HELP_TEXT = "Commandes: up/u/z, down/d/s, left/l/q, right/r, espace/space (attaquer), x/quit (quitter)"
+
+
+def render(engine: GameEngine) -> str:
+    """Plateau et stats en texte brut (sans couleurs ANSI, lisible par n'importe quel client)"""
+    hero = engine.hero
+    board = engine.board
+    size = board.size
+    # Symboles par position (priorité : héros > monstre > équipement > départ/arrivée)
+    cells = {START_POSITION: DEPARTURE_SYMBOL, board.end_position: ARRIVAL_SYMBOL}
+    for equipment in board.equipments:
+        cells[equipment.position] = EQUIPMENT_SYMBOL
+    for monster in board.monsters:
+        cells[monster.position] = MONSTER_SYMBOL
+    cells[hero.position] = HERO_SYMBOL
+    lines = [
+        " ".join(cells.get((x, y), EMPTY_SYMBOL) for x in range(size))
+        for y in range(size)
+    ]
+    lines.append(f"PV: {hero.hp}/{hero.max_hp} | Force: {hero.force} | "
+                 f"Monstres vaincus: {hero.monsters_defeated} | Déplacements: {hero.move_count}")
+    if engine.in_combat:
+        lines.append("EN COMBAT ! espace pour attaquer, ou déplacez-vous pour fuir")
+    return "\n".join(lines) + "\n"
+
+
+def describe(result: StepResult) -> str:
+    """Messages d'une action (équipement ramassé, combat) en texte brut"""
+    lines = []
+    if result.equipment_message:
+        lines.append(result.equipment_message)
+    combat = result.combat_result
+    if combat:
+        message = f"Jet: {combat.dice_roll}/{combat.failure_threshold:.0f} "
+        if not combat.hit:
+            message += f"Raté ! Vous perdez {combat.damage_taken} PV ({combat.hero_hp}/{combat.hero_max_hp})"
+        elif combat.monster_died:
+            message += "MONSTRE VAINCU !"
+        else:
+            message += f"Touché ! Monstre: {combat.monster_hp}/{combat.monster_max_hp} PV"
+        lines.append(message)
+    return "".join(f"{line}\n" for line in lines)
+
+
+class GameServer:
+    """Serveur asyncio : chaque connexion joue sa propre partie (GameEngine)"""
+
+    def __init__(self, host: str = SERVER_HOST, port: int = SERVER_PORT,
+                 idle_timeout: float = SERVER_IDLE_TIMEOUT, max_sessions: int = SERVER_MAX_SESSIONS,
+                 highscore_factory: Optional[Callable] = DEFAULT_HIGHSCORE_FACTORY,
+                 seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        # Le gestionnaire de scores est créé dans son thread (une connexion SQLite y est liée)
+        self.highscore_factory = highscore_factory
+        self.highscore_manager = None
+        self._recorder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="highscore")
+        self._seeds = GameRNG(seed)  # Flux des graines : une partie différente par session
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.sessions = 0          # Sessions ouvertes
+        self.games_recorded = 0    # Parties terminées enregistrées
+        self.timeouts = 0          # Sessions fermées pour inactivité
+
+    async def start(self) -> None:
+        """Ouvre le port d'écoute (port 0 : port libre choisi par le système, voir self.port)"""
+        self.server = await asyncio.start_server(
+            self.handle_session, self.host, self.port, limit=SERVER_MAX_LINE
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Démarre le serveur et accepte des connexions jusqu'à l'annulation"""
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self) -> None:
+        """Ferme le port d'écoute puis attend les derniers enregistrements de scores"""
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+        await asyncio.get_running_loop().run_in_executor(self._recorder, self._close_manager)
+        self._recorder.shutdown()
+
+    def _close_manager(self) -> None:
+        """Écrit les scores en attente et ferme le gestionnaire (dans le thread des scores)"""
+        manager = self.highscore_manager
+        if manager is not None:
+            manager.flush()
+            if hasattr(manager, "close"):
+                manager.close()
+            self.highscore_manager = None
+
+    def _record(self, score: int, monsters_defeated: int, moves: int, hp: int,
+                seed: int, replay: bytes) -> tuple[bool, int]:
+        """Enregistre une partie terminée (exécuté dans le thread des scores)"""
+        if self.highscore_manager is None:
+            self.highscore_manager = self.highscore_factory()
+        return self.highscore_manager.update_stats(score, monsters_defeated, moves,
+                                                   hp=hp, seed=seed, replay=replay)
+
+    async def record_game(self, engine: GameEngine) -> Optional[tuple[bool, int]]:
+        """
+        Enregistre une partie terminée sans bloquer la boucle ; retourne (is_new_record, ancien_record),
+        ou None si les scores sont désactivés ou si l'enregistrement a échoué (erreur journalisée).
+        """
+        if self.highscore_factory is None:
+            return None
+        hero = engine.hero
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._recorder, self._record, hero.score, hero.monsters_defeated, hero.move_count,
+                hero.hp, engine.seed, encode(record(engine))
+            )
+        except Exception:
+            # Base des scores indisponible, disque plein... : le joueur reçoit quand même son score
+            logger.exception("Enregistrement du score impossible (partie %s)", engine.seed)
+            return None
+        self.games_recorded += 1
+        return result
+
+    async def _send(self, writer: asyncio.StreamWriter, text: str) -> None:
+        """Envoie du texte au client (un client qui ne lit plus compte comme inactif)"""
+        writer.write(text.encode("utf-8"))
+        await asyncio.wait_for(writer.drain(), self.idle_timeout)
+
+    async def handle_session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Une connexion = une partie, jusqu'à sa fin, l'abandon, la déconnexion ou l'inactivité"""
+        if self.sessions >= self.max_sessions:
+            writer.write("Serveur complet, réessayez plus tard.\n".encode("utf-8"))
+            writer.close()
+            return
+        self.sessions += 1
+        try:
+            engine = GameEngine(self._seeds.getrandbits(SEED_BITS))
+            await self._send(writer, f"Bienvenue, aventurier ! (partie {engine.seed})\n{HELP_TEXT}\n"
+                                     f"{render(engine)}> ")
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    await self._send(writer, "\nDélai d'inactivité dépassé, au revoir !\n")
+                    break
+                except ValueError:  # Ligne plus longue que SERVER_MAX_LINE
+                    await self._send(writer, "Commande trop longue, au revoir !\n")
+                    break
+                if not line:  # Déconnexion du client
+                    break
+                action = parse_action(line.decode("utf-8", errors="replace").rstrip("\r\n"))
+                if action == PlayerAction.UNKNOWN:
+                    await self._send(writer, f"Commande inconnue. {HELP_TEXT}\n> ")
+                    continue
+                result = engine.step(action)
+                if action == PlayerAction.QUIT:
+                    await self._send(writer, "Au revoir !\n")
+                    break
+                if result.done:
+                    await self._finish(writer, engine, result)
+                    break
+                await self._send(writer, f"{describe(result)}{render(engine)}> ")
+        except (ConnectionError, asyncio.TimeoutError):
+            pass  # Client parti ou qui ne lit plus : la session se termine simplement
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def _finish(self, writer: asyncio.StreamWriter, engine: GameEngine, result: StepResult) -> None:
+        """Affiche la fin de partie (victoire ou mort) et enregistre le score"""
+        hero = engine.hero
+        if result.won:
+            ending = "VICTOIRE ! Vous avez atteint la sortie !"
+        else:
+            ending = "GAME OVER ! Vous êtes mort..."
+        text = (f"{describe(result)}{render(engine)}{ending}\n"
+                f"Score final: {hero.score} points (monstres vaincus: {hero.monsters_defeated},"
+                f" PV restants: {hero.hp}, déplacements: {hero.move_count})\n")
+        recorded = await self.record_game(engine)
+        if recorded:
+            is_new_record, old_record = recorded
+            if is_new_record:
+                text += f"NOUVEAU RECORD ! Ancien record battu : {old_record} points\n"
+            else:
+                text += f"Meilleur score actuel: {old_record} points\n"
+        await self._send(writer, text + "Merci d'avoir joué !\n")
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    import tracemalloc
+
+    parser = argparse.ArgumentParser(description="Serveur de jeu TCP (une partie par connexion)")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="ouvre N sessions inactives sur un port libre et mesure leur coût")
+    args = parser.parse_args()
+
+    async def bench(nb_sessions: int) -> None:
+        """N clients connectés qui ne jouent pas : mémoire et temps par session"""
+        tracemalloc.start()
+        server = GameServer(args.host, 0, highscore_factory=None)
+        await server.start()
+        start_time = time.perf_counter()
+        clients = []
+        for _ in range(nb_sessions):
+            reader, writer = await asyncio.open_connection(args.host, server.port)
+            await reader.readuntil(b"> ")  # Plateau initial reçu : la session existe
+            clients.append((reader, writer))
+        elapsed = time.perf_counter() - start_time
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"{server.sessions} sessions ouvertes en {elapsed:.2f}s"
+              f" | {current / nb_sessions / 1024:.1f} Ko par session (clients compris)")
+
+        # Une commande envoyée à toutes les sessions en même temps
+        start_time = time.perf_counter()
+        for _, writer in clients:
+            writer.write(b"down\n")
+        for reader, _ in clients:
+            await reader.readuntil(b"> ")
+        elapsed = time.perf_counter() - start_time
+        print(f"1 coup joué dans chaque session : {elapsed * 1e6 / nb_sessions:.0f} µs par session")
+
+        for _, writer in clients:
+            writer.close()
+        await server.close()
+        tracemalloc.stop()
+
+    if args.bench:
+        asyncio.run(bench(args.bench))
+    else:
+        game_server = GameServer(args.host, args.port)
+        print(f"Serveur de jeu sur {args.host}:{args.port} (Ctrl+C pour arrêter)")
+        try:
+            asyncio.run(game_server.serve_forever())
+        except KeyboardInterrupt:
+            print("Serveur arrêté.")
@@ -43,8 +43,47 @@ MONSTER_SYMBOL = "M"
 POINTS_PER_MONSTER = 5   # Points gagnés par monstre vaincu
 POINTS_PER_HP = 2        # Points gagnés par PV restant à la fin
 ENABLE_HIGHSCORE = True  # Activer/désactiver le système de highscore
+HIGHSCORE_BACKEND = "json"  # Stockage des scores : "json" (résumé) ou "sqlite" (une ligne par partie)
+HIGHSCORE_COMPACT_EVERY = 1000  # Compacter le journal des scores tous les N parties (stockage "json")
 SHOW_SCORE_DURING_GAME = False  # Afficher le score pendant la partie
 
+# Configuration du Simulateur (simulator.py)
+SIM_WORKERS = None       # Nombre de processus (None = nombre de coeurs)
+SIM_CHUNK_SIZE = 1000    # Nombre de parties envoyées à un processus en une fois
+SIM_MAX_STEPS = 500      # Nombre maximum d'actions par partie (évite les boucles infinies)
+
+# Configuration du pilote automatique (autopilot.py)
+AUTOPILOT_DELAY = 0.4  # Secondes entre deux actions du bot (pour suivre la partie)
+
+# Configuration du solveur MDP (mdp.py)
+MDP_MAX_STATES = 2_000_000  # Au-delà, les équipements les plus éloignés sont ignorés
+
+# Configuration du joueur MCTS (mcts.py)
+MCTS_ITERATIONS = 1000    # Simulations par coup (si aucune limite de temps n'est donnée)
+MCTS_EXPLORATION = 10.0   # Constante d'exploration UCB (en points de score)
+MCTS_WORKERS = 1          # Processus de recherche en parallèle (1 = pas de parallélisme)
+MCTS_MAX_TABLE_SIZE = 500_000  # Taille maximale de la table de transpositions
+
+# Configuration du monde en morceaux (chunked_world.py)
+WORLD_SIZE = 10_000      # Côté du monde (en cases), arrivée dans le coin opposé au départ
+WORLD_CHUNK_SIZE = 16    # Côté d'un morceau (chunk) généré d'un seul coup
+WORLD_LOAD_RADIUS = 1    # Morceaux chargés autour de celui du héros (1 = carré de 3x3)
+WORLD_MAX_CHUNKS = 64    # Morceaux gardés en mémoire au maximum (les moins récents sont oubliés)
+
+# Configuration des monstres mobiles (monster_ai.py)
+MONSTER_CHASE_RADIUS = 3          # Distance (en cases) à partir de laquelle un monstre poursuit le héros
+MONSTER_WANDER_PROBABILITY = 0.5  # Probabilité qu'un monstre qui ne poursuit pas fasse un pas au hasard
+
+# Configuration du serveur de jeu (server.py)
+SERVER_HOST = "127.0.0.1"   # Adresse d'écoute (localhost uniquement par défaut)
+SERVER_PORT = 4242          # Port TCP
+SERVER_IDLE_TIMEOUT = 300   # Secondes sans commande avant de fermer une session
+SERVER_MAX_SESSIONS = 10_000  # Sessions simultanées au maximum (les suivantes sont refusées)
+SERVER_MAX_LINE = 256       # Longueur maximale d'une commande (octets)
+
+# Configuration de l'interface graphique (tkinter_view.py)
+MESSAGE_LOG_MAX_LINES = 500  # Nombre maximum de lignes gardées dans le journal
+
 # Symboles d'affichage
 DEPARTURE_SYMBOL = "D"  # Symbole pour la case de départ
 ARRIVAL_SYMBOL = "A"    # Symbole pour la case d'arrivée
@@ -0,0 +1,206 @@
+"""
+FICHIER OPTIONNEL - PAS INDISPENSABLE
+
+simulator.py
+Simulateur de parties en masse, réparties sur plusieurs processus.
+Sert à comparer des politiques de bots sur des millions de parties.
+
+Chaque processus reçoit un paquet (chunk) de parties et renvoie uniquement
+des statistiques agrégées (pas d'objets Hero/Board), ce qui limite les
+échanges entre processus et permet un passage à l'échelle quasi linéaire.
+
+Utilisation :
+    python simulator.py 100000 --workers 4 --chunk-size 2000 --seed 42
+"""
+from __future__ import annotations
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+from autopilot import autopilot_policy
+from engine import GameEngine, Observation
+from rng import GameRNG, SEED_BITS
+from settings import (
+    END_POSITION, SIM_WORKERS, SIM_CHUNK_SIZE, SIM_MAX_STEPS,
+    PlayerAction
+)
+
+# Une politique reçoit une observation et retourne l'action à jouer.
+# Elle doit être une fonction de niveau module pour pouvoir être envoyée aux processus (pickle).
+Policy = Callable[[Observation], PlayerAction]
+
+
+def direct_policy(observation: Observation) -> PlayerAction:
+    """Politique de référence : attaque en combat, sinon va tout droit vers l'arrivée"""
+    if observation.in_combat:
+        return PlayerAction.ATTACK
+    x, y = observation.position
+    if x < END_POSITION[0]:
+        return PlayerAction.MOVE_RIGHT
+    if y < END_POSITION[1]:
+        return PlayerAction.MOVE_DOWN
+    return PlayerAction.MOVE_LEFT
+
+
+_RANDOM_ACTIONS = (
+    PlayerAction.MOVE_UP, PlayerAction.MOVE_DOWN,
+    PlayerAction.MOVE_LEFT, PlayerAction.MOVE_RIGHT,
+    PlayerAction.ATTACK
+)
+
+
+def random_policy(observation: Observation) -> PlayerAction:
+    """Politique aléatoire (sert de borne inférieure)"""
+    return random.choice(_RANDOM_ACTIONS)
+
+
+@dataclass
+class SimulationStats:
+    """Statistiques agrégées d'un ensemble de parties"""
+    games: int = 0
+    wins: int = 0
+    deaths: int = 0
+    timeouts: int = 0  # Parties interrompues par SIM_MAX_STEPS ou abandonnées
+    total_score: int = 0
+    total_monsters_defeated: int = 0
+    total_moves: int = 0
+    score_distribution: Counter = field(default_factory=Counter)  # score -> nombre de parties
+
+    def record(self, score: int, won: bool, dead: bool, monsters_defeated: int, moves: int) -> None:
+        """Ajoute le résultat d'une partie"""
+        self.games += 1
+        if won:
+            self.wins += 1
+        elif dead:
+            self.deaths += 1
+        else:
+            self.timeouts += 1
+        self.total_score += score
+        self.total_monsters_defeated += monsters_defeated
+        self.total_moves += moves
+        self.score_distribution[score] += 1
+
+    def merge(self, other: 'SimulationStats') -> None:
+        """Fusionne les statistiques d'un autre paquet de parties"""
+        self.games += other.games
+        self.wins += other.wins
+        self.deaths += other.deaths
+        self.timeouts += other.timeouts
+        self.total_score += other.total_score
+        self.total_monsters_defeated += other.total_monsters_defeated
+        self.total_moves += other.total_moves
+        self.score_distribution.update(other.score_distribution)
+
+    @property
+    def win_rate(self) -> float:
+        """Proportion de parties gagnées"""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def avg_score(self) -> float:
+        """Score moyen par partie"""
+        return self.total_score / self.games if self.games else 0.0
+
+    @property
+    def avg_monsters_defeated(self) -> float:
+        """Nombre moyen de monstres vaincus par partie"""
+        return self.total_monsters_defeated / self.games if self.games else 0.0
+
+    @property
+    def avg_moves(self) -> float:
+        """Nombre moyen de déplacements par partie"""
+        return self.total_moves / self.games if self.games else 0.0
+
+
+def play_game(engine: GameEngine, policy: Policy, max_steps: int = SIM_MAX_STEPS) -> None:
+    """Joue une partie complète sur le moteur (déjà réinitialisé) avec la politique donnée"""
+    observe = engine.observe
+    step = engine.step
+    for _ in range(max_steps):
+        if engine.done:
+            return
+        step(policy(observe()))
+
+
+def run_chunk(policy: Policy, nb_games: int, seed: int, chunk_index: int,
+              max_steps: int = SIM_MAX_STEPS) -> SimulationStats:
+    """Joue un paquet de parties dans le processus courant et retourne les statistiques"""
+    # Chaque paquet a ses propres flux aléatoires, dérivés de (seed, chunk_index) :
+    # les résultats ne dépendent ni du nombre de processus ni de l'ordre d'exécution
+    chunk_rng = GameRNG(seed).split("chunk", chunk_index)
+    random.seed(chunk_rng.split("policy").game_seed)  # Politiques aléatoires (random_policy)
+    stats = SimulationStats()
+    engine = GameEngine(seed=chunk_rng.split("games").game_seed)
+    for game in range(nb_games):
+        if game:
+            engine.reset()
+        play_game(engine, policy, max_steps)
+        hero = engine.hero
+        stats.record(hero.score, engine.won, hero.is_dead(), hero.monsters_defeated, hero.move_count)
+    return stats
+
+
+def simulate_iter(nb_games: int, policy: Policy = direct_policy, workers: Optional[int] = SIM_WORKERS,
+                  chunk_size: int = SIM_CHUNK_SIZE, seed: Optional[int] = None,
+                  max_steps: int = SIM_MAX_STEPS) -> Iterator[SimulationStats]:
+    """
+    Lance nb_games parties en parallèle et produit les statistiques cumulées
+    au fur et à mesure que les paquets se terminent.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(SEED_BITS)
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+
+    total = SimulationStats()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for chunk_index, start in enumerate(range(0, nb_games, chunk_size)):
+            nb = min(chunk_size, nb_games - start)
+            futures.append(executor.submit(run_chunk, policy, nb, seed, chunk_index, max_steps))
+        for future in as_completed(futures):
+            total.merge(future.result())
+            yield total
+
+
+def simulate(nb_games: int, policy: Policy = direct_policy, workers: Optional[int] = SIM_WORKERS,
+             chunk_size: int = SIM_CHUNK_SIZE, seed: Optional[int] = None,
+             max_steps: int = SIM_MAX_STEPS) -> SimulationStats:
+    """Lance nb_games parties en parallèle et retourne les statistiques agrégées"""
+    total = SimulationStats()
+    for total in simulate_iter(nb_games, policy, workers, chunk_size, seed, max_steps):
+        pass
+    return total
+
+
+POLICIES = {
+    "direct": direct_policy,
+    "random": random_policy,
+    "autopilot": autopilot_policy,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulateur de parties en masse")
+    parser.add_argument("games", type=int, help="Nombre de parties à simuler")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="direct")
+    parser.add_argument("--workers", type=int, default=SIM_WORKERS)
+    parser.add_argument("--chunk-size", type=int, default=SIM_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    stats = simulate(args.games, POLICIES[args.policy], args.workers, args.chunk_size, args.seed)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Parties jouées : {stats.games} en {elapsed:.2f}s ({stats.games / elapsed:.0f} parties/s)")
+    print(f"Victoires : {stats.win_rate:.1%} | Morts : {stats.deaths} | Interrompues : {stats.timeouts}")
+    print(f"Score moyen : {stats.avg_score:.2f} | Monstres vaincus : {stats.avg_monsters_defeated:.2f}"
+          f" | Déplacements : {stats.avg_moves:.2f}")
+    print("Distribution des scores :")
+    for score, count in sorted(stats.score_distribution.items()):
+        print(f"  {score:>4} : {count}")
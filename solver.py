@@ -0,0 +1,128 @@
+"""
+solver.py
+Calcul exact du meilleur score atteignable sur un plateau donné.
+
+Modèle déterministe "meilleur cas" : chaque coup touche, donc le héros ne perd
+jamais de PV. Le score dépend alors uniquement :
+    - des monstres vaincus (POINTS_PER_MONSTER chacun),
+    - des PV finaux (les potions ne servent que si le héros n'a pas ses PV max),
+    - du nombre de déplacements (distance de Manhattan entre deux cibles).
+Les armes n'augmentent que les chances de toucher : sans effet dans ce modèle.
+
+Programmation dynamique sur les sous-ensembles (bitmask) de cibles déjà
+visitées (monstres + potions utiles), mémoïsée : O(2^n * n²) pour n cibles.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Tuple, TYPE_CHECKING
+from models import Potion
+from settings import POINTS_PER_MONSTER, POINTS_PER_HP, POTION_HEAL
+
+if TYPE_CHECKING:
+    from models import Hero, Board
+
+
+@dataclass(frozen=True)
+class Solution:
+    """Meilleur score atteignable et itinéraire correspondant"""
+    score: int
+    moves: int                             # Déplacements restants jusqu'à l'arrivée
+    monsters_defeated: int                 # Monstres vaincus en chemin (en plus de ceux déjà vaincus)
+    potions_used: int
+    route: Tuple[Tuple[int, int], ...]     # Cibles visitées dans l'ordre, arrivée comprise
+
+
+def _distance(a, b) -> int:
+    """Distance de Manhattan (chemin le plus court sur la grille)"""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def solve(board: 'Board', hero: 'Hero') -> Solution:
+    """Calcule le meilleur score atteignable à partir de l'état actuel (hero, board)"""
+    if hero.is_dead():
+        return Solution(0, 0, 0, 0, ())
+    end_position = board.end_position
+    if hero.position == end_position:
+        return Solution(hero.score, 0, 0, 0, ())
+
+    # Cibles : tous les monstres, et les potions seulement si elles peuvent rendre des PV
+    monsters = [monster.position for monster in board.monsters]
+    potions = []
+    if hero.hp < hero.max_hp:
+        potions = [equipment.position for equipment in board.equipments if isinstance(equipment, Potion)]
+    targets = monsters + potions
+    nb_targets = len(targets)
+    nb_monsters = len(monsters)
+    monsters_mask = (1 << nb_monsters) - 1
+
+    # Distances pré-calculées : index nb_targets = position de départ du héros
+    points = targets + [hero.position]
+    distances = [[_distance(a, b) for b in targets] for a in points]
+    to_end = [_distance(a, end_position) for a in points]
+
+    base_points = POINTS_PER_MONSTER * hero.monsters_defeated - hero.move_count
+
+    def final_points(mask: int) -> int:
+        """Points dus aux monstres vaincus et aux PV finaux pour un ensemble de cibles visitées"""
+        nb_killed = bin(mask & monsters_mask).count("1")
+        nb_potions = bin(mask >> nb_monsters).count("1")
+        hp = min(hero.max_hp, hero.hp + POTION_HEAL * nb_potions)
+        return POINTS_PER_MONSTER * nb_killed + POINTS_PER_HP * hp
+
+    # Table mémoïsée, remplie des grands ensembles vers les petits :
+    # best[mask][last] = meilleur gain restant (points - déplacements) depuis la cible `last`,
+    # les cibles de `mask` étant déjà visitées
+    nb_masks = 1 << nb_targets
+    best = [None] * nb_masks
+    for mask in range(nb_masks - 1, -1, -1):
+        final = final_points(mask)
+        free_targets = [target for target in range(nb_targets) if not mask >> target & 1]
+        # Dernière cible visitée : une cible de mask, ou le héros si rien n'a encore été visité
+        lasts = [target for target in range(nb_targets) if mask >> target & 1] if mask else [nb_targets]
+        values = [None] * (nb_targets + 1)
+        for last in lasts:
+            row = distances[last]
+            value = final - to_end[last]  # Aller directement à l'arrivée
+            for target in free_targets:
+                candidate = best[mask | (1 << target)][target] - row[target]
+                if candidate > value:
+                    value = candidate
+            values[last] = value
+        best[mask] = values
+
+    # Reconstruction de l'itinéraire optimal
+    route = []
+    mask, last, moves = 0, nb_targets, 0
+    while best[mask][last] != final_points(mask) - to_end[last]:
+        row = distances[last]
+        for target in range(nb_targets):
+            if not mask >> target & 1 and best[mask | (1 << target)][target] - row[target] == best[mask][last]:
+                break
+        route.append(targets[target])
+        moves += row[target]
+        mask |= 1 << target
+        last = target
+    moves += to_end[last]
+    route.append(end_position)
+
+    return Solution(
+        score=base_points + best[0][nb_targets],
+        moves=moves,
+        monsters_defeated=bin(mask & monsters_mask).count("1"),
+        potions_used=bin(mask >> nb_monsters).count("1"),
+        route=tuple(route)
+    )
+
+
+if __name__ == "__main__":
+    import time
+    from models import Board, Hero
+    from settings import START_HP, START_FORCE
+
+    nb_boards = 1000
+    start_time = time.perf_counter()
+    for _ in range(nb_boards):
+        solution = solve(Board(), Hero(hp=START_HP, base_force=START_FORCE))
+    elapsed = time.perf_counter() - start_time
+    print(f"{nb_boards} plateaux résolus en {elapsed:.3f}s")
+    print(f"Dernier plateau : {solution}")
@@ -0,0 +1,35 @@
+"""
+test_autopilot.py
+Tests du pilote automatique.
+"""
+from autopilot import Autopilot, autopilot_policy
+from engine import GameEngine, Observation
+from models import Board
+from settings import PlayerAction, START_FORCE, START_HP
+from simulator import play_game
+
+
+def observation(position, in_combat=False, monsters=(), equipments=()):
+    return Observation(position, START_HP, START_HP, START_FORCE, 0, in_combat, monsters, equipments)
+
+
+def test_goes_to_the_board_end_position():
+    board = Board(generate=False)
+    board.end_position = (4, 0)
+    pilot = Autopilot.for_board(board)
+    assert pilot(observation((3, 0))) is PlayerAction.MOVE_RIGHT
+    assert pilot(observation((4, 1))) is PlayerAction.MOVE_UP
+
+
+def test_attacks_in_combat():
+    pilot = Autopilot()
+    assert pilot(observation((1, 1), in_combat=True, monsters=((1, 1),))) is PlayerAction.ATTACK
+
+
+def test_finishes_games():
+    engine = GameEngine(seed=2)
+    for game in range(20):
+        if game:
+            engine.reset()
+        play_game(engine, autopilot_policy)
+        assert engine.done
@@ -0,0 +1,58 @@
+"""
+test_board_batch.py
+Tests de la génération vectorisée des plateaux.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from board_batch import WEAPON_TYPES, generate_layouts, sample_unique_indexes, to_board
+from models import Potion, Weapon
+from settings import END_POSITION, GRID_SIZE, NB_EQUIPMENTS_MAX, NB_EQUIPMENTS_MIN, NB_MONSTERS, START_POSITION
+
+
+@pytest.mark.parametrize("k, nb_valid", [(3, 1000), (12, 23), (23, 23)])
+def test_sample_unique_indexes(k, nb_valid):
+    indexes = sample_unique_indexes(500, k, nb_valid, np.random.default_rng(0))
+    assert indexes.shape == (500, k)
+    assert ((indexes >= 0) & (indexes < nb_valid)).all()
+    assert all(len(set(row)) == k for row in indexes.tolist())
+
+
+def test_sample_unique_indexes_rejects_too_many():
+    with pytest.raises(ValueError):
+        sample_unique_indexes(1, 5, 4, np.random.default_rng(0))
+
+
+@pytest.mark.parametrize("size", [GRID_SIZE, 1000])
+def test_layouts_follow_board_rules(size):
+    layouts = generate_layouts(300, size=size, rng=0)
+    assert ((NB_EQUIPMENTS_MIN <= layouts.nb_equipments) & (layouts.nb_equipments <= NB_EQUIPMENTS_MAX)).all()
+    for index in range(300):
+        nb_equipments = int(layouts.nb_equipments[index])
+        positions = [tuple(p) for p in layouts.monsters[index].tolist()]
+        positions += [tuple(p) for p in layouts.equipments[index, :nb_equipments].tolist()]
+        assert len(positions) == len(set(positions)) == NB_MONSTERS + nb_equipments
+        assert START_POSITION not in positions and END_POSITION not in positions
+        assert all(0 <= x < size and 0 <= y < size for x, y in positions)
+        assert (layouts.equipments[index, nb_equipments:] == -1).all()
+
+
+def test_layouts_are_reproducible():
+    first, second = generate_layouts(50, rng=7), generate_layouts(50, rng=7)
+    for a, b in zip(first, second):
+        assert (a == b).all()
+
+
+def test_to_board():
+    layouts = generate_layouts(10, rng=3)
+    for index in range(10):
+        board = to_board(layouts, index)
+        assert sorted(board.monster_positions) == sorted(map(tuple, layouts.monsters[index].tolist()))
+        assert len(board.equipments) == layouts.nb_equipments[index]
+        for slot, equipment in enumerate(board.equipments):
+            if layouts.is_potion[index, slot]:
+                assert isinstance(equipment, Potion)
+            else:
+                assert isinstance(equipment, Weapon)
+                assert equipment.weapon_type is WEAPON_TYPES[layouts.weapon_types[index, slot]]
@@ -0,0 +1,104 @@
+"""
+test_chunked_world.py
+Tests du monde généré à la demande : régénération, écarts et snapshots.
+"""
+from chunked_world import ChunkedBoard
+from engine import GameEngine
+from models import Monster, Potion
+from rng import GameRNG
+from settings import PlayerAction
+
+
+def small_world(**options):
+    """Monde de 64x64 cases en morceaux de 8, avec au plus 9 morceaux en mémoire"""
+    options.setdefault("rng", GameRNG(7))
+    return ChunkedBoard(size=64, chunk_size=8, load_radius=1, max_chunks=9, **options)
+
+
+def evict(board, key):
+    """Charge assez d'autres morceaux pour que key soit oublié"""
+    for index in range(board.max_chunks):
+        board._chunk((7 - index % 3, 7 - index // 3))
+    assert key not in board._chunks
+
+
+def contents(board, key):
+    """(position, PV) des monstres et (position, type) des équipements d'un morceau"""
+    chunk = board._chunk(key)
+    monsters = sorted((position, monster.hp) for position, monster in chunk.monsters.items())
+    equipments = sorted((position, type(equipment).__name__) for position, equipment in chunk.equipments.items())
+    return monsters, equipments
+
+
+def test_evicted_chunk_is_regenerated_identically():
+    board = small_world()
+    before = contents(board, (0, 0))
+    evict(board, (0, 0))
+    assert contents(board, (0, 0)) == before
+    assert board.nb_loaded_chunks <= board.max_chunks
+
+
+def test_changes_survive_eviction():
+    board = small_world()
+    chunk = board._chunk((0, 0))
+    removed = next(iter(chunk.monsters.values()))
+    board.remove_monster(removed)
+    board.add_equipment(Potion((3, 3)) if (3, 3) not in chunk.equipments else Potion((3, 4)))
+    before = contents(board, (0, 0))
+    evict(board, (0, 0))
+    assert contents(board, (0, 0)) == before
+    assert removed.position not in board._chunk((0, 0)).monsters
+
+
+def test_override_of_generated_monster_is_kept_after_reload():
+    board = small_world()
+    position = next(iter(board._chunk((0, 0)).monsters))
+    override = Monster(position)
+    override.hp = override.max_hp = 3
+    board.add_monster(override)
+    diff = board._chunk((0, 0)).diff()
+
+    # Deux cycles oubli/rechargement : l'écart reste le même et le monstre remplacé aussi
+    for _ in range(2):
+        evict(board, (0, 0))
+        chunk = board._chunk((0, 0))
+        assert chunk.diff() == diff
+        assert chunk.monsters[position].hp == 3
+        assert position in chunk.added_monsters
+
+
+def test_change_log_follows_loads_evictions_and_overrides():
+    board = small_world()
+    position = next(iter(board._chunk((0, 0)).monsters))
+    replaced = board.get_monster_at(position)  # Charge aussi les morceaux voisins
+    board.track_changes()
+    version = board.version
+    override = Monster(position)
+    board.add_monster(override)
+    changes = {id(entity): present for entity, _, present in board.changes_since(version)}
+    assert changes == {id(replaced): False, id(override): True}
+
+    version = board.version
+    evict(board, (0, 0))
+    changes = {id(entity): present for entity, _, present in board.changes_since(version)}
+    assert changes[id(override)] is False
+    reloaded = board._chunk((0, 0)).monsters[position]
+    assert any(entity is reloaded and present for entity, _, present in board.changes_since(version))
+
+
+def test_snapshot_restores_a_modified_world():
+    engine = GameEngine(seed=11, board_class=ChunkedBoard)
+    engine.reset()
+    for action in (PlayerAction.MOVE_RIGHT, PlayerAction.MOVE_DOWN) * 5:
+        engine.step(action)
+    snapshot = engine.snapshot(with_rng=True)
+    continuation = [PlayerAction.MOVE_RIGHT, PlayerAction.ATTACK, PlayerAction.MOVE_DOWN] * 4
+    expected = [engine.step(action).combat_result for action in continuation]
+    expected_observation = engine.observe()
+
+    engine.restore(snapshot)
+    assert engine.snapshot() == snapshot
+    replayed = [engine.step(action).combat_result for action in continuation]
+    assert replayed == expected
+    assert engine.observe().position == expected_observation.position
+    assert engine.observe().hp == expected_observation.hp
@@ -0,0 +1,58 @@
+"""
+test_combat_batch.py
+Tests des combats vectorisés : mêmes règles que Hero.attack.
+"""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from combat_batch import failure_thresholds, hit_probabilities, resolve_fights
+from models import Hero, Monster
+from settings import HERO_DAMAGE, MONSTER_DAMAGE
+
+FORCES = [0, 1, 3, 7, 10, 13, 17, 19, 20, 25, 40]
+
+
+def test_thresholds_match_hero_attack():
+    for force in FORCES:
+        hero = Hero(hp=5, base_force=force, rng=random.Random(0))
+        result = hero.attack(Monster((1, 1)))
+        assert failure_thresholds(force) == pytest.approx(result.failure_threshold)
+
+
+def test_hit_probabilities_count_winning_rolls():
+    for force, probability in zip(FORCES, hit_probabilities(FORCES)):
+        threshold = float(failure_thresholds(force))
+        winning_rolls = sum(roll >= threshold for roll in range(1, 101))
+        assert probability == pytest.approx(winning_rolls / 100)
+
+
+def test_fights_end_with_a_death():
+    outcomes = resolve_fights(np.array(FORCES), 5, 3, rng=0)
+    assert ((outcomes.hero_hp <= 0) | (outcomes.monster_hp <= 0)).all()
+    assert (outcomes.hero_won == (outcomes.monster_hp <= 0)).all()
+    hits = (3 - outcomes.monster_hp) // HERO_DAMAGE
+    misses = (5 - outcomes.hero_hp) // MONSTER_DAMAGE
+    assert (outcomes.swings == hits + misses).all()
+
+
+def test_fights_are_reproducible_and_broadcast():
+    first = resolve_fights(10, np.array([[1], [5]]), np.array([1, 2, 3]), rng=4)
+    second = resolve_fights(10, np.array([[1], [5]]), np.array([1, 2, 3]), rng=4)
+    assert first.swings.shape == (2, 3)
+    for a, b in zip(first, second):
+        assert (a == b).all()
+
+
+def test_finished_fights_are_not_played():
+    outcomes = resolve_fights(10, [0, 5], [3, 0], rng=0)
+    assert outcomes.swings.tolist() == [0, 0]
+    assert outcomes.hero_won.tolist() == [False, True]
+
+
+def test_win_rate_matches_exact_probability():
+    p = float(hit_probabilities(10))
+    outcomes = resolve_fights(np.full(200_000, 10), 5, 1, rng=1)
+    assert outcomes.hero_won.mean() == pytest.approx(1 - (1 - p) ** 5, abs=0.005)
@@ -0,0 +1,89 @@
+"""
+test_console_view.py
+Tests de l'affichage console : le rendu par différence donne le même écran qu'un rendu complet.
+"""
+import re
+
+from console_view import ConsoleView
+from engine import GameEngine
+from settings import PlayerAction
+
+# Séquences ANSI utilisées par la vue (les couleurs ne changent pas le texte affiché)
+TOKEN = re.compile(r"\033\[(?:(\d+);(\d+)H|H|2J|J|\d+m)|\n|.", re.DOTALL)
+
+
+def render(output, screen=None):
+    """Applique la sortie de la vue à un écran virtuel {(ligne, colonne): caractère}"""
+    screen = {} if screen is None else screen
+    row, column = 1, 1
+    for match in TOKEN.finditer(output):
+        token = match.group()
+        if match.group(1):
+            row, column = int(match.group(1)), int(match.group(2))
+        elif token == "\033[H":
+            row, column = 1, 1
+        elif token == "\033[2J":
+            screen.clear()
+        elif token == "\033[J":
+            for position in [p for p in screen if p >= (row, column)]:
+                del screen[position]
+        elif token.startswith("\033["):
+            continue
+        elif token == "\n":
+            row, column = row + 1, 1
+        else:
+            screen[row, column] = token
+            column += 1
+    return screen
+
+
+def full_frame(engine, capsys):
+    """Écran obtenu par une vue neuve (rendu complet)"""
+    ConsoleView().display_board(engine.hero, engine.board)
+    return render(capsys.readouterr().out)
+
+
+def test_diff_render_matches_full_render(capsys):
+    engine = GameEngine(seed=3)
+    view = ConsoleView()
+    view.display_board(engine.hero, engine.board)
+    screen = render(capsys.readouterr().out)
+    actions = [PlayerAction.MOVE_RIGHT, PlayerAction.ATTACK, PlayerAction.MOVE_DOWN] * 4
+    for action in actions:
+        if engine.done:
+            break
+        engine.step(action)
+        view.display_board(engine.hero, engine.board)
+        render(capsys.readouterr().out, screen)
+        assert screen == full_frame(engine, capsys)
+
+
+def test_unchanged_board_writes_only_cursor_move(capsys):
+    engine = GameEngine(seed=4)
+    view = ConsoleView()
+    view.display_board(engine.hero, engine.board)
+    capsys.readouterr()
+    view.display_board(engine.hero, engine.board)
+    assert capsys.readouterr().out == f"\033[{2 * engine.board.size + 2};1H\033[J"
+
+
+def test_clear_screen_forces_full_render(capsys):
+    engine = GameEngine(seed=5)
+    view = ConsoleView()
+    view.display_board(engine.hero, engine.board)
+    view.clear_screen()
+    capsys.readouterr()
+    view.display_board(engine.hero, engine.board)
+    assert render(capsys.readouterr().out) == full_frame(engine, capsys)
+
+
+def test_frame_is_written_once(monkeypatch):
+    writes = []
+    monkeypatch.setattr("sys.stdout.write", writes.append)
+    monkeypatch.setattr("sys.stdout.flush", lambda: None)
+    engine = GameEngine(seed=6)
+    view = ConsoleView()
+    view.display_board(engine.hero, engine.board)
+    engine.step(PlayerAction.MOVE_RIGHT)
+    view.display_board(engine.hero, engine.board)
+    assert len(writes) == 2
@@ -0,0 +1,106 @@
+"""
+test_engine.py
+Tests du moteur sans affichage : parties reproductibles, snapshot et restore.
+"""
+from engine import GameEngine, Snapshot, settings_hash, unroll
+from settings import PlayerAction
+from simulator import direct_policy, play_game
+
+
+def play(engine, policy, nb_steps=None):
+    """Joue au plus nb_steps actions (toute la partie si None)"""
+    steps = 0
+    while not engine.done and (nb_steps is None or steps < nb_steps):
+        engine.step(policy(engine.observe()))
+        steps += 1
+
+
+def test_same_seed_same_game():
+    first = GameEngine(seed=7)
+    second = GameEngine(seed=7)
+    assert first.observe() == second.observe()
+    for action in (PlayerAction.MOVE_RIGHT, PlayerAction.MOVE_DOWN, PlayerAction.ATTACK) * 4:
+        first.step(action)
+        second.step(action)
+        assert first.observe() == second.observe()
+
+
+def test_reset_with_seed_replays_the_game():
+    engine = GameEngine(seed=1)
+    engine.reset(seed=123)
+    play_game(engine, direct_policy)
+    actions, score = engine.actions, engine.hero.score
+
+    engine.reset()
+    engine.reset(seed=123)
+    for action in actions:
+        engine.step(action)
+    assert engine.done
+    assert engine.hero.score == score
+
+
+def test_history_records_actions():
+    engine = GameEngine(seed=2)
+    actions = (PlayerAction.MOVE_RIGHT, PlayerAction.MOVE_DOWN, PlayerAction.MOVE_LEFT)
+    for action in actions:
+        engine.step(action)
+    assert engine.actions == actions
+    assert unroll(engine.history) == actions
+    assert engine.snapshot().actions == actions
+
+
+def test_step_after_done_changes_nothing():
+    engine = GameEngine(seed=3)
+    engine.step(PlayerAction.QUIT)
+    before = engine.snapshot()
+    result = engine.step(PlayerAction.MOVE_RIGHT)
+    assert result.done
+    assert engine.snapshot() == before
+    assert engine.actions == (PlayerAction.QUIT,)
+
+
+def test_restore_with_rng_replays_identically():
+    engine = GameEngine(seed=11)
+    for action in (PlayerAction.MOVE_DOWN, PlayerAction.MOVE_DOWN, PlayerAction.MOVE_RIGHT):
+        engine.step(action)
+    snapshot = engine.snapshot(with_rng=True)
+
+    play(engine, direct_policy)
+    end = engine.snapshot()
+
+    engine.restore(snapshot)
+    assert engine.snapshot() == snapshot
+    play(engine, direct_policy)
+    assert engine.snapshot() == end
+    assert engine.actions == end.actions
+
+
+def test_snapshot_is_immutable_copy():
+    engine = GameEngine(seed=4)
+    snapshot = engine.snapshot()
+    play(engine, direct_policy)
+    engine.restore(snapshot)
+    assert engine.observe().position == snapshot.position
+    assert engine.board.monster_positions == tuple(position for position, _ in snapshot.monsters)
+    assert not engine.done
+
+
+def test_snapshot_equality_ignores_seed_and_history():
+    engine = GameEngine(seed=5)
+    snapshot = engine.snapshot()
+    engine.step(PlayerAction.MOVE_RIGHT)
+    engine.restore(snapshot)
+    other = engine.snapshot()
+    assert other == snapshot and hash(other) == hash(snapshot)
+
+    moved = Snapshot(**{**snapshot.__dict__, "seed": 0, "history": (None, PlayerAction.QUIT)})
+    assert moved == snapshot
+
+
+def test_settings_hash_stable(monkeypatch):
+    import settings
+    current = settings_hash()
+    assert settings_hash() == current
+    monkeypatch.setattr(settings, "START_HP", settings.START_HP + 1)
+    assert settings_hash() != current
+
@@ -0,0 +1,70 @@
+"""
+test_entity_store.py
+Tests du plateau en colonnes NumPy (ArrayBoard) : même comportement que Board.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine import GameEngine
+from entity_store import ArrayBoard, StoredMonster, StoredWeapon
+from models import Board, Monster, Potion, Weapon, WeaponType
+from rng import GameRNG
+from simulator import direct_policy, play_game
+
+
+def test_same_board_as_board():
+    board = Board(rng=GameRNG(3))
+    array_board = ArrayBoard(rng=GameRNG(3))
+    assert sorted(array_board.monster_positions) == sorted(board.monster_positions)
+    assert sorted(array_board.equipment_positions) == sorted(board.equipment_positions)
+
+
+def test_same_games_as_board():
+    scores = []
+    for board_class in (Board, ArrayBoard):
+        engine = GameEngine(seed=5, board_class=board_class)
+        total = 0
+        for game in range(50):
+            if game:
+                engine.reset()
+            play_game(engine, direct_policy)
+            total += engine.hero.score
+        scores.append(total)
+    assert scores[0] == scores[1]
+
+
+def test_entity_views_can_be_iterated_twice():
+    board = ArrayBoard(rng=GameRNG(1))
+    monsters = board.monsters
+    assert len(monsters) == len(list(monsters)) == len(list(monsters)) > 0
+    equipments = board.equipments
+    assert [equipment.position for equipment in equipments] == [equipment.position for equipment in equipments]
+
+
+def test_views_are_stable_and_write_through():
+    board = ArrayBoard(generate=False)
+    board.add_monster(Monster((1, 2)))
+    board.add_equipment(Weapon((3, 3), WeaponType.IRON_SWORD))
+    board.add_equipment(Potion((2, 0)))
+    monster = board.get_monster_at((1, 2))
+    assert isinstance(monster, StoredMonster)
+    assert board.get_monster_at((1, 2)) is monster
+    monster.hp = 0
+    assert board.store.hp[monster._row] == 0
+
+    weapon = board.get_equipment_at((3, 3))
+    assert isinstance(weapon, StoredWeapon) and isinstance(weapon, Weapon)
+    assert weapon.weapon_type is WeaponType.IRON_SWORD
+    assert isinstance(board.get_equipment_at((2, 0)), Potion)
+
+
+def test_positions_follow_removals():
+    board = ArrayBoard(generate=False)
+    for position in ((1, 1), (2, 2), (3, 1)):
+        board.add_monster(Monster(position))
+    assert board.monster_positions == ((1, 1), (2, 2), (3, 1))
+    board.remove_monster(board.get_monster_at((2, 2)))
+    assert board.monster_positions == ((1, 1), (3, 1))
+    assert board.get_monster_at((2, 2)) is None
+    assert len(board.monsters) == 2
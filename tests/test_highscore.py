@@ -0,0 +1,137 @@
+"""
+test_highscore.py
+Tests du stockage des scores : journal JSON (reprise, compactage) et base SQLite.
+"""
+import os
+import stat
+
+import pytest
+
+import highscore
+from engine import GameEngine
+from highscore import HighScoreManager, SQLiteHighScoreManager
+from replay import encode, record
+from simulator import direct_policy, play_game
+
+
+def json_manager(directory):
+    """HighScoreManager qui écrit dans directory (et non à côté du module)"""
+    manager = HighScoreManager()
+    manager.data_dir = directory
+    manager.score_file = directory / "highscores.json"
+    manager.lock_file = directory / "highscores.lock"
+    return manager
+
+
+def test_update_stats_reports_records(tmp_path):
+    manager = json_manager(tmp_path)
+    assert manager.update_stats(10, 2, 8) == (True, 0)
+    assert manager.update_stats(7, 1, 5) == (False, 10)
+    assert manager.update_stats(12, 3, 9) == (True, 10)
+    summary = manager.get_stats_summary()
+    assert summary["best_score"] == 12
+    assert summary["games_played"] == 3
+    assert summary["avg_monsters_per_game"] == 2.0
+
+
+def test_games_from_other_managers_are_counted_once(tmp_path):
+    first = json_manager(tmp_path)
+    second = json_manager(tmp_path)
+    first.update_stats(10, 1, 4)
+    second.update_stats(20, 2, 6)
+    first.update_stats(5, 0, 3)
+    for manager in (first, second):
+        assert manager.get_stats_summary()["games_played"] == 3
+        assert manager.get_best_score() == 20
+
+
+def test_torn_journal_tail_is_dropped(tmp_path):
+    manager = json_manager(tmp_path)
+    manager.update_stats(10, 1, 4)
+    # Écriture interrompue au milieu d'une ligne (processus tué)
+    with open(manager._journal_file(0), "ab") as journal_file:
+        journal_file.write(b"99 9 9")
+
+    reader = json_manager(tmp_path)
+    assert reader.get_stats_summary()["games_played"] == 1
+    assert reader.get_best_score() == 10
+
+    manager.update_stats(8, 2, 6)
+    assert manager._journal_file(0).read_bytes().count(b"\n") == 2
+    for current in (manager, reader, json_manager(tmp_path)):
+        summary = current.get_stats_summary()
+        assert summary["games_played"] == 2
+        assert summary["best_score"] == 10
+
+
+def test_batch_writes_once(tmp_path):
+    manager = json_manager(tmp_path)
+    with manager.batch():
+        assert manager.update_stats(10, 1, 4) == (True, 0)
+        assert manager.update_stats(15, 1, 4) == (True, 10)
+        assert not manager._journal_file(0).exists()
+    assert json_manager(tmp_path).get_stats_summary()["games_played"] == 2
+
+
+def test_compaction_moves_journal_to_summary(tmp_path, monkeypatch):
+    monkeypatch.setattr(highscore, "HIGHSCORE_COMPACT_EVERY", 3)
+    manager = json_manager(tmp_path)
+    for score in (4, 9, 6):
+        manager.update_stats(score, 1, 2)
+    assert manager.score_file.exists()
+    assert not manager._journal_file(0).exists()
+    manager.update_stats(3, 1, 2)
+    assert manager._journal_file(1).exists()
+
+    summary = json_manager(tmp_path).get_stats_summary()
+    assert summary["games_played"] == 4
+    assert summary["best_score"] == 9
+
+
+def test_compaction_keeps_file_mode(tmp_path):
+    manager = json_manager(tmp_path)
+    manager.update_stats(10, 1, 4)
+    manager.compact()
+    os.chmod(manager.score_file, 0o640)
+    manager.update_stats(11, 1, 4)
+    manager.compact()
+    assert stat.S_IMODE(manager.score_file.stat().st_mode) == 0o640
+    assert json_manager(tmp_path).get_stats_summary()["games_played"] == 2
+
+
+@pytest.fixture
+def sqlite_manager(tmp_path):
+    manager = SQLiteHighScoreManager(tmp_path / "scores.sqlite3")
+    yield manager
+    manager.close()
+
+
+def test_sqlite_rankings(sqlite_manager):
+    scores = [5, 12, 7, 12, 3]
+    for score in scores:
+        sqlite_manager.update_stats(score, 1, 10, hp=2)
+    assert sqlite_manager.get_best_score() == 12
+    assert [game["score"] for game in sqlite_manager.top_scores(limit=3)] == [12, 12, 7]
+    assert sqlite_manager.score_distribution() == {3: 1, 5: 1, 7: 1, 12: 2}
+    assert sqlite_manager.score_percentile(50) == 7
+    assert sqlite_manager.score_percentile(100) == 12
+    assert sqlite_manager.get_stats_summary()["games_played"] == len(scores)
+
+
+def test_sqlite_batch_rolls_back_on_error(sqlite_manager):
+    with pytest.raises(RuntimeError):
+        with sqlite_manager.batch():
+            sqlite_manager.update_stats(10, 1, 4)
+            raise RuntimeError
+    assert sqlite_manager.get_stats_summary()["games_played"] == 0
+
+
+def test_sqlite_audit_replays_games(sqlite_manager):
+    for seed in range(3):
+        engine = GameEngine(seed=0)
+        engine.reset(seed=seed)
+        play_game(engine, direct_policy)
+        score = engine.hero.score + (1 if seed == 1 else 0)  # Score falsifié
+        sqlite_manager.update_stats(score, engine.hero.monsters_defeated, engine.hero.move_count,
+                                    seed=seed, replay=encode(record(engine)))
+    assert sqlite_manager.audit() == [2]
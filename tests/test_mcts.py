@@ -0,0 +1,32 @@
+"""
+test_mcts.py
+Tests du joueur MCTS.
+"""
+from engine import GameEngine
+from mcts import MCTSPlayer, _legal_actions, _rollout
+from settings import PlayerAction
+
+
+def test_legal_actions_stay_on_the_board():
+    engine = GameEngine(seed=1)
+    assert set(_legal_actions(engine)) == {PlayerAction.MOVE_DOWN, PlayerAction.MOVE_RIGHT}
+    engine.hero.position = (engine.board.size - 1, engine.board.size - 1)
+    assert set(_legal_actions(engine)) == {PlayerAction.MOVE_UP, PlayerAction.MOVE_LEFT}
+
+
+def test_rollout_heads_for_the_board_end_position():
+    engine = GameEngine(seed=1)
+    engine.board = type(engine.board)(generate=False, rng=engine.board.rng)
+    engine.board.end_position = (2, 0)
+    _rollout(engine)
+    assert engine.won and engine.hero.position == (2, 0)
+
+
+def test_plays_a_full_game():
+    engine = GameEngine(seed=4)
+    player = MCTSPlayer(iterations=50, seed=0)
+    for _ in range(100):
+        if engine.done:
+            break
+        engine.step(player.choose(engine))
+    assert engine.done
@@ -0,0 +1,68 @@
+"""
+test_mdp.py
+Tests du solveur MDP : score espéré exact et politique jouable.
+"""
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from engine import GameEngine
+from mdp import solve_mdp
+from models import Board, Hero, Monster, Potion
+from settings import GRID_SIZE, MONSTER_HP, POINTS_PER_HP, START_FORCE, START_HP
+from simulator import direct_policy, play_game
+
+
+def test_board_without_monsters():
+    board = Board(generate=False)
+    solution = solve_mdp(board, Hero(hp=START_HP, base_force=START_FORCE))
+    assert not solution.approximate
+    assert solution.expected_score == pytest.approx(POINTS_PER_HP * START_HP - 2 * (GRID_SIZE - 1))
+
+
+def test_potion_is_ignored_when_hp_is_full():
+    board = Board(generate=False)
+    board.add_equipment(Potion((1, 0)))
+    solution = solve_mdp(board, Hero(hp=START_HP, base_force=START_FORCE))
+    assert solution.expected_score == pytest.approx(POINTS_PER_HP * START_HP - 2 * (GRID_SIZE - 1))
+
+
+def play(solution, monsters, rng):
+    """Joue la politique sur un plateau neuf avec ces monstres, retourne le score"""
+    engine = GameEngine(seed=0)
+    board = Board(generate=False)
+    for position in monsters:
+        board.add_monster(Monster(position))
+    engine.hero, engine.board = Hero(hp=START_HP, base_force=START_FORCE, rng=rng), board
+    while not engine.done:
+        engine.step(solution.best_action(engine.hero, board))
+    return engine.hero.score
+
+
+def test_policy_reaches_expected_score():
+    monsters = [(1, 0), (2, 2), (0, 3)]
+    board = Board(generate=False)
+    for position in monsters:
+        board.add_monster(Monster(position))
+    solution = solve_mdp(board, Hero(hp=START_HP, base_force=START_FORCE))
+    assert board.get_monster_at((1, 0)).hp == MONSTER_HP
+
+    rng = random.Random(0)
+    nb_games = 3000
+    average = sum(play(solution, monsters, rng) for _ in range(nb_games)) / nb_games
+    assert average == pytest.approx(solution.expected_score, abs=0.3)
+
+
+def test_expected_score_beats_direct_policy():
+    engine = GameEngine(seed=1)
+    solution = solve_mdp(engine.board, engine.hero)
+    nb_games = 500
+    total = 0
+    for game in range(nb_games):
+        engine.reset(seed=1)
+        engine.hero.rng.seed(game)
+        play_game(engine, direct_policy)
+        total += engine.hero.score
+    assert solution.expected_score >= total / nb_games - 0.5
@@ -0,0 +1,81 @@
+"""
+test_models.py
+Tests du modèle : armes du héros, index et journal des changements du plateau.
+"""
+import copy
+import random
+
+from models import Board, Hero, Monster, Potion, Weapon, WeaponList, WeaponType
+from rng import GameRNG
+from settings import START_FORCE, START_HP
+
+
+def hero():
+    return Hero(hp=START_HP, base_force=START_FORCE, rng=random.Random(0))
+
+
+def test_weapons_stay_a_list_and_force_follows_it():
+    player = hero()
+    sword, hammer = Weapon(None, WeaponType.IRON_SWORD), Weapon(None, WeaponType.WAR_HAMMER)
+    player.add_weapon(sword)
+    player.weapons.append(hammer)
+    assert isinstance(player.weapons, list)
+    assert player.weapons == [sword, hammer]
+    assert player.force == START_FORCE + sword.force_bonus + hammer.force_bonus
+    assert player.inventory == (hammer, sword)
+    assert player.strongest_weapon is hammer
+
+    player.weapons.remove(hammer)
+    assert player.force == START_FORCE + sword.force_bonus
+    assert player.strongest_weapon is sword
+    player.weapons = []
+    assert player.force == START_FORCE and player.strongest_weapon is None
+
+
+def test_inventory_keeps_pick_up_order_for_equal_bonuses():
+    first, second = Weapon(None, WeaponType.IRON_SWORD), Weapon(None, WeaponType.POISON_DAGGER)
+    weapons = WeaponList([first, second])
+    assert first.force_bonus == second.force_bonus
+    assert weapons.by_strength == (first, second)
+
+
+def test_copied_hero_keeps_its_weapon_stats():
+    player = hero()
+    player.add_weapon(Weapon(None, WeaponType.ENCHANTED_SWORD))
+    copied = copy.deepcopy(player)
+    assert copied.force == player.force
+    assert len(copied.inventory) == 1
+
+
+def test_board_index_and_position_cache():
+    board = Board(generate=False)
+    monster = Monster((1, 1))
+    board.add_monster(monster)
+    board.add_equipment(Potion((2, 2)))
+    assert board.monster_positions == ((1, 1),)
+    assert board.get_monster_at((1, 1)) is monster
+    board.remove_monster(monster)
+    assert board.monster_positions == ()
+    assert board.get_monster_at((1, 1)) is None
+    assert board.equipment_positions == ((2, 2),)
+
+
+def test_generated_board_avoids_start_and_end():
+    for seed in range(50):
+        board = Board(rng=GameRNG(seed))
+        positions = board.monster_positions + board.equipment_positions
+        assert len(set(positions)) == len(positions)
+        assert (0, 0) not in positions and board.end_position not in positions
+
+
+def test_change_log_keeps_the_last_state_of_each_entity():
+    board = Board(generate=False)
+    board.track_changes()
+    monster = Monster((1, 1))
+    board.add_monster(monster)
+    version = board.version
+    potion = Potion((2, 2))
+    board.add_equipment(potion)
+    board.remove_monster(monster)
+    assert list(board.changes_since(version)) == [(monster, 'monster', False), (potion, 'equipment', True)]
+    assert list(board.changes_since(board.version)) == []
@@ -0,0 +1,88 @@
+"""
+test_monster_ai.py
+Tests des monstres mobiles (déplacements vectorisés sur l'EntityStore).
+"""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from entity_store import EntityStore, MONSTER
+from monster_ai import MovingMonstersEngine, tick
+from settings import PlayerAction
+
+ACTIONS = (PlayerAction.MOVE_DOWN, PlayerAction.MOVE_RIGHT, PlayerAction.MOVE_UP, PlayerAction.ATTACK)
+
+
+def play(engine, nb_actions, seed):
+    """Joue des actions au hasard et retourne les états successifs"""
+    chooser = random.Random(seed)
+    states = []
+    for _ in range(nb_actions):
+        if engine.done:
+            break
+        engine.step(chooser.choice(ACTIONS))
+        states.append((engine.hero.position, engine.hero.hp, engine.observe().monsters))
+    return states
+
+
+def test_tick_keeps_one_monster_per_cell():
+    size = 30
+    rng = np.random.default_rng(0)
+    store = EntityStore(size, capacity=200)
+    cells = rng.choice(size * size, 200, replace=False)
+    xs, ys = np.divmod(cells, size)
+    store.add_many(MONSTER, xs, ys, hp=1)
+    for _ in range(50):
+        moved = tick(store, (size // 2, size // 2), rng, end_position=(size - 1, size - 1))
+        rows = store.rows(monsters=True)
+        occupied = store.x[rows] * size + store.y[rows]
+        assert len(np.unique(occupied)) == len(rows)
+        assert (store.monster_grid[occupied] == rows).all()
+        assert size * size - 1 not in occupied
+        assert len(moved) <= len(rows)
+
+
+def test_frozen_monster_does_not_move():
+    store = EntityStore(5)
+    row = store.add(MONSTER, (2, 2), hp=1)
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        tick(store, (0, 0), rng, frozen_row=row, wander_probability=1.0)
+        assert store.position(row) == (2, 2)
+
+
+def test_restore_replays_the_same_moves():
+    engine = MovingMonstersEngine(seed=4)
+    play(engine, 3, seed=0)
+    snapshot = engine.snapshot(with_rng=True)
+    expected = play(engine, 20, seed=1)
+    engine.restore(snapshot)
+    assert play(engine, 20, seed=1) == expected
+
+
+def test_same_seed_same_game():
+    first, second = MovingMonstersEngine(seed=9), MovingMonstersEngine(seed=9)
+    assert play(first, 30, seed=2) == play(second, 30, seed=2)
+
+
+def test_monster_in_combat_stays_in_place():
+    checked = 0
+    for seed in range(20):
+        engine = MovingMonstersEngine(seed=seed)
+        chooser = random.Random(seed)
+        for _ in range(100):
+            if engine.done:
+                break
+            if engine.in_combat:
+                monster = engine.current_monster
+                row, position = monster.row, monster.position
+                engine.step(PlayerAction.ATTACK)
+                if engine.board.store.alive[row]:  # Coup raté : le monstre n'a pas bougé
+                    assert engine.current_monster is monster
+                    assert engine.board.store.position(row) == position
+                    checked += 1
+            else:
+                engine.step(chooser.choice(ACTIONS[:2]))
+    assert checked
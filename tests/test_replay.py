@@ -0,0 +1,75 @@
+"""
+test_replay.py
+Tests des replays : format binaire et vérification des scores.
+"""
+import pytest
+
+from engine import GameEngine
+from replay import (ACTION_CODES, Replay, ReplayError, decode, encode, record,
+                    replay_score, verify, verify_many)
+from simulator import direct_policy, play_game
+
+
+def finished_game(seed):
+    """Moteur avec une partie terminée par la politique directe"""
+    engine = GameEngine(seed=0)
+    engine.reset(seed=seed)
+    play_game(engine, direct_policy)
+    return engine
+
+
+def test_encode_decode_round_trip():
+    replay = Replay("0123456789abcdef", 2 ** 62 + 5, ACTION_CODES * 3)
+    assert decode(encode(replay)) == replay
+
+
+def test_encode_is_compact():
+    engine = finished_game(1)
+    data = encode(record(engine))
+    assert len(data) <= 3 + 8 + 9 + 2 + (3 * len(engine.actions) + 7) // 8
+
+
+@pytest.mark.parametrize("data", [b"", b"XX\x01" + bytes(8), b"AV\x09" + bytes(8)])
+def test_decode_rejects_foreign_data(data):
+    with pytest.raises(ReplayError):
+        decode(data)
+
+
+def test_decode_rejects_truncated_data():
+    data = encode(record(finished_game(2)))
+    with pytest.raises(ReplayError):
+        decode(data[:-1])
+
+
+def test_verify_accepts_true_score():
+    engine = finished_game(3)
+    data = encode(record(engine))
+    assert verify(data, engine.hero.score)
+    assert replay_score(decode(data)) == engine.hero.score
+
+
+def test_verify_rejects_wrong_score_and_unfinished_games():
+    engine = finished_game(4)
+    assert not verify(encode(record(engine)), engine.hero.score + 1)
+
+    unfinished = GameEngine(seed=4)
+    unfinished.step(direct_policy(unfinished.observe()))
+    assert not unfinished.done
+    assert not verify(encode(record(unfinished)), unfinished.hero.score)
+
+
+def test_verify_rejects_other_rules():
+    engine = finished_game(5)
+    replay = record(engine)
+    other = Replay("f" * 16, replay.seed, replay.actions)
+    assert not verify(encode(other), engine.hero.score)
+
+
+def test_verify_many_returns_bad_entries():
+    entries = []
+    for seed in range(6):
+        engine = finished_game(seed)
+        entries.append((encode(record(engine)), engine.hero.score))
+    entries[2] = (entries[2][0], entries[2][1] + 1)
+    entries[4] = (b"garbage", 0)
+    assert verify_many(entries) == [2, 4]
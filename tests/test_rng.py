@@ -0,0 +1,42 @@
+"""
+test_rng.py
+Tests des flux aléatoires reproductibles.
+"""
+import pickle
+
+from rng import SEED_BITS, GameRNG, derive_seed
+
+
+def test_derive_seed_is_deterministic():
+    assert derive_seed(42, "board") == derive_seed(42, "board")
+    assert derive_seed(42, "worker", 3) == derive_seed(42, "worker", "3")
+    assert 0 <= derive_seed(2 ** 62, "combat") < 2 ** SEED_BITS
+
+
+def test_derived_seeds_differ():
+    seeds = {derive_seed(42, "board"), derive_seed(42, "combat"), derive_seed(43, "board"),
+             derive_seed(42, "chunk", 0), derive_seed(42, "chunk", 1)}
+    assert len(seeds) == 5
+
+
+def test_same_seed_same_stream():
+    first, second = GameRNG(7), GameRNG(7)
+    assert [first.random() for _ in range(10)] == [second.random() for _ in range(10)]
+
+
+def test_split_is_independent_of_parent_use():
+    rng = GameRNG(7)
+    before = rng.split("combat").random()
+    rng.random()
+    assert rng.split("combat").random() == before
+    assert rng.split("combat").game_seed == derive_seed(7, "combat")
+    assert rng.split("board").random() != before
+
+
+def test_pickle_keeps_seed_and_state():
+    rng = GameRNG(11)
+    rng.random()
+    copy = pickle.loads(pickle.dumps(rng))
+    assert copy.game_seed == 11
+    assert copy.random() == rng.random()
+    assert copy.split("board").game_seed == rng.split("board").game_seed
@@ -0,0 +1,79 @@
+"""
+test_server.py
+Tests du serveur TCP : une partie complète par connexion, scores enregistrés (ou non) dans leur thread.
+"""
+import asyncio
+
+import pytest
+
+from console_view import parse_action
+from highscore import SQLiteHighScoreManager
+from replay import verify
+from server import GameServer
+from settings import PlayerAction
+
+# Politique directe en commandes texte : 4 pas à droite puis 4 vers le bas, en attaquant en combat
+COMMANDS = ["r"] * 4 + ["s"] * 4
+
+
+async def play_session(server: GameServer) -> str:
+    """Joue une partie sur le serveur et retourne le dernier texte reçu"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    await reader.readuntil(b"> ")
+    text = ""
+    for command in COMMANDS:
+        while True:
+            writer.write(f"{command}\n".encode("utf-8"))
+            try:
+                text = (await reader.readuntil(b"> ")).decode("utf-8")
+            except asyncio.IncompleteReadError as error:  # Fin de partie : le serveur ferme la connexion
+                writer.close()
+                return error.partial.decode("utf-8")
+            if "EN COMBAT" not in text:
+                break
+            command = " "
+    writer.close()
+    return text
+
+
+def run_server(highscore_factory, sessions: int = 1):
+    """Lance le serveur, joue des parties et retourne (textes de fin, serveur)"""
+    async def main():
+        server = GameServer("127.0.0.1", 0, idle_timeout=5, highscore_factory=highscore_factory, seed=3)
+        await server.start()
+        endings = [await play_session(server) for _ in range(sessions)]
+        await server.close()
+        return endings, server
+    return asyncio.run(main())
+
+
+def test_games_are_recorded_with_a_valid_replay(tmp_path):
+    database = tmp_path / "scores.sqlite3"
+    endings, server = run_server(lambda: SQLiteHighScoreManager(database), sessions=3)
+    assert all("Score final" in ending and "Merci d'avoir joué" in ending for ending in endings)
+    assert server.games_recorded == 3
+
+    manager = SQLiteHighScoreManager(database)
+    rows = manager.connection.execute("SELECT score, replay FROM games").fetchall()
+    manager.close()
+    assert len(rows) == 3
+    assert all(verify(replay, score) for score, replay in rows)
+
+
+def test_final_score_is_sent_when_recording_fails(caplog):
+    def broken_manager():
+        raise OSError("base des scores indisponible")
+
+    endings, server = run_server(broken_manager, sessions=2)
+    assert all("Score final" in ending and "Merci d'avoir joué" in ending for ending in endings)
+    assert server.games_recorded == 0
+    assert "Enregistrement du score impossible" in caplog.text
+
+
+@pytest.mark.parametrize("text, action", [
+    ("r", PlayerAction.MOVE_RIGHT), ("UP\r\n", PlayerAction.MOVE_UP), ("q", PlayerAction.MOVE_LEFT),
+    ("s", PlayerAction.MOVE_DOWN), (" ", PlayerAction.ATTACK), ("  \n", PlayerAction.ATTACK),
+    ("x", PlayerAction.QUIT), ("", PlayerAction.UNKNOWN), ("jump", PlayerAction.UNKNOWN),
+])
+def test_parse_action(text, action):
+    assert parse_action(text) is action
@@ -0,0 +1,44 @@
+"""
+test_simulator.py
+Tests du simulateur : résultats reproductibles, quel que soit le nombre de processus.
+"""
+from simulator import SimulationStats, direct_policy, random_policy, run_chunk, simulate
+
+
+def test_run_chunk_is_deterministic():
+    for policy in (direct_policy, random_policy):
+        assert run_chunk(policy, 50, seed=3, chunk_index=1) == run_chunk(policy, 50, seed=3, chunk_index=1)
+    assert run_chunk(direct_policy, 50, seed=3, chunk_index=0) != run_chunk(direct_policy, 50, seed=3, chunk_index=1)
+
+
+def test_run_chunk_counts_every_game():
+    stats = run_chunk(direct_policy, 100, seed=5, chunk_index=0)
+    assert stats.games == 100
+    assert stats.wins + stats.deaths + stats.timeouts == 100
+    assert sum(stats.score_distribution.values()) == 100
+    assert stats.total_score == sum(score * count for score, count in stats.score_distribution.items())
+
+
+def test_timeouts_are_counted():
+    stats = run_chunk(direct_policy, 10, seed=5, chunk_index=0, max_steps=1)
+    assert stats.timeouts == 10
+
+
+def test_merge_adds_stats():
+    first, second = SimulationStats(), SimulationStats()
+    first.record(10, True, False, 2, 8)
+    second.record(4, False, True, 1, 3)
+    second.record(6, False, False, 0, 500)
+    first.merge(second)
+    assert (first.games, first.wins, first.deaths, first.timeouts) == (3, 1, 1, 1)
+    assert first.avg_score == 20 / 3
+    assert first.win_rate == 1 / 3
+    assert first.score_distribution == {10: 1, 4: 1, 6: 1}
+
+
+def test_simulate_does_not_depend_on_workers():
+    expected = SimulationStats()
+    for chunk_index in range(4):
+        expected.merge(run_chunk(direct_policy, 30, seed=9, chunk_index=chunk_index))
+    for workers in (1, 2):
+        assert simulate(120, direct_policy, workers=workers, chunk_size=30, seed=9) == expected
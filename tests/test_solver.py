@@ -0,0 +1,38 @@
+"""
+test_solver.py
+Tests du calcul exact du meilleur score (modèle "chaque coup touche").
+"""
+from models import Board, Hero, Monster
+from settings import POINTS_PER_HP, POINTS_PER_MONSTER, START_FORCE, START_HP
+from solver import solve
+
+
+def empty_board(end_position=None):
+    board = Board(generate=False)
+    if end_position is not None:
+        board.end_position = end_position
+    return board
+
+
+def test_straight_route_without_targets():
+    board = empty_board()
+    solution = solve(board, Hero(hp=START_HP, base_force=START_FORCE))
+    distance = sum(board.end_position)
+    assert solution.moves == distance
+    assert solution.score == POINTS_PER_HP * START_HP - distance
+    assert solution.route == (board.end_position,)
+
+
+def test_monster_on_the_way_is_taken():
+    board = empty_board()
+    board.add_monster(Monster((1, 0)))
+    solution = solve(board, Hero(hp=START_HP, base_force=START_FORCE))
+    assert solution.monsters_defeated == 1
+    assert solution.score == POINTS_PER_MONSTER + POINTS_PER_HP * START_HP - sum(board.end_position)
+
+
+def test_uses_the_board_end_position():
+    board = empty_board(end_position=(2, 0))
+    solution = solve(board, Hero(hp=START_HP, base_force=START_FORCE))
+    assert solution.route == ((2, 0),)
+    assert solution.moves == 2
@@ -0,0 +1,61 @@
+"""
+test_vector_game.py
+Tests des parties vectorisées : mêmes règles et mêmes résultats moyens que le GameEngine.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine import GameEngine
+from settings import POINTS_PER_HP, START_HP, PlayerAction
+from simulator import SimulationStats, direct_policy, play_game
+from vector_game import ACTIONS, VectorGame, direct_actions
+
+
+def test_rewards_add_up_to_score_minus_start_score():
+    game = VectorGame(64, seed=0)
+    game.reset()
+    rng = np.random.default_rng(0)
+    totals = np.zeros(64, dtype=np.int64)
+    checked = 0
+    for _ in range(200):
+        _, reward, done = game.step(rng.integers(0, len(ACTIONS), size=64))
+        totals += reward
+        finished = np.flatnonzero(done)
+        expected = game.episode_scores[finished] - POINTS_PER_HP * START_HP
+        assert (totals[finished] == expected).all()
+        checked += finished.size
+        totals[finished] = 0
+    assert checked
+
+
+def test_walls_and_observation_shapes():
+    game = VectorGame(8, seed=1)
+    observation = game.reset()
+    assert observation.monsters.shape == (8, game.size, game.size)
+    # Monter depuis le départ (0, 0) : mur, pas de déplacement compté
+    game.step(np.full(8, ACTIONS.index(PlayerAction.MOVE_UP)))
+    assert (game.move_count == 0).all()
+
+
+def test_same_average_score_as_the_engine():
+    game = VectorGame(2048, seed=0)
+    observation = game.reset()
+    scores, wins = [], 0
+    while len(scores) < 20_000:
+        observation, _, done = game.step(direct_actions(observation))
+        scores.extend(game.episode_scores[done].tolist())
+        wins += int(game.won[done].sum())
+
+    engine = GameEngine(seed=0)
+    stats = SimulationStats()
+    for index in range(20_000):
+        if index:
+            engine.reset()
+        play_game(engine, direct_policy)
+        stats.record(engine.hero.score, engine.won, engine.hero.is_dead(),
+                     engine.hero.monsters_defeated, engine.hero.move_count)
+
+    # Écart toléré : environ 5 écarts-types de la moyenne sur 20 000 parties
+    assert abs(np.mean(scores) - stats.avg_score) < 0.35
+    assert abs(wins / len(scores) - stats.win_rate) < 0.02
@@ -22,25 +22,47 @@ Interface graphique avec tkinter pour le jeu Aventurier.
 import tkinter as tk
 from tkinter import messagebox, ttk
 import queue
-from settings import PlayerAction, GRID_SIZE
+import time
+from settings import PlayerAction, GRID_SIZE, START_POSITION, MESSAGE_LOG_MAX_LINES, AUTOPILOT_DELAY
+
+# Plateau dessiné sur un Canvas
+CELL_PIXELS = 56           # Taille d'une case en pixels
+VISIBLE_CELLS = 10         # Nombre maximum de cases visibles sans défilement
+# Style de chaque type d'entité : (emoji, couleur de fond)
+ENTITY_STYLES = {
+    'hero': ("🦸", '#3498db'),
+    'monster': ("👹", '#e74c3c'),
+    'equipment': ("📦", '#f39c12'),
+}
 
 
 class TkinterView:
     """Interface graphique complète pour le jeu Aventurier"""
     
-    def __init__(self):
+    def __init__(self, max_log_lines: int = MESSAGE_LOG_MAX_LINES):
         self.root = tk.Tk()
         self.root.title("🎮 AVENTURIER - Jeu d'Aventure")
         self.root.geometry("1200x600")
         self.root.configure(bg='#2c3e50')
         self.root.resizable(True, True)  # Permettre le redimensionnement
         
-        # Queue pour la communication thread-safe avec le controller
+        # Communication avec le controller, pilotée par la boucle d'événements Tk
         self.action_queue = queue.Queue()
         self.waiting_for_input = False
+        self._on_action = None  # Callback du controller (mode événementiel, voir run())
+        self._action_ready = tk.BooleanVar(value=False)  # Réveille get_player_input
+        self._close_scheduled = False  # Fermeture différée déjà programmée (show_farewell)
+        
+        # Journal des messages : borné à max_log_lines lignes, mis à jour une fois par image
+        self.max_log_lines = max_log_lines
+        self._pending_messages = []  # (texte, tag) en attente d'insertion dans le widget
+        self._flush_scheduled = False
         
         # Variables d'affichage
-        self.board_buttons = []
+        self._drawn_board = None    # Board dont le fond est dessiné sur le Canvas
+        self._drawn_entities = {}   # id(entité) -> (entité, tag Canvas, position dessinée)
+        self._drawn_version = 0     # Board.version au dernier affichage (voir Board.changes_since)
+        self._next_entity_tag = 0
         self.message_var = tk.StringVar(value="Bienvenue dans l'aventure !")
         
         self._create_interface()
@@ -138,30 +160,23 @@ class TkinterView:
         )
         board_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 15))
         
-        # Grille du plateau
-        self.board_grid = tk.Frame(board_frame, bg='#34495e')
-        self.board_grid.pack(expand=True, pady=20)
-        
-        # Initialiser la grille de boutons
-        self.board_buttons = []
-        for row in range(GRID_SIZE):
-            button_row = []
-            for col in range(GRID_SIZE):
-                btn = tk.Button(
-                    self.board_grid,
-                    text="·",
-                    font=('Courier', 16, 'bold'),
-                    width=4,
-                    height=2,
-                    bg='#95a5a6',
-                    fg='#2c3e50',
-                    relief=tk.RAISED,
-                    bd=2,
-                    state=tk.DISABLED
-                )
-                btn.grid(row=row, column=col, padx=2, pady=2)
-                button_row.append(btn)
-            self.board_buttons.append(button_row)
+        # Plateau : un Canvas avec défilement (un item par entité, pas un bouton par case)
+        canvas_frame = tk.Frame(board_frame, bg='#34495e')
+        canvas_frame.pack(expand=True, pady=20)
+        
+        # Taille de la zone visible et barres de défilement : ajustées au plateau dessiné (_draw_background)
+        viewport_pixels = min(GRID_SIZE, VISIBLE_CELLS) * CELL_PIXELS
+        self.board_canvas = tk.Canvas(
+            canvas_frame,
+            width=viewport_pixels,
+            height=viewport_pixels,
+            bg='#34495e',
+            highlightthickness=0
+        )
+        self.x_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.board_canvas.xview)
+        self.y_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.board_canvas.yview)
+        self.board_canvas.config(xscrollcommand=self.x_scrollbar.set, yscrollcommand=self.y_scrollbar.set)
+        self.board_canvas.grid(row=0, column=0)
         
         # === PANNEAU DE CONTRÔLE (DROITE) ===
         control_frame = tk.LabelFrame(
@@ -336,76 +351,190 @@ class TkinterView:
         if event.keysym in key_actions:
             self._send_action(key_actions[event.keysym])
     
+    def run(self, on_action, autoplay=None):
+        """
+        Lance la boucle d'événements Tk.
+        on_action(action) est appelé directement à chaque action du joueur
+        et retourne False quand la partie est terminée.
+        autoplay() (optionnel) fournit les actions à la place du clavier (pilote automatique).
+        """
+        self._on_action = on_action
+        self.waiting_for_input = True
+        if autoplay:
+            self.root.after(int(AUTOPILOT_DELAY * 1000), self._autoplay_step, autoplay)
+        self.root.mainloop()
+    
+    def _autoplay_step(self, autoplay):
+        """Joue une action du pilote automatique puis programme la suivante"""
+        if not self.waiting_for_input:
+            return
+        self._send_action(autoplay())
+        if self.waiting_for_input:  # La partie continue
+            self.root.after(int(AUTOPILOT_DELAY * 1000), self._autoplay_step, autoplay)
+    
     def _send_action(self, action):
         """Envoie une action au controller"""
-        if self.waiting_for_input:
+        if not self.waiting_for_input:
+            return  # Action ignorée pendant le traitement de la précédente
+        self.waiting_for_input = False
+        
+        if self._on_action is None:
+            # Mode bloquant : réveiller get_player_input
             self.action_queue.put(action)
-            self.waiting_for_input = False
+            self._action_ready.set(True)
+        elif self._on_action(action):
+            self.waiting_for_input = True
+        elif not self._close_scheduled:
+            # Partie terminée sans fermeture différée : fermer la fenêtre
+            self.root.destroy()
     
     def _on_closing(self):
         """Gestion de fermeture de fenêtre"""
-        self._send_action(PlayerAction.QUIT)
+        if self.waiting_for_input:
+            self._send_action(PlayerAction.QUIT)
+        else:
+            self.root.destroy()
     
     def _add_message(self, message, msg_type='info'):
-        """Ajoute un message coloré à la zone de texte"""
-        self.message_text.config(state=tk.NORMAL)
-        
+        """Ajoute un message coloré au journal (inséré au prochain rafraîchissement)"""
         # Ajouter horodatage pour certains messages importants
-        import datetime
-        if msg_type in ['combat', 'success', 'error', 'victory']:
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            self.message_text.insert(tk.END, f"[{timestamp}] ", 'info')
-        
-        self.message_text.insert(tk.END, f"{message}\n", msg_type)
-        self.message_text.see(tk.END)
-        self.message_text.config(state=tk.DISABLED)
-        
-        # Forcer la mise à jour de l'affichage
-        self.root.update()
-        self.root.update_idletasks()
+        if msg_type in ('combat', 'success', 'error', 'victory'):
+            self._pending_messages.append((f"[{time.strftime('%H:%M:%S')}] ", 'info'))
+        self._pending_messages.append((f"{message}\n", msg_type))
+        
+        # Une seule mise à jour du widget pour tous les messages d'une même image
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_messages)
+    
+    def _flush_messages(self):
+        """Insère les messages en attente en une fois et supprime les plus anciennes lignes"""
+        self._flush_scheduled = False
+        if not self._pending_messages:
+            return
+        
+        text = self.message_text
+        text.config(state=tk.NORMAL)
+        # insert accepte plusieurs paires (texte, tag) en un seul appel
+        chunks = [item for message in self._pending_messages for item in message]
+        self._pending_messages.clear()
+        text.insert(tk.END, *chunks)
+        
+        # Journal circulaire : ne garder que les max_log_lines dernières lignes
+        # (le texte finit par "\n", donc 'end-1c' est sur une ligne vide)
+        line_count = int(text.index('end-1c').split('.')[0]) - 1
+        if line_count > self.max_log_lines:
+            text.delete('1.0', f"{line_count - self.max_log_lines + 1}.0")
+        
+        text.see(tk.END)
+        text.config(state=tk.DISABLED)
     
     def clear_screen(self):
         """Méthode pour compatibilité avec ConsoleView (ne fait rien en GUI)"""
         pass  # En GUI, pas besoin de clearer l'écran
 
-    def display_board(self, hero, board):
-        """Affiche le plateau de jeu mis à jour"""
-        # Réinitialiser tous les boutons
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                btn = self.board_buttons[row][col]
-                btn.config(text="·", bg='#95a5a6', fg='#2c3e50')
+    def _draw_background(self, board):
+        """Dessine le fond du plateau : O(taille) items, pas un item par case"""
+        canvas = self.board_canvas
+        canvas.delete('all')
+        self._drawn_entities.clear()
+        self._drawn_board = board
+        
+        total_pixels = board.size * CELL_PIXELS
+        viewport_pixels = min(board.size, VISIBLE_CELLS) * CELL_PIXELS
+        canvas.config(scrollregion=(0, 0, total_pixels, total_pixels), width=viewport_pixels, height=viewport_pixels)
+        if board.size > VISIBLE_CELLS:
+            # Les barres de défilement ne servent que si le plateau dépasse la zone visible
+            self.y_scrollbar.grid(row=0, column=1, sticky=tk.NS)
+            self.x_scrollbar.grid(row=1, column=0, sticky=tk.EW)
+        else:
+            self.y_scrollbar.grid_remove()
+            self.x_scrollbar.grid_remove()
+        canvas.create_rectangle(0, 0, total_pixels, total_pixels, fill='#95a5a6', width=0)
+        for i in range(board.size + 1):
+            offset = i * CELL_PIXELS
+            canvas.create_line(offset, 0, offset, total_pixels, fill='#34495e', width=2)
+            canvas.create_line(0, offset, total_pixels, offset, fill='#34495e', width=2)
         
         # Position de départ et d'arrivée
-        self.board_buttons[0][0].config(text="🚪", bg='#27ae60', fg='white')  # Départ
-        self.board_buttons[GRID_SIZE-1][GRID_SIZE-1].config(text="🏁", bg='#27ae60', fg='white')  # Arrivée
-        
-        # Placer les monstres
-        for monster in board.monsters:
-            if 0 <= monster.x < GRID_SIZE and 0 <= monster.y < GRID_SIZE:
-                self.board_buttons[monster.y][monster.x].config(
-                    text="👹", bg='#e74c3c', fg='white'
-                )
-        
-        # Placer les équipements
-            for equipment in board.equipments:
-                if equipment.position is not None:
-                    if 0 <= equipment.x < GRID_SIZE and 0 <= equipment.y < GRID_SIZE:
-                        # Vérifier qu'il n'y a pas de monstre à cette position
-                        # Generator expression avec any() : s'arrête dès qu'un monstre est trouvé
-                        monster_here = any(m.x == equipment.x and m.y == equipment.y for m in board.monsters)
-                        if not monster_here:
-                            self.board_buttons[equipment.y][equipment.x].config(
-                                text="📦", bg='#f39c12', fg='white'
-                            )
-        
-        # Placer le héros (en dernier pour qu'il soit visible)
-        if 0 <= hero.x < GRID_SIZE and 0 <= hero.y < GRID_SIZE:
-            self.board_buttons[hero.y][hero.x].config(
-                text="🦸", bg='#3498db', fg='white'
+        for (x, y), symbol in ((START_POSITION, "🚪"), (board.end_position, "🏁")):
+            canvas.create_rectangle(
+                x * CELL_PIXELS + 2, y * CELL_PIXELS + 2,
+                (x + 1) * CELL_PIXELS - 2, (y + 1) * CELL_PIXELS - 2,
+                fill='#27ae60', width=0
             )
-        
-        self.root.update_idletasks()
+            canvas.create_text(
+                (x + 0.5) * CELL_PIXELS, (y + 0.5) * CELL_PIXELS,
+                text=symbol, font=('Courier', 16, 'bold'), fill='white'
+            )
+    
+    def _draw_entity(self, entity, kind):
+        """Crée les items Canvas d'une entité, regroupés sous un tag unique"""
+        tag = f"entity{self._next_entity_tag}"
+        self._next_entity_tag += 1
+        symbol, color = ENTITY_STYLES[kind]
+        x, y = entity.position
+        self.board_canvas.create_rectangle(
+            x * CELL_PIXELS + 2, y * CELL_PIXELS + 2,
+            (x + 1) * CELL_PIXELS - 2, (y + 1) * CELL_PIXELS - 2,
+            fill=color, width=0, tags=(tag, kind)
+        )
+        self.board_canvas.create_text(
+            (x + 0.5) * CELL_PIXELS, (y + 0.5) * CELL_PIXELS,
+            text=symbol, font=('Courier', 16, 'bold'), fill='white', tags=(tag, kind)
+        )
+        self._drawn_entities[id(entity)] = (entity, tag, entity.position)
+    
+    def _scroll_to(self, position, size):
+        """Fait défiler la vue pour garder la position visible (centrée si elle sort de l'écran)"""
+        canvas = self.board_canvas
+        for coordinate, view, moveto in ((position[0], canvas.xview, canvas.xview_moveto),
+                                         (position[1], canvas.yview, canvas.yview_moveto)):
+            first, last = view()
+            low, high = coordinate / size, (coordinate + 1) / size
+            if low < first or high > last:
+                moveto(max(0.0, (low + high) / 2 - (last - first) / 2))
+    
+    def _update_entity(self, entity, kind, present):
+        """Dessine, déplace ou efface une entité selon son état (indexée par id : Weapon n'est pas hashable)"""
+        key = id(entity)
+        drawn = self._drawn_entities.get(key)
+        if not present:
+            if drawn is not None:
+                del self._drawn_entities[key]
+                self.board_canvas.delete(drawn[1])
+        elif drawn is None:
+            self._draw_entity(entity, kind)
+        elif drawn[2] != entity.position:
+            _, tag, (old_x, old_y) = drawn
+            x, y = entity.position
+            self.board_canvas.move(tag, (x - old_x) * CELL_PIXELS, (y - old_y) * CELL_PIXELS)
+            self._drawn_entities[key] = (entity, tag, entity.position)
+    
+    def display_board(self, hero, board):
+        """
+        Affiche le plateau de jeu mis à jour.
+        Un nouveau plateau est dessiné en entier ; ensuite seules les entités
+        notées dans le journal du plateau (Board.changes_since) et le héros sont
+        relus : le coût d'une image dépend de ce qui a changé, pas du nombre d'entités.
+        """
+        if board is not self._drawn_board:
+            self._draw_background(board)
+            for equipment in board.equipments:
+                self._draw_entity(equipment, 'equipment')
+            for monster in board.monsters:
+                self._draw_entity(monster, 'monster')
+            board.track_changes()
+        else:
+            # Changements depuis l'image précédente (une seule entrée par entité : son dernier état)
+            for entity, kind, present in board.changes_since(self._drawn_version):
+                self._update_entity(entity, kind, present)
+        self._drawn_version = board.version
+        self._update_entity(hero, 'hero', True)
+        
+        # Placer le héros au premier plan et le garder visible
+        self.board_canvas.tag_raise('hero')
+        self._scroll_to(hero.position, board.size)
     
     def show_stats(self, hero):
         """Met à jour les statistiques affichées (dans le titre)"""
@@ -429,19 +558,10 @@ class TkinterView:
         self._add_message("\n⚔️ COMBAT ! Attaquez (ESPACE/⚔️) ou déplacez-vous pour fuir !\n", 'combat')
     
     def get_player_input(self):
-        """Récupère l'input du joueur de manière non-bloquante"""
+        """Attend l'input du joueur dans la boucle d'événements Tk (sans attente active)"""
         self.waiting_for_input = True
-        
-        # Boucle d'attente pour l'input
-        while self.waiting_for_input:
-            self.root.update()
-            try:
-                action = self.action_queue.get_nowait()
-                return action
-            except queue.Empty:
-                continue
-        
-        # Si on arrive ici, il y a une action en attente
+        # wait_variable traite les événements Tk jusqu'à ce que _send_action écrive la variable
+        self.root.wait_variable(self._action_ready)
         try:
             return self.action_queue.get_nowait()
         except queue.Empty:
@@ -477,7 +597,7 @@ class TkinterView:
             f"👣 Mouvements : {hero.move_count}"
         )
     
-    def show_victory(self, hero):
+    def show_victory(self, hero, perfect_score=None):
         """Affiche l'écran de victoire (SANS popup - juste dans la zone de texte)"""
         self._add_message("\n🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉", 'victory')
         self._add_message("🏆 VICTOIRE ! Vous avez atteint l'arrivée ! 🏆", 'victory')
@@ -488,6 +608,8 @@ class TkinterView:
         self._add_message(f"   🏆 Score final : {hero.score}", 'success')
         self._add_message(f"   👹 Monstres tués : {hero.monsters_defeated}", 'info')
         self._add_message(f"   👣 Mouvements : {hero.move_count}", 'info')
+        if perfect_score is not None:
+            self._add_message(f"   🎯 Score parfait possible : {perfect_score}", 'info')
     
     def show_goodbye(self):
         """Message d'au revoir"""
@@ -500,9 +622,8 @@ class TkinterView:
         self._add_message(f"📈 Ancien record battu : {old_record} points", 'success')
         self._add_message("🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆🎆\n", 'success')
         
-        # Attendre pour que le message s'affiche bien
-        import time
-        time.sleep(0.2)
+        # Afficher le journal avant la popup
+        self._flush_messages()
         
         messagebox.showinfo("🏆 Nouveau Record !", f"Félicitations !\nAncien record battu : {old_record} points")
     
@@ -511,10 +632,6 @@ class TkinterView:
         self._add_message("\n🏅 HIGHSCORE ACTUEL À BATTRE:", 'warning')
         self._add_message(f"🎯 Meilleur score : {best_score} points", 'warning')
         self._add_message("💪 Essayez de faire mieux la prochaine fois !\n", 'warning')
-        
-        # Attendre pour que le message s'affiche bien
-        import time
-        time.sleep(0.2)
     
     def show_farewell(self):
         """Message d'adieu final avec popup de victoire finale"""
@@ -531,6 +648,7 @@ class TkinterView:
         self._add_message("👋 Fermeture dans 10 secondes ou fermez manuellement...", 'info')
         
         # Attendre 10 secondes pour laisser le temps de lire les highscores
+        self._close_scheduled = True
         self.root.after(10000, self.root.destroy)
 
 
@@ -0,0 +1,259 @@
+"""
+FICHIER OPTIONNEL - PAS INDISPENSABLE (nécessite numpy : pip install numpy)
+
+vector_game.py
+N parties jouées en parallèle (apprentissage par renforcement).
+
+Chaque partie est une ligne de tableaux NumPy (plateau à plat : case
+index = y * size + x) et VectorGame.step applique une action à toutes les
+parties en un seul appel, avec les règles du GameEngine :
+    - déplacement borné à la grille comme Hero.move (un mur ne compte pas)
+    - un déplacement quitte le combat, ramasse l'équipement de la case
+      (potion plafonnée aux PV max, ou bonus de force de l'arme) puis
+      attaque le monstre de la case
+    - jets de dés de Hero.attack (combat_batch.failure_thresholds)
+Une partie terminée (victoire, mort ou max_steps actions) est aussitôt
+remplacée par une nouvelle (plateaux de board_batch.generate_layouts).
+La récompense est la variation du score : sa somme sur une partie est le
+score final moins le score de départ (POINTS_PER_HP * START_HP, compté dès
+reset) ; le score final lui-même est dans episode_scores.
+
+Utilisation :
+    game = VectorGame(4096, seed=0)
+    observation = game.reset()
+    observation, reward, done = game.step(actions)  # actions : indices dans ACTIONS
+"""
+from __future__ import annotations
+from typing import NamedTuple, Sequence, Union
+import numpy as np
+from board_batch import WEAPON_TYPES, generate_layouts
+from combat_batch import failure_thresholds
+from settings import (
+    GRID_SIZE, START_POSITION, END_POSITION, START_HP, START_FORCE,
+    HERO_DAMAGE, MONSTER_HP, MONSTER_DAMAGE, POTION_HEAL,
+    POINTS_PER_MONSTER, POINTS_PER_HP, SIM_MAX_STEPS, PlayerAction
+)
+
+# Actions possibles (les tableaux d'actions contiennent un indice dans ce tuple)
+ACTIONS = (
+    PlayerAction.MOVE_UP, PlayerAction.MOVE_DOWN,
+    PlayerAction.MOVE_LEFT, PlayerAction.MOVE_RIGHT,
+    PlayerAction.ATTACK
+)
+ATTACK = ACTIONS.index(PlayerAction.ATTACK)
+_ACTION_INDEX = {action: index for index, action in enumerate(ACTIONS)}
+_STEP_X = np.array([0, 0, -1, 1, 0], dtype=np.int32)  # Déplacement de chaque action
+_STEP_Y = np.array([-1, 1, 0, 0, 0], dtype=np.int32)
+
+# Contenu d'une case d'équipement : 0 = rien, 1 = potion, 2 + i = arme WEAPON_TYPES[i]
+_NO_EQUIPMENT, _POTION, _FIRST_WEAPON = 0, 1, 2
+_FORCE_BONUS = np.array([0, 0] + [weapon_type.force_bonus for weapon_type in WEAPON_TYPES], dtype=np.int32)
+
+_LAYOUT_BLOCK = 4096  # Plateaux générés d'un coup pour les remplacements
+
+
+class VectorObservation(NamedTuple):
+    """Observations de toutes les parties (première dimension = numéro de la partie)"""
+    position: np.ndarray    # (N, 2) position (x, y) du héros
+    hp: np.ndarray          # (N,)
+    force: np.ndarray       # (N,)
+    in_combat: np.ndarray   # (N,) bool
+    monsters: np.ndarray    # (N, size, size) bool, indexé [partie, y, x]
+    equipments: np.ndarray  # (N, size, size) bool (potion ou arme, indiscernables sur la carte)
+
+
+def action_indexes(actions: Sequence[PlayerAction]) -> np.ndarray:
+    """Convertit une liste de PlayerAction en tableau d'indices dans ACTIONS"""
+    return np.fromiter((_ACTION_INDEX[action] for action in actions), dtype=np.intp, count=len(actions))
+
+
+class VectorGame:
+    """nb_games parties indépendantes avancées ensemble, avec remplacement automatique des parties finies"""
+
+    def __init__(self, nb_games: int, seed=None, max_steps: int = SIM_MAX_STEPS):
+        self.nb_games = nb_games
+        self.size = GRID_SIZE
+        self.max_steps = max_steps
+        self.rng = np.random.default_rng(seed)
+        nb_cells = self.size * self.size
+        self._games = np.arange(nb_games)
+        self._start_cell = START_POSITION[1] * self.size + START_POSITION[0]
+        self._end_cell = END_POSITION[1] * self.size + END_POSITION[0]
+        self.monster_hp = np.zeros((nb_games, nb_cells), dtype=np.int32)   # 0 : pas de monstre
+        self.equipments = np.zeros((nb_games, nb_cells), dtype=np.int32)   # Codes _POTION / _FIRST_WEAPON + i
+        self.cell = np.zeros(nb_games, dtype=np.int32)                     # Case du héros
+        self.hp = np.zeros(nb_games, dtype=np.int32)
+        self.max_hp = np.zeros(nb_games, dtype=np.int32)
+        self.force = np.zeros(nb_games, dtype=np.int32)
+        self.move_count = np.zeros(nb_games, dtype=np.int32)
+        self.monsters_defeated = np.zeros(nb_games, dtype=np.int32)
+        self.in_combat = np.zeros(nb_games, dtype=bool)
+        self.steps = np.zeros(nb_games, dtype=np.int32)                    # Actions de la partie en cours
+        self.score = np.zeros(nb_games, dtype=np.int32)
+        self.episode_scores = np.zeros(nb_games, dtype=np.int32)  # Score final (valable là où done)
+        self.won = np.zeros(nb_games, dtype=bool)                 # Victoire (valable là où done)
+        self._layouts = None
+        self._next_layout = 0
+
+    # --- Nouvelles parties ---
+
+    def reset(self) -> VectorObservation:
+        """Démarre une nouvelle partie partout et retourne les observations"""
+        self._reset_games(self._games)
+        return self.observe()
+
+    def _take_layouts(self, count: int) -> tuple:
+        """Prochains plateaux (générés par blocs : une génération couvre de nombreux remplacements)"""
+        if self._layouts is None or self._next_layout + count > len(self._layouts[0]):
+            layouts = generate_layouts(max(count, _LAYOUT_BLOCK, self.nb_games), self.size, self.rng)
+            size = self.size
+            monster_cells = layouts.monsters[..., 1] * size + layouts.monsters[..., 0]
+            equipment_cells = layouts.equipments[..., 1] * size + layouts.equipments[..., 0]
+            codes = np.where(layouts.is_potion, _POTION, _FIRST_WEAPON + layouts.weapon_types)
+            codes[layouts.equipments[..., 0] < 0] = _NO_EQUIPMENT  # Emplacements inutilisés
+            self._layouts = (monster_cells, np.maximum(equipment_cells, 0), codes)
+            self._next_layout = 0
+        start = self._next_layout
+        self._next_layout += count
+        return tuple(array[start:start + count] for array in self._layouts)
+
+    def _reset_games(self, games: np.ndarray) -> None:
+        """Remplace les parties indiquées par de nouvelles parties"""
+        if not games.size:
+            return
+        monster_cells, equipment_cells, codes = self._take_layouts(games.size)
+        self.monster_hp[games] = 0
+        self.equipments[games] = _NO_EQUIPMENT
+        rows = games[:, None]
+        self.monster_hp[rows, monster_cells] = MONSTER_HP
+        # Emplacement inutilisé : code 0 sur la case 0, sans effet grâce au maximum
+        np.maximum.at(self.equipments, (np.broadcast_to(rows, codes.shape), equipment_cells), codes)
+        self.cell[games] = self._start_cell
+        self.hp[games] = START_HP
+        self.max_hp[games] = START_HP
+        self.force[games] = START_FORCE
+        self.move_count[games] = 0
+        self.monsters_defeated[games] = 0
+        self.in_combat[games] = False
+        self.steps[games] = 0
+        self.score[games] = POINTS_PER_HP * START_HP
+
+    # --- Règles ---
+
+    def step(self, actions: Union[np.ndarray, Sequence[PlayerAction]]):
+        """Applique une action à chaque partie et retourne (observations, récompenses, parties finies)"""
+        if len(actions) and isinstance(actions[0], PlayerAction):
+            actions = action_indexes(actions)
+        actions = np.asarray(actions, dtype=np.intp)
+        size = self.size
+        nb_cells = size * size
+        games = self._games
+
+        # Déplacements (bornés à la grille, comme Hero.move)
+        moving = actions != ATTACK
+        x = self.cell % size
+        y = self.cell // size
+        new_x = np.clip(x + _STEP_X[actions], 0, size - 1)
+        new_y = np.clip(y + _STEP_Y[actions], 0, size - 1)
+        self.move_count += (new_x != x) | (new_y != y)
+        self.cell = new_y * size + new_x
+        self.in_combat &= ~moving  # Se déplacer (même contre un mur) quitte le combat
+        flat_cells = games * nb_cells + self.cell
+
+        # Ramassage de l'équipement de la case
+        equipments = self.equipments.reshape(-1)
+        found = np.where(moving, equipments[flat_cells], _NO_EQUIPMENT)
+        self.hp = np.where(found == _POTION, np.minimum(self.hp + POTION_HEAL, self.max_hp), self.hp)
+        self.force += _FORCE_BONUS[found]
+        equipments[flat_cells[found != _NO_EQUIPMENT]] = _NO_EQUIPMENT
+
+        # Combat : monstre de la case d'arrivée, ou ATTACK pendant un combat
+        monster_hp = self.monster_hp.reshape(-1)
+        engaged = moving & (monster_hp[flat_cells] > 0)
+        self.in_combat |= engaged
+        fighters = np.flatnonzero(engaged | ((actions == ATTACK) & self.in_combat))
+        if fighters.size:
+            dice_rolls = self.rng.integers(1, 101, size=fighters.size)
+            hit = dice_rolls >= failure_thresholds(self.force[fighters])
+            hitters = fighters[hit]
+            targets = flat_cells[hitters]
+            monster_hp[targets] -= HERO_DAMAGE
+            killers = hitters[monster_hp[targets] <= 0]
+            monster_hp[flat_cells[killers]] = 0
+            self.monsters_defeated[killers] += 1
+            self.in_combat[killers] = False
+            self.hp[fighters[~hit]] -= MONSTER_DAMAGE
+
+        # Score, récompense et fin de partie
+        alive = self.hp > 0
+        score = np.where(alive, POINTS_PER_MONSTER * self.monsters_defeated
+                         + POINTS_PER_HP * self.hp - self.move_count, 0)
+        reward = score - self.score
+        self.score = score.copy()  # Remis à jour par _reset_games, episode_scores garde le score final
+        self.steps += 1
+        self.won = alive & (self.cell == self._end_cell)
+        done = ~alive | self.won | (self.steps >= self.max_steps)
+        finished = np.flatnonzero(done)
+        self.episode_scores = score
+        self._reset_games(finished)
+        return self.observe(), reward, done
+
+    def observe(self) -> VectorObservation:
+        """Observations de toutes les parties (nouveaux tableaux)"""
+        shape = (self.nb_games, self.size, self.size)
+        return VectorObservation(
+            position=np.stack((self.cell % self.size, self.cell // self.size), axis=1),
+            hp=self.hp.copy(),
+            force=self.force.copy(),
+            in_combat=self.in_combat.copy(),
+            monsters=(self.monster_hp > 0).reshape(shape),
+            equipments=(self.equipments != _NO_EQUIPMENT).reshape(shape)
+        )
+
+
+def direct_actions(observation: VectorObservation) -> np.ndarray:
+    """Politique directe vectorisée (comme simulator.direct_policy)"""
+    x = observation.position[:, 0]
+    y = observation.position[:, 1]
+    moves = np.where(x < END_POSITION[0], _ACTION_INDEX[PlayerAction.MOVE_RIGHT],
+                     np.where(y < END_POSITION[1], _ACTION_INDEX[PlayerAction.MOVE_DOWN],
+                              _ACTION_INDEX[PlayerAction.MOVE_LEFT]))
+    return np.where(observation.in_combat, ATTACK, moves)
+
+
+if __name__ == "__main__":
+    import time
+    from engine import GameEngine
+    from simulator import SimulationStats, direct_policy, play_game
+
+    nb_games = 4096
+    game = VectorGame(nb_games, seed=0)
+    observation = game.reset()
+    rng = np.random.default_rng(1)
+
+    # Débit brut (actions au hasard, tirées à l'avance)
+    nb_steps = 1000
+    actions = rng.integers(0, len(ACTIONS), size=(nb_steps, nb_games))
+    start_time = time.perf_counter()
+    for step in range(nb_steps):
+        game.step(actions[step])
+    elapsed = time.perf_counter() - start_time
+    print(f"{nb_games} parties x {nb_steps} pas : {nb_games * nb_steps / elapsed / 1e6:.2f} millions de pas/s")
+
+    # Mêmes règles que le GameEngine : score moyen de la politique directe
+    observation = game.reset()
+    scores, wins = [], 0
+    while len(scores) < 200_000:
+        observation, reward, done = game.step(direct_actions(observation))
+        scores.extend(game.episode_scores[done].tolist())
+        wins += int(game.won[done].sum())
+    print(f"VectorGame : score moyen {np.mean(scores):.2f} | victoires {wins / len(scores):.1%}")
+    engine = GameEngine(seed=0)
+    stats = SimulationStats()
+    for index in range(50_000):
+        if index:
+            engine.reset()
+        play_game(engine, direct_policy)
+        stats.record(engine.hero.score, engine.won, engine.hero.is_dead(),
+                     engine.hero.monsters_defeated, engine.hero.move_count)
+    print(f"GameEngine : score moyen {stats.avg_score:.2f} | victoires {stats.win_rate:.1%}")